@@ -5,6 +5,8 @@ Provides a unified interface for MLX and PyTorch backends.
 """
 
 from typing import Protocol, Optional, Tuple, List
+from functools import lru_cache
+import threading
 from typing_extensions import runtime_checkable
 import numpy as np
 
@@ -116,24 +118,26 @@ class STTBackend(Protocol):
 
 # Global backend instances
 # Store backend instances per engine to support multiple engines
-_tts_backends: dict[str, TTSBackend] = {}
+_tts_backends: dict[Tuple[str, Optional[str]], TTSBackend] = {}
 _stt_backend: Optional[STTBackend] = None
 
+# Guards backend creation: startup warm-up creates the default backends on a
+# worker thread while requests may be asking for them on the event loop
+_backend_lock = threading.Lock()
 
-def get_tts_backend(engine: str = "qwen", model_type: Optional[str] = None) -> TTSBackend:
+
+@lru_cache(maxsize=16)
+def _resolve_cache_key(engine: str, model_type: Optional[str]) -> Tuple[Tuple[str, Optional[str]], str, Optional[str]]:
     """
-    Get or create TTS backend instance based on engine selection.
+    Normalize and validate a backend selection.
 
     Args:
-        engine: TTS engine to use ('qwen', 'f5', or 'e2')
+        engine: TTS engine name
         model_type: Optional model type for F5/E2 engines
-                   ('F5TTS_v1_Base' for F5, 'E2TTS_Base' for E2)
 
     Returns:
-        TTS backend instance for the selected engine
+        Tuple of (cache_key, normalized_engine, model_type)
     """
-    global _tts_backends
-
     # Normalize engine name
     engine = engine.lower()
 
@@ -148,14 +152,41 @@ def get_tts_backend(engine: str = "qwen", model_type: Optional[str] = None) -> T
         if model_type is None:
             # Default model types
             model_type = "F5TTS_v1_Base" if engine == "f5" else "E2TTS_Base"
-        cache_key = f"{engine}:{model_type}"
-    else:
-        cache_key = engine
+        return (engine, model_type), engine, model_type
+
+    return (engine, None), engine, model_type
+
+
+def get_tts_backend(engine: str = "qwen", model_type: Optional[str] = None) -> TTSBackend:
+    """
+    Get or create TTS backend instance based on engine selection.
+
+    Args:
+        engine: TTS engine to use ('qwen', 'f5', or 'e2')
+        model_type: Optional model type for F5/E2 engines
+                   ('F5TTS_v1_Base' for F5, 'E2TTS_Base' for E2)
+
+    Returns:
+        TTS backend instance for the selected engine
+    """
+    global _tts_backends
+
+    cache_key, engine, model_type = _resolve_cache_key(engine, model_type)
 
     # Return cached backend if exists
-    if cache_key in _tts_backends:
-        return _tts_backends[cache_key]
+    cached = _tts_backends.get(cache_key)
+    if cached is not None:
+        return cached
+
+    with _backend_lock:
+        cached = _tts_backends.get(cache_key)
+        if cached is None:
+            cached = _tts_backends[cache_key] = _create_tts_backend(engine, model_type)
+    return cached
+
 
+def _create_tts_backend(engine: str, model_type: Optional[str]) -> TTSBackend:
+    """Instantiate a TTS backend for a normalized engine selection."""
     # Create new backend based on engine
     if engine == "qwen":
         backend_type = get_backend_type()
@@ -176,9 +207,6 @@ def get_tts_backend(engine: str = "qwen", model_type: Optional[str] = None) -> T
         # Should never reach here due to validation above
         raise ValueError(f"Unsupported engine: {engine}")
 
-    # Cache the backend
-    _tts_backends[cache_key] = backend
-
     return backend
 
 
@@ -191,16 +219,20 @@ def get_stt_backend() -> STTBackend:
     """
     global _stt_backend
     
-    if _stt_backend is None:
-        backend_type = get_backend_type()
-        
-        if backend_type == "mlx":
-            from .mlx_backend import MLXSTTBackend
-            _stt_backend = MLXSTTBackend()
-        else:
-            from .pytorch_backend import PyTorchSTTBackend
-            _stt_backend = PyTorchSTTBackend()
-    
+    if _stt_backend is not None:
+        return _stt_backend
+
+    with _backend_lock:
+        if _stt_backend is None:
+            backend_type = get_backend_type()
+
+            if backend_type == "mlx":
+                from .mlx_backend import MLXSTTBackend
+                _stt_backend = MLXSTTBackend()
+            else:
+                from .pytorch_backend import PyTorchSTTBackend
+                _stt_backend = PyTorchSTTBackend()
+
     return _stt_backend
 
 
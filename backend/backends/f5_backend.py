@@ -4,11 +4,10 @@ F5-TTS and E2-TTS backend implementation.
 
 from typing import Optional, List, Tuple
 import asyncio
+import os
 import torch
 import numpy as np
 from pathlib import Path
-import tempfile
-import soundfile as sf
 
 from . import TTSBackend
 from ..utils.cache import get_cache_key, get_cached_voice_prompt, cache_voice_prompt
@@ -16,6 +15,38 @@ from ..utils.audio import normalize_audio, load_audio
 from ..utils.progress import get_progress_manager
 from ..utils.hf_progress import HFProgressTracker, create_hf_progress_callback
 from ..utils.tasks import get_task_manager
+from ..platform_detect import get_torch_device
+
+
+# F5-TTS sampling defaults (mirror f5_tts.api.F5TTS.infer)
+NFE_STEP = 32
+CFG_STRENGTH = 2.0
+SWAY_SAMPLING_COEF = -1.0
+TARGET_RMS = 0.1
+
+# NFE steps used for short / medium / long texts (by word count)
+NFE_STEP_SHORT = 16
+NFE_STEP_MEDIUM = 24
+
+
+def _select_nfe_step(text: str) -> int:
+    """
+    Pick the number of ODE steps for a text.
+
+    Short utterances reach the same audible quality with fewer Euler steps.
+
+    Args:
+        text: Text to synthesize
+
+    Returns:
+        NFE step count
+    """
+    words = len(text.split())
+    if words < 8:
+        return NFE_STEP_SHORT
+    if words < 20:
+        return NFE_STEP_MEDIUM
+    return NFE_STEP
 
 
 class F5TTSBackend:
@@ -30,31 +61,42 @@ class F5TTSBackend:
         """
         self.model = None
         self.model_type = model_type
-        self.device = self._get_device()
+        self.device = get_torch_device()
         self._current_model_type = None
+        self._dtype = None
+        # Sampling state (RNG) is per model instance
+        self._generate_lock = asyncio.Lock()
+        # Pinned host buffer for GPU -> CPU waveform copies (~30s at 24kHz)
+        self._pinned_out: Optional[torch.Tensor] = None
 
-    def _get_device(self) -> str:
-        """Get the best available device."""
-        if torch.cuda.is_available():
-            return "cuda"
-        # Intel Arc / Intel Xe GPU via intel-extension-for-pytorch (IPEX)
-        try:
-            import intel_extension_for_pytorch  # noqa: F401
-            if hasattr(torch, 'xpu') and torch.xpu.is_available():
-                return "xpu"
-        except ImportError:
-            pass
-        # Any GPU on Windows via DirectML (torch-directml)
-        try:
-            import torch_directml
-            if torch_directml.device_count() > 0:
-                return torch_directml.device(0)
-        except ImportError:
-            pass
-        # MPS (Apple Silicon) — kept for completeness but MLX backend is preferred
-        if hasattr(torch.backends, 'mps') and torch.backends.mps.is_available():
-            return "cpu"  # MPS disabled for stability; MLX backend handles Apple Silicon
-        return "cpu"
+    def _get_precision(self) -> Optional[torch.dtype]:
+        """
+        Get the reduced precision dtype to run the DiT in.
+
+        Controlled by the F5_PRECISION env var (bf16, fp16 or fp32). Defaults
+        to bf16 on Ampere+ CUDA GPUs and XPU, FP32 everywhere else.
+
+        Returns:
+            torch dtype, or None to run in FP32
+        """
+        if self.device not in ("cuda", "xpu"):
+            return None
+
+        precision = os.environ.get("F5_PRECISION")
+        if precision is None:
+            if self.device == "cuda" and torch.cuda.get_device_capability()[0] < 8:
+                return None
+            precision = "bf16"
+
+        return {"bf16": torch.bfloat16, "fp16": torch.float16}.get(precision.lower())
+
+    def _autocast(self):
+        """Autocast context for the configured DiT precision."""
+        return torch.autocast(
+            device_type=self.device if self.device in ("cuda", "xpu") else "cpu",
+            dtype=self._dtype or torch.bfloat16,
+            enabled=self._dtype is not None,
+        )
 
     def is_loaded(self) -> bool:
         """Check if model is loaded."""
@@ -77,35 +119,34 @@ class F5TTSBackend:
 
         return model_type
 
+    def _get_cache_marker(self, model_type: str) -> Path:
+        """
+        Get the sentinel file marking a model type as downloaded.
+
+        Args:
+            model_type: Model type
+
+        Returns:
+            Path to the sentinel file under ~/.cache/f5_tts/
+        """
+        return Path.home() / ".cache" / "f5_tts" / f"{model_type}.ok"
+
     def _is_model_cached(self, model_type: str) -> bool:
         """
         Check if the F5-TTS model is already cached locally.
 
-        Note: F5-TTS downloads models to a different cache location than HuggingFace Hub.
-        This is a best-effort check and may not be 100% accurate.
+        Note: F5-TTS downloads models to a different cache location than HuggingFace Hub,
+        so a sentinel file is written after the first successful load instead of
+        walking the cache directory.
 
         Args:
             model_type: Model type to check
 
         Returns:
-            True if model appears to be cached, False otherwise
+            True if model has been loaded before, False otherwise
         """
         try:
-            # F5-TTS downloads models to ~/.cache/f5_tts/ by default
-            # Check if model weights exist
-            cache_dir = Path.home() / ".cache" / "f5_tts"
-
-            if not cache_dir.exists():
-                return False
-
-            # Look for model-specific files
-            # F5-TTS models are typically stored with their model_type name
-            model_files = list(cache_dir.rglob("*.pt")) + list(cache_dir.rglob("*.pth"))
-
-            # If we find any model files, assume it's cached
-            # This is a conservative check; F5-TTS will handle actual validation
-            return len(model_files) > 0
-
+            return self._get_cache_marker(model_type).is_file()
         except Exception as e:
             print(f"[_is_model_cached] Error checking cache for {model_type}: {e}")
             return False
@@ -188,11 +229,43 @@ class F5TTSBackend:
                 # Exit the patch context
                 tracker_context.__exit__(None, None, None)
 
+            # Run the DiT in reduced precision (the vocoder stays FP32)
+            self._dtype = self._get_precision()
+            if self._dtype is not None and self.device == "cuda":
+                self.model.ema_model.to(dtype=self._dtype)
+            if self._dtype is not None:
+                print(f"F5-TTS DiT precision: {self._dtype}")
+
+            warmed_up = False
+
+            # Fuse the DiT kernels with torch.compile
+            if (
+                self.device in ("cuda", "xpu")
+                and os.environ.get("VOICEBOX_F5_COMPILE", "1") != "0"
+                and tuple(int(v) for v in torch.__version__.split("+")[0].split(".")[:2]) >= (2, 1)
+            ):
+                warmed_up = self._compile_dit()
+
+            # Absorb first-call costs (lazy kernel loading, allocator pool
+            # growth) at load time rather than on the first real request
+            if self.device in ("cuda", "xpu") and not warmed_up:
+                try:
+                    self._warmup_sync()
+                except Exception as e:
+                    print(f"Warning: F5-TTS warm-up failed: {e}")
+
             # Only mark download as complete if we were tracking it
             if not is_cached:
                 progress_manager.mark_complete(model_name)
                 task_manager.complete_download(model_name)
 
+                try:
+                    marker = self._get_cache_marker(model_type)
+                    marker.parent.mkdir(parents=True, exist_ok=True)
+                    marker.touch()
+                except OSError as e:
+                    print(f"Warning: Could not write F5-TTS cache marker: {e}")
+
             self._current_model_type = model_type
             self.model_type = model_type
 
@@ -216,12 +289,71 @@ class F5TTSBackend:
             task_manager.error_download(model_name, str(e))
             raise
 
+    def _compile_dit(self) -> bool:
+        """
+        Compile the DiT attention and feed-forward sub-layers with torch.compile.
+
+        The sub-layers are compiled rather than ema_model itself, since
+        F5-TTS samples through ema_model.sample() (not forward()). Falls
+        back to eager modules if the warm-up compile fails.
+
+        Returns:
+            True if the compiled model was warmed up, False if it fell back
+        """
+        compiled = []
+        for block in self.model.ema_model.transformer.transformer_blocks:
+            for kind in ("attn", "ff"):
+                module = getattr(block, kind)
+                setattr(block, kind, torch.compile(module, dynamic=True))
+                compiled.append((block, kind, module))
+
+        try:
+            print("Compiling F5-TTS DiT (first load may take a minute)...")
+            self._warmup_sync()
+            return True
+        except Exception as e:
+            print(f"Warning: torch.compile failed, running F5-TTS eagerly: {e}")
+            for block, kind, module in compiled:
+                setattr(block, kind, module)
+            return False
+
+    def _warmup_sync(self, seconds: float = 2.0, steps: int = 2):
+        """
+        Run a short dummy generation (DiT sampling + vocoder) on a silent reference.
+
+        Args:
+            seconds: Length of the dummy reference audio
+            steps: Number of ODE steps to run
+        """
+        ema_model = self.model.ema_model
+        frames = int(seconds * self.model.target_sample_rate / ema_model.mel_spec.hop_length)
+        cond = torch.zeros(1, frames, ema_model.num_channels, device=self.device)
+
+        with torch.inference_mode():
+            with self._autocast():
+                generated, _ = ema_model.sample(
+                    cond=cond,
+                    text=["Warm up."],
+                    duration=frames * 2,
+                    steps=steps,
+                    cfg_strength=CFG_STRENGTH,
+                    sway_sampling_coef=SWAY_SAMPLING_COEF,
+                )
+            generated = generated.to(torch.float32)[:, frames:, :].permute(0, 2, 1)
+
+            if self.model.mel_spec_type == "bigvgan":
+                self.model.vocoder(generated)
+            else:
+                self.model.vocoder.decode(generated)
+
     def unload_model(self):
         """Unload the model to free memory."""
         if self.model is not None:
             del self.model
             self.model = None
             self._current_model_type = None
+            self._dtype = None
+            self._pinned_out = None
 
             if torch.cuda.is_available():
                 torch.cuda.empty_cache()
@@ -237,8 +369,8 @@ class F5TTSBackend:
         """
         Create voice prompt from reference audio.
 
-        For F5-TTS, the voice prompt is simply the audio path and reference text,
-        as F5-TTS handles embedding extraction internally during inference.
+        For F5-TTS, the voice prompt holds the audio path and reference text,
+        plus the precomputed reference mel-spectrogram when it can be built.
 
         Args:
             audio_path: Path to reference audio file
@@ -258,14 +390,19 @@ class F5TTSBackend:
                 if isinstance(cached_prompt, dict):
                     return cached_prompt, True
 
-        # F5-TTS doesn't require pre-processing the voice prompt
-        # It uses the audio file directly during inference
-        # Store the paths for later use
         voice_prompt = {
             "audio_path": str(audio_path),
             "reference_text": reference_text,
         }
 
+        # Precompute the reference mel once so generate() can skip F5-TTS's
+        # per-call load/resample/STFT of the reference audio
+        reference = await asyncio.to_thread(
+            self._precompute_reference_sync, str(audio_path), reference_text
+        )
+        if reference is not None:
+            voice_prompt.update(reference)
+
         # Cache the prompt
         if use_cache:
             cache_key = get_cache_key(audio_path, reference_text)
@@ -273,6 +410,151 @@ class F5TTSBackend:
 
         return voice_prompt, False
 
+    def _precompute_reference_sync(self, audio_path: str, reference_text: str) -> Optional[dict]:
+        """
+        Compute the reference mel-spectrogram that F5-TTS conditions on.
+
+        Replicates the preprocessing done inside F5TTS.infer (clip, mono,
+        RMS normalization, resample to 24kHz, mel transform) so it only
+        runs once per voice prompt.
+
+        Args:
+            audio_path: Path to reference audio file
+            reference_text: Transcript of reference audio
+
+        Returns:
+            Dict with ref_mel, ref_text, ref_text_tokens, ref_rms and
+            max_chars, or None if the reference could not be preprocessed
+            (generation then falls back to F5TTS.infer)
+        """
+        try:
+            import torchaudio
+            from f5_tts.infer.utils_infer import preprocess_ref_audio_text
+            from f5_tts.model.utils import convert_char_to_pinyin
+
+            ref_file, ref_text = preprocess_ref_audio_text(audio_path, reference_text, show_info=lambda *a: None)
+
+            audio, sr = torchaudio.load(ref_file)
+            if audio.shape[0] > 1:
+                audio = torch.mean(audio, dim=0, keepdim=True)
+
+            ref_rms = torch.sqrt(torch.mean(torch.square(audio))).item()
+            if ref_rms < TARGET_RMS:
+                audio = audio * TARGET_RMS / ref_rms
+
+            target_sample_rate = self.model.target_sample_rate
+            if sr != target_sample_rate:
+                audio = torchaudio.transforms.Resample(sr, target_sample_rate)(audio)
+
+            with torch.inference_mode():
+                ref_mel = self.model.ema_model.mel_spec(audio.to(self.device))
+                ref_mel = ref_mel.permute(0, 2, 1)
+
+            # Same batch size limit F5TTS.infer uses to chunk long texts
+            ref_seconds = audio.shape[-1] / target_sample_rate
+            max_chars = int(len(ref_text.encode("utf-8")) / ref_seconds * (22 - ref_seconds))
+
+            return {
+                "ref_mel": ref_mel.cpu().contiguous(),
+                "ref_text": ref_text,
+                # Tokenized reference prefix, reused across generations
+                "ref_text_tokens": convert_char_to_pinyin([ref_text])[0],
+                "ref_rms": ref_rms,
+                "max_chars": max_chars,
+            }
+        except Exception as e:
+            print(f"Warning: Could not precompute F5-TTS reference mel, falling back to per-call preprocessing: {e}")
+            return None
+
+    def _sample_from_reference_sync(
+        self,
+        voice_prompt: dict,
+        text: str,
+        nfe_step: int = NFE_STEP,
+    ) -> Tuple[np.ndarray, int]:
+        """
+        Generate audio directly from a cached reference mel.
+
+        Same sampling path as F5TTS.infer, minus the reference preprocessing.
+
+        Args:
+            voice_prompt: Voice prompt containing a precomputed ref_mel
+            text: Text to synthesize
+            nfe_step: Number of ODE steps
+
+        Returns:
+            Tuple of (audio_array, sample_rate)
+        """
+        from f5_tts.model.utils import convert_char_to_pinyin
+
+        ref_mel = voice_prompt["ref_mel"].to(self.device, non_blocking=True)
+        ref_text = voice_prompt["ref_text"]
+        ref_rms = voice_prompt["ref_rms"]
+
+        ref_audio_len = ref_mel.shape[1]
+        ref_text_len = len(ref_text.encode("utf-8"))
+        gen_text_len = len(text.encode("utf-8"))
+        duration = ref_audio_len + int(ref_audio_len / ref_text_len * gen_text_len)
+
+        # Only the generated text needs tokenizing when the reference prefix is cached
+        ref_text_tokens = voice_prompt.get("ref_text_tokens")
+        if ref_text_tokens is not None:
+            final_text_list = [list(ref_text_tokens) + convert_char_to_pinyin([text])[0]]
+        else:
+            final_text_list = convert_char_to_pinyin([ref_text + text])
+
+        with torch.inference_mode():
+            with self._autocast():
+                generated, _ = self.model.ema_model.sample(
+                    cond=ref_mel,
+                    text=final_text_list,
+                    duration=duration,
+                    steps=nfe_step,
+                    cfg_strength=CFG_STRENGTH,
+                    sway_sampling_coef=SWAY_SAMPLING_COEF,
+                )
+            generated = generated.to(torch.float32)
+            generated = generated[:, ref_audio_len:, :].permute(0, 2, 1)
+
+            if self.model.mel_spec_type == "bigvgan":
+                wav = self.model.vocoder(generated)
+            else:
+                wav = self.model.vocoder.decode(generated)
+
+            if ref_rms < TARGET_RMS:
+                wav = wav * ref_rms / TARGET_RMS
+
+        audio = self._to_numpy(wav.squeeze())
+        return audio, self.model.target_sample_rate
+
+    def _to_numpy(self, wav: torch.Tensor) -> np.ndarray:
+        """
+        Copy a waveform tensor to a float32 numpy array.
+
+        CUDA tensors are copied through a reusable pinned host buffer so the
+        transfer takes the asynchronous DMA path.
+
+        Args:
+            wav: 1-D waveform tensor
+
+        Returns:
+            Contiguous float32 array owned by the caller
+        """
+        if not wav.is_cuda:
+            # Only copies if the tensor is not already float32
+            return np.ascontiguousarray(wav.cpu().numpy(), dtype=np.float32)
+
+        n = wav.numel()
+        if self._pinned_out is None or self._pinned_out.numel() < n:
+            self._pinned_out = torch.empty(max(n, 30 * 24000), dtype=torch.float32, pin_memory=True)
+
+        out = self._pinned_out[:n]
+        out.copy_(wav.reshape(-1), non_blocking=True)
+        torch.cuda.current_stream(wav.device).synchronize()
+
+        # Copy out of the shared buffer so the next generation can't overwrite it
+        return out.numpy().copy()
+
     async def combine_voice_prompts(
         self,
         audio_paths: List[str],
@@ -291,16 +573,25 @@ class F5TTSBackend:
         Returns:
             Tuple of (combined_audio, combined_text)
         """
-        combined_audio = []
+        # Load clips concurrently, bounded to avoid opening too many files at once
+        semaphore = asyncio.Semaphore(8)
+
+        async def _load(audio_path: str) -> np.ndarray:
+            async with semaphore:
+                audio, _ = await asyncio.to_thread(load_audio, audio_path)
+                return audio
 
-        for audio_path in audio_paths:
-            audio, sr = load_audio(audio_path)
-            audio = normalize_audio(audio)
-            combined_audio.append(audio)
+        clips = await asyncio.gather(*[_load(audio_path) for audio_path in audio_paths])
 
-        # Concatenate audio
-        mixed = np.concatenate(combined_audio)
-        mixed = normalize_audio(mixed)
+        # Copy clips into a single preallocated buffer
+        mixed = np.empty(sum(len(clip) for clip in clips), dtype=np.float32)
+        offset = 0
+        for clip in clips:
+            mixed[offset:offset + len(clip)] = clip
+            offset += len(clip)
+
+        # Normalize once over the combined audio, in place
+        mixed = normalize_audio(mixed, copy=False)
 
         # Combine texts
         combined_text = " ".join(reference_texts)
@@ -314,6 +605,7 @@ class F5TTSBackend:
         language: str = "en",
         seed: Optional[int] = None,
         instruct: Optional[str] = None,
+        nfe_step: Optional[int] = None,
     ) -> Tuple[np.ndarray, int]:
         """
         Generate audio from text using voice prompt.
@@ -324,6 +616,7 @@ class F5TTSBackend:
             language: Language code (not used by F5-TTS, kept for compatibility)
             seed: Random seed for reproducibility
             instruct: Not supported by F5-TTS (ignored)
+            nfe_step: Number of ODE steps (default: chosen from text length)
 
         Returns:
             Tuple of (audio_array, sample_rate)
@@ -335,16 +628,11 @@ class F5TTSBackend:
         if instruct is not None:
             print(f"Warning: F5-TTS does not support 'instruct' parameter. Ignoring value: {instruct}")
 
+        if nfe_step is None:
+            nfe_step = _select_nfe_step(text)
+
         def _generate_sync():
             """Run synchronous generation in thread pool."""
-            # Set seed if provided
-            if seed is not None:
-                torch.manual_seed(seed)
-                if torch.cuda.is_available():
-                    torch.cuda.manual_seed(seed)
-                # Also set numpy seed for F5-TTS
-                np.random.seed(seed)
-
             # Get reference audio path and text from voice prompt
             ref_audio_path = voice_prompt.get("audio_path")
             ref_text = voice_prompt.get("reference_text", "")
@@ -352,42 +640,39 @@ class F5TTSBackend:
             if ref_audio_path is None:
                 raise ValueError("Voice prompt must contain 'audio_path' field")
 
-            # Create a temporary file for output
-            with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tmp_file:
-                output_path = tmp_file.name
-
-            try:
-                # Generate audio using F5-TTS
-                # If ref_text is empty, F5-TTS will use ASR (higher memory cost)
+            # Fast path: reuse the cached reference mel when the text fits in
+            # a single F5-TTS batch (longer texts need infer()'s chunking)
+            if (
+                voice_prompt.get("ref_mel") is not None
+                and len(text.encode("utf-8")) <= voice_prompt.get("max_chars", 0)
+            ):
+                # Seeds the CPU and all CUDA generators in one call
+                if seed is not None:
+                    torch.manual_seed(seed)
+                return self._sample_from_reference_sync(voice_prompt, text, nfe_step)
+
+            # Generate audio using F5-TTS (infer() seeds torch/numpy itself)
+            # If ref_text is empty, F5-TTS will use ASR (higher memory cost)
+            with torch.inference_mode(), self._autocast():
                 wav, sample_rate, _ = self.model.infer(
                     ref_file=ref_audio_path,
                     ref_text=ref_text,
                     gen_text=text,
-                    file_wave=output_path,
+                    file_wave=None,
+                    nfe_step=nfe_step,
                     seed=seed if seed is not None else -1,
                 )
 
-                # Load the generated audio
-                audio, sr = sf.read(output_path)
+            # Use the returned waveform directly instead of a WAV round-trip
+            if isinstance(wav, torch.Tensor):
+                audio = self._to_numpy(wav.detach())
+            else:
+                audio = np.ascontiguousarray(wav, dtype=np.float32)
 
-                # Convert to numpy array if needed
-                if not isinstance(audio, np.ndarray):
-                    audio = np.array(audio)
-
-                # Ensure it's float32
-                if audio.dtype != np.float32:
-                    audio = audio.astype(np.float32)
-
-                return audio, sr
-
-            finally:
-                # Clean up temporary file
-                try:
-                    Path(output_path).unlink(missing_ok=True)
-                except Exception as e:
-                    print(f"Warning: Could not delete temporary file {output_path}: {e}")
+            return audio, sample_rate
 
         # Run blocking inference in thread pool to avoid blocking event loop
-        audio, sample_rate = await asyncio.to_thread(_generate_sync)
+        async with self._generate_lock:
+            audio, sample_rate = await asyncio.to_thread(_generate_sync)
 
         return audio, sample_rate
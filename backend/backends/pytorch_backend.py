@@ -2,18 +2,187 @@
 PyTorch backend implementation for TTS and STT.
 """
 
-from typing import Optional, List, Tuple
+from typing import Optional, List, Tuple, Dict, Union, Callable, Awaitable
 import asyncio
+import contextlib
+import functools
+import importlib.util
+import os
 import torch
 import numpy as np
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from huggingface_hub import constants as hf_constants, snapshot_download
 
 from . import TTSBackend, STTBackend
 from ..utils.cache import get_cache_key, get_cached_voice_prompt, cache_voice_prompt
 from ..utils.audio import normalize_audio, load_audio
 from ..utils.progress import get_progress_manager
-from ..utils.hf_progress import HFProgressTracker, create_hf_progress_callback
+from ..utils.hf_progress import create_hf_progress_callback, create_hf_tqdm_class
 from ..utils.tasks import get_task_manager
+from ..utils.hf_cache import is_repo_cached
+from ..platform_detect import get_torch_device
+from ..utils.quantization import quantize_linear_int8, quantize_linear_float8, supports_float8
+
+
+# Faster cold-start downloads: multi-connection hf_transfer when installed, and
+# smaller chunks so download progress reaches the SSE endpoint more often
+hf_constants.DOWNLOAD_CHUNK_SIZE = 256 * 1024
+if importlib.util.find_spec("hf_transfer") is not None and os.environ.get("HF_HUB_ENABLE_HF_TRANSFER") != "0":
+    os.environ["HF_HUB_ENABLE_HF_TRANSFER"] = "1"
+    hf_constants.HF_HUB_ENABLE_HF_TRANSFER = True
+
+# Whisper's fixed input window (30s at 16 kHz)
+WHISPER_WINDOW_SAMPLES = 30 * 16000
+
+# Dedicated single-thread executors for model calls: keeps framework work off
+# the default pool shared by every asyncio.to_thread in the app, and lets TTS
+# and STT run side by side without serializing against each other
+_TTS_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="torch-tts")
+_STT_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="torch-stt")
+
+
+async def _run_on(executor: ThreadPoolExecutor, fn, *args):
+    """Run a blocking function on a dedicated executor."""
+    return await asyncio.get_running_loop().run_in_executor(executor, functools.partial(fn, *args))
+
+
+# Allow TF32 for any remaining FP32 matmuls on Ampere+ GPUs
+if torch.cuda.is_available():
+    torch.set_float32_matmul_precision("high")
+
+
+def _is_compile_error(error: Exception) -> bool:
+    """Check whether an exception came from torch.compile (dynamo/inductor)."""
+    from torch._dynamo.exc import TorchDynamoException
+
+    return isinstance(error, TorchDynamoException)
+
+
+def _quantize_linears(model: torch.nn.Module, label: str, allow_int8: bool = False):
+    """
+    Apply the quantization selected by environment variables.
+
+    VOICEBOX_FP8=1 quantizes weights and activations to FP8 on Ada/Hopper
+    GPUs (requires torchao); VOICEBOX_TTS_INT8=1 applies INT8 weight-only
+    quantization where allowed.
+
+    Args:
+        model: Model to quantize in place
+        label: Model name used in log messages
+        allow_int8: Whether INT8 weight-only quantization may be applied
+    """
+    if os.environ.get("VOICEBOX_FP8", "0") == "1" and supports_float8():
+        try:
+            count = quantize_linear_float8(model)
+            print(f"Quantized {count} {label} linear layers to FP8")
+            return
+        except ImportError:
+            print("Warning: FP8 quantization requires torchao (pip install torchao)")
+
+    if allow_int8 and os.environ.get("VOICEBOX_TTS_INT8", "0") == "1":
+        count = quantize_linear_int8(model)
+        print(f"Quantized {count} {label} linear layers to INT8")
+
+
+class _BatchScheduler:
+    """
+    Coalesces concurrent TTS requests into batched generation calls.
+
+    Requests that share a voice prompt and instruction are synthesized
+    together in a single batch. The batching window only opens when more
+    than one request is queued, so a lone request runs immediately.
+    """
+
+    def __init__(
+        self,
+        run_batch: Callable[[List[str], dict, Optional[str]], Awaitable[Tuple[List[np.ndarray], int]]],
+        window_s: float,
+        max_batch_size: int = 8,
+    ):
+        self._run_batch = run_batch
+        self._window_s = window_s
+        self._max_batch_size = max_batch_size
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+
+    async def submit(
+        self,
+        text: str,
+        voice_prompt: dict,
+        instruct: Optional[str] = None,
+    ) -> Tuple[np.ndarray, int]:
+        """
+        Queue a request and wait for its batch to finish.
+
+        Args:
+            text: Text to synthesize
+            voice_prompt: Voice prompt dictionary
+            instruct: Natural language instruction for speech delivery control
+
+        Returns:
+            Tuple of (audio_array, sample_rate)
+        """
+        loop = asyncio.get_running_loop()
+        if self._worker is None or self._worker.done() or self._worker.get_loop() is not loop:
+            self._queue = asyncio.Queue()
+            self._worker = loop.create_task(self._drain())
+
+        future = loop.create_future()
+        await self._queue.put((text, voice_prompt, instruct, future))
+        return await future
+
+    def close(self):
+        """Stop the drain task; queued and in-flight requests are cancelled."""
+        worker, self._worker = self._worker, None
+        if worker is None or worker.done():
+            return
+        try:
+            # unload_model may run off the event loop thread
+            worker.get_loop().call_soon_threadsafe(worker.cancel)
+        except RuntimeError:
+            pass  # Event loop already closed
+
+    async def _drain(self):
+        """Collect requests for one window at a time and run them in groups."""
+        pending = []
+        try:
+            while True:
+                pending = [await self._queue.get()]
+                # Only wait for more requests when others are already queued
+                if not self._queue.empty():
+                    await asyncio.sleep(self._window_s)
+                while not self._queue.empty():
+                    pending.append(self._queue.get_nowait())
+
+                groups = {}
+                for item in pending:
+                    groups.setdefault((id(item[1]), item[2]), []).append(item)
+
+                for group in groups.values():
+                    for start in range(0, len(group), self._max_batch_size):
+                        await self._run_group(group[start:start + self._max_batch_size])
+        except asyncio.CancelledError:
+            while not self._queue.empty():
+                pending.append(self._queue.get_nowait())
+            for *_, future in pending:
+                future.cancel()
+            raise
+
+    async def _run_group(self, group: list):
+        """Run one batch and resolve each request's future."""
+        _, voice_prompt, instruct, _ = group[0]
+        try:
+            wavs, sample_rate = await self._run_batch([item[0] for item in group], voice_prompt, instruct)
+        except Exception as e:
+            for *_, future in group:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (*_, future), wav in zip(group, wavs):
+            if not future.done():
+                future.set_result((wav, sample_rate))
 
 
 class PyTorchTTSBackend:
@@ -24,29 +193,14 @@ class PyTorchTTSBackend:
         self.model_size = model_size
         self.device = self._get_device()
         self._current_model_size = None
+        self._eager_forward = None
+        # Unseeded requests arriving within this window are batched together
+        window_ms = float(os.environ.get("VOICEBOX_TTS_BATCH_WINDOW_MS", "15"))
+        self._scheduler = _BatchScheduler(self._generate_batch, window_ms / 1000) if window_ms > 0 else None
     
     def _get_device(self) -> str:
         """Get the best available device."""
-        if torch.cuda.is_available():
-            return "cuda"
-        # Intel Arc / Intel Xe GPU via intel-extension-for-pytorch (IPEX)
-        try:
-            import intel_extension_for_pytorch  # noqa: F401
-            if hasattr(torch, 'xpu') and torch.xpu.is_available():
-                return "xpu"
-        except ImportError:
-            pass
-        # Any GPU on Windows via DirectML (torch-directml)
-        try:
-            import torch_directml
-            if torch_directml.device_count() > 0:
-                return torch_directml.device(0)
-        except ImportError:
-            pass
-        # MPS (Apple Silicon) — kept for completeness but MLX backend is preferred
-        if hasattr(torch.backends, 'mps') and torch.backends.mps.is_available():
-            return "cpu"  # MPS disabled for stability; MLX backend handles Apple Silicon
-        return "cpu"
+        return get_torch_device()
     
     def is_loaded(self) -> bool:
         """Check if model is loaded."""
@@ -83,31 +237,7 @@ class PyTorchTTSBackend:
             True if model is fully cached, False if missing or incomplete
         """
         try:
-            from huggingface_hub import constants as hf_constants
-            model_path = self._get_model_path(model_size)
-            repo_cache = Path(hf_constants.HF_HUB_CACHE) / ("models--" + model_path.replace("/", "--"))
-            
-            if not repo_cache.exists():
-                return False
-            
-            # Check for .incomplete files - if any exist, download is still in progress
-            blobs_dir = repo_cache / "blobs"
-            if blobs_dir.exists() and any(blobs_dir.glob("*.incomplete")):
-                print(f"[_is_model_cached] Found .incomplete files for {model_size}, treating as not cached")
-                return False
-            
-            # Check that actual model weight files exist in snapshots
-            snapshots_dir = repo_cache / "snapshots"
-            if snapshots_dir.exists():
-                has_weights = (
-                    any(snapshots_dir.rglob("*.safetensors")) or
-                    any(snapshots_dir.rglob("*.bin"))
-                )
-                if not has_weights:
-                    print(f"[_is_model_cached] No model weights found for {model_size}, treating as not cached")
-                    return False
-            
-            return True
+            return is_repo_cached(self._get_model_path(model_size), model_size)
         except Exception as e:
             print(f"[_is_model_cached] Error checking cache for {model_size}: {e}")
             return False
@@ -126,12 +256,13 @@ class PyTorchTTSBackend:
         if self.model is not None and self._current_model_size == model_size:
             return
         
-        # Unload existing model if different size requested
+        # Unload existing model if different size requested; the freed blocks
+        # stay in the allocator cache for the next from_pretrained to reuse
         if self.model is not None and self._current_model_size != model_size:
-            self.unload_model()
+            self.unload_model(release_memory=False)
         
         # Run blocking load in thread pool
-        await asyncio.to_thread(self._load_model_sync, model_size)
+        await _run_on(_TTS_EXECUTOR, self._load_model_sync, model_size)
     
     # Alias for compatibility
     load_model = load_model_async
@@ -146,16 +277,6 @@ class PyTorchTTSBackend:
             # Check if model is already cached
             is_cached = self._is_model_cached(model_size)
 
-            # Set up progress callback and tracker
-            # If cached: filter out non-download progress (like "Segment 1/1" during generation)
-            # If not cached: report all progress (we're actually downloading)
-            progress_callback = create_hf_progress_callback(model_name, progress_manager)
-            tracker = HFProgressTracker(progress_callback, filter_non_downloads=is_cached)
-
-            # Patch tqdm BEFORE importing qwen_tts
-            tracker_context = tracker.patch_download()
-            tracker_context.__enter__()
-
             # Import qwen_tts
             from qwen_tts import Qwen3TTSModel
 
@@ -178,26 +299,28 @@ class PyTorchTTSBackend:
                     status="downloading",
                 )
 
-            # Load the model (tqdm is patched, but filters out non-download progress)
-            try:
-                # Don't pass device_map on CPU: accelerate's meta-tensor mechanism
-                # causes "Cannot copy out of meta tensor" when moving to CPU.
-                # Instead load directly then call .to(device) if needed.
-                if self.device == "cpu":
-                    self.model = Qwen3TTSModel.from_pretrained(
-                        model_path,
-                        torch_dtype=torch.float32,
-                        low_cpu_mem_usage=False,
-                    )
-                else:
-                    self.model = Qwen3TTSModel.from_pretrained(
-                        model_path,
-                        device_map=self.device,
-                        torch_dtype=torch.bfloat16,
-                    )
-            finally:
-                # Exit the patch context
-                tracker_context.__exit__(None, None, None)
+            if not is_cached:
+                # Fetch all files in parallel before from_pretrained resolves them,
+                # reporting progress through snapshot_download's tqdm_class hook
+                progress_callback = create_hf_progress_callback(model_name, progress_manager)
+                snapshot_download(
+                    model_path,
+                    max_workers=8,
+                    tqdm_class=create_hf_tqdm_class(progress_callback),
+                )
+
+            # Load the model from the local cache
+            # Don't pass device_map on CPU: accelerate's meta-tensor mechanism
+            # causes "Cannot copy out of meta tensor" when moving to CPU.
+            # Instead load directly then call .to(device) if needed.
+            if self.device == "cpu":
+                self.model = self._load_cpu_model(Qwen3TTSModel, model_path)
+            else:
+                self.model = Qwen3TTSModel.from_pretrained(
+                    model_path,
+                    device_map=self.device,
+                    torch_dtype=torch.bfloat16,
+                )
             
             # Only mark download as complete if we were tracking it
             if not is_cached:
@@ -206,6 +329,19 @@ class PyTorchTTSBackend:
             
             self._current_model_size = model_size
             self.model_size = model_size
+
+            # Optional FP8 / INT8 quantization (cuts decoder weight bandwidth)
+            inner = getattr(self.model, "model", None)
+            if isinstance(inner, torch.nn.Module):
+                _quantize_linears(inner, "TTS", allow_int8=True)
+
+            # Fuse the decoder kernels with torch.compile
+            if (
+                self.device in ("cuda", "xpu")
+                and os.environ.get("VOICEBOX_TTS_COMPILE", "1") != "0"
+                and hasattr(torch, "compile")
+            ):
+                self._compile_decoder()
             
             print(f"TTS model {model_size} loaded successfully")
             
@@ -227,17 +363,89 @@ class PyTorchTTSBackend:
             task_manager.error_download(model_name, str(e))
             raise
     
-    def unload_model(self):
-        """Unload the model to free memory."""
+    def _load_cpu_model(self, model_cls, model_path: str):
+        """
+        Load the model on CPU, streaming weights straight into place.
+
+        low_cpu_mem_usage=True skips the random init and the second full copy
+        of the weights. If that leaves any parameter on the meta device (or
+        fails outright), fall back to a regular load.
+
+        Args:
+            model_cls: Qwen3TTSModel class
+            model_path: HuggingFace Hub model ID
+
+        Returns:
+            Loaded model
+        """
+        try:
+            model = model_cls.from_pretrained(
+                model_path,
+                torch_dtype=torch.float32,
+                low_cpu_mem_usage=True,
+            )
+            inner = getattr(model, "model", model)
+            if not any(p.is_meta for p in inner.parameters()):
+                return model
+            print("Warning: low_cpu_mem_usage load left meta tensors, reloading")
+        except (RuntimeError, NotImplementedError, ValueError) as e:
+            print(f"Warning: low_cpu_mem_usage load failed, reloading: {e}")
+
+        return model_cls.from_pretrained(
+            model_path,
+            torch_dtype=torch.float32,
+            low_cpu_mem_usage=False,
+        )
+
+    def _compile_decoder(self):
+        """
+        Compile the autoregressive talker decoder with torch.compile.
+
+        Compilation happens lazily on the first generation; if it fails
+        there, generate() restores the eager forward and retries.
+        """
+        inner = getattr(self.model, "model", None)
+        decoder = getattr(inner, "talker", inner)
+        if not isinstance(decoder, torch.nn.Module):
+            return
+
+        decoder.eval()
+        self._eager_forward = (decoder, decoder.forward)
+        decoder.forward = torch.compile(decoder.forward, dynamic=True)
+        print("Compiling TTS decoder with torch.compile (first generation will be slower)")
+
+    def _restore_eager(self):
+        """Undo _compile_decoder."""
+        if self._eager_forward is not None:
+            decoder, forward = self._eager_forward
+            decoder.forward = forward
+            self._eager_forward = None
+
+    def unload_model(self, release_memory: bool = True):
+        """
+        Unload the model to free memory.
+
+        Args:
+            release_memory: Return cached CUDA blocks to the driver. Skipped
+                when switching model sizes, since the next load reuses them.
+        """
         if self.model is not None:
             del self.model
             self.model = None
             self._current_model_size = None
+            self._eager_forward = None
             
             if torch.cuda.is_available():
-                torch.cuda.empty_cache()
+                if release_memory:
+                    torch.cuda.empty_cache()
+                else:
+                    torch.cuda.reset_peak_memory_stats()
             
             print("TTS model unloaded")
+        
+        # Size switches keep the scheduler; it is recreated on the next request
+        if release_memory and self._scheduler is not None:
+            self._scheduler.close()
     
     async def create_voice_prompt(
         self,
@@ -261,13 +469,13 @@ class PyTorchTTSBackend:
         # Check cache if enabled
         if use_cache:
             cache_key = get_cache_key(audio_path, reference_text)
-            cached_prompt = get_cached_voice_prompt(cache_key)
+            # Load cached tensors straight onto the GPU (DirectML devices go via CPU)
+            device = self.device if self.device in ("cuda", "xpu") else None
+            cached_prompt = get_cached_voice_prompt(cache_key, device=device)
             if cached_prompt is not None:
-                # Cache stores as torch.Tensor but actual prompt is dict
-                # Convert if needed
-                if isinstance(cached_prompt, dict):
-                    # For PyTorch backend, the dict should contain tensors, not file paths
-                    # So we can safely return it
+                # create_voice_clone_prompt returns a list of prompt items;
+                # older caches may hold a dict
+                if isinstance(cached_prompt, (list, dict)):
                     return cached_prompt, True
                 elif isinstance(cached_prompt, torch.Tensor):
                     # Legacy cache format - convert to dict
@@ -283,7 +491,7 @@ class PyTorchTTSBackend:
             )
         
         # Run blocking operation in thread pool
-        voice_prompt_items = await asyncio.to_thread(_create_prompt_sync)
+        voice_prompt_items = await _run_on(_TTS_EXECUTOR, _create_prompt_sync)
         
         # Cache if enabled
         if use_cache:
@@ -307,16 +515,17 @@ class PyTorchTTSBackend:
         Returns:
             Tuple of (combined_audio, combined_text)
         """
-        combined_audio = []
+        clips = [load_audio(audio_path)[0] for audio_path in audio_paths]
         
-        for audio_path in audio_paths:
-            audio, sr = load_audio(audio_path)
-            audio = normalize_audio(audio)
-            combined_audio.append(audio)
+        # Copy clips into a single preallocated buffer
+        mixed = np.empty(sum(len(clip) for clip in clips), dtype=np.float32)
+        offset = 0
+        for clip in clips:
+            mixed[offset:offset + len(clip)] = clip
+            offset += len(clip)
         
-        # Concatenate audio
-        mixed = np.concatenate(combined_audio)
-        mixed = normalize_audio(mixed)
+        # Normalize once over the combined audio, in place
+        mixed = normalize_audio(mixed, copy=False)
         
         # Combine texts
         combined_text = " ".join(reference_texts)
@@ -347,26 +556,62 @@ class PyTorchTTSBackend:
         # Load model
         await self.load_model_async(None)
 
-        def _generate_sync():
-            """Run synchronous generation in thread pool."""
-            # Set seed if provided
-            if seed is not None:
-                torch.manual_seed(seed)
-                if torch.cuda.is_available():
-                    torch.cuda.manual_seed(seed)
-
-            # Generate audio - this is the blocking operation
-            wavs, sample_rate = self.model.generate_voice_clone(
-                text=text,
-                voice_clone_prompt=voice_prompt,
-                instruct=instruct,
-            )
-            return wavs[0], sample_rate
+        # Seeded requests run alone so their output stays reproducible
+        if seed is None and self._scheduler is not None:
+            return await self._scheduler.submit(text, voice_prompt, instruct)
+
+        wavs, sample_rate = await _run_on(
+            _TTS_EXECUTOR, self._generate_sync, text, voice_prompt, instruct, seed,
+        )
+        return wavs[0], sample_rate
 
-        # Run blocking inference in thread pool to avoid blocking event loop
-        audio, sample_rate = await asyncio.to_thread(_generate_sync)
+    async def _generate_batch(
+        self,
+        texts: List[str],
+        voice_prompt: dict,
+        instruct: Optional[str],
+    ) -> Tuple[List[np.ndarray], int]:
+        """Generate a batch of texts with one voice prompt (used by _BatchScheduler)."""
+        text = texts if len(texts) > 1 else texts[0]
+        return await _run_on(_TTS_EXECUTOR, self._generate_sync, text, voice_prompt, instruct, None)
+
+    def _generate_sync(
+        self,
+        text: Union[str, List[str]],
+        voice_prompt: dict,
+        instruct: Optional[str],
+        seed: Optional[int],
+    ) -> Tuple[List[np.ndarray], int]:
+        """Run synchronous generation in the TTS executor."""
+        def _run():
+            # Seed inside a forked RNG so the global state is left untouched
+            rng = contextlib.nullcontext()
+            if seed is not None:
+                devices = [torch.cuda.current_device()] if self.device == "cuda" else []
+                rng = torch.random.fork_rng(devices=devices)
+
+            with rng:
+                if seed is not None:
+                    torch.manual_seed(seed)
+
+                # Generate audio - this is the blocking operation
+                with torch.inference_mode():
+                    return self.model.generate_voice_clone(
+                        text=text,
+                        voice_clone_prompt=voice_prompt,
+                        instruct=instruct,
+                    )
 
-        return audio, sample_rate
+        try:
+            return _run()
+        except Exception as e:
+            # Only compiler failures fall back; OOMs and bad inputs would fail
+            # eagerly too and must not disable the compiled decoder
+            if self._eager_forward is None or not _is_compile_error(e):
+                raise
+            print(f"Warning: torch.compile failed, running TTS decoder eagerly: {e}")
+            self._restore_eager()
+            return _run()
 
 
 class PyTorchSTTBackend:
@@ -375,30 +620,17 @@ class PyTorchSTTBackend:
     def __init__(self, model_size: str = "base"):
         self.model = None
         self.processor = None
+        self._pipe = None
+        self._encoder_graph = None
+        self._encoder_in = None
+        self._encoder_out = None
+        self._generate_kwargs_cache: Dict[Optional[str], dict] = {}
         self.model_size = model_size
         self.device = self._get_device()
     
     def _get_device(self) -> str:
         """Get the best available device."""
-        if torch.cuda.is_available():
-            return "cuda"
-        # Intel Arc / Intel Xe GPU via intel-extension-for-pytorch (IPEX)
-        try:
-            import intel_extension_for_pytorch  # noqa: F401
-            if hasattr(torch, 'xpu') and torch.xpu.is_available():
-                return "xpu"
-        except ImportError:
-            pass
-        # Any GPU on Windows via DirectML (torch-directml)
-        try:
-            import torch_directml
-            if torch_directml.device_count() > 0:
-                return torch_directml.device(0)
-        except ImportError:
-            pass
-        if hasattr(torch.backends, 'mps') and torch.backends.mps.is_available():
-            return "cpu"  # MPS disabled for stability
-        return "cpu"
+        return get_torch_device()
     
     def is_loaded(self) -> bool:
         """Check if model is loaded."""
@@ -415,31 +647,7 @@ class PyTorchSTTBackend:
             True if model is fully cached, False if missing or incomplete
         """
         try:
-            from huggingface_hub import constants as hf_constants
-            model_name = f"openai/whisper-{model_size}"
-            repo_cache = Path(hf_constants.HF_HUB_CACHE) / ("models--" + model_name.replace("/", "--"))
-            
-            if not repo_cache.exists():
-                return False
-            
-            # Check for .incomplete files - if any exist, download is still in progress
-            blobs_dir = repo_cache / "blobs"
-            if blobs_dir.exists() and any(blobs_dir.glob("*.incomplete")):
-                print(f"[_is_model_cached] Found .incomplete files for whisper-{model_size}, treating as not cached")
-                return False
-            
-            # Check that actual model weight files exist in snapshots
-            snapshots_dir = repo_cache / "snapshots"
-            if snapshots_dir.exists():
-                has_weights = (
-                    any(snapshots_dir.rglob("*.safetensors")) or
-                    any(snapshots_dir.rglob("*.bin"))
-                )
-                if not has_weights:
-                    print(f"[_is_model_cached] No model weights found for whisper-{model_size}, treating as not cached")
-                    return False
-            
-            return True
+            return is_repo_cached(f"openai/whisper-{model_size}", f"whisper-{model_size}")
         except Exception as e:
             print(f"[_is_model_cached] Error checking cache for whisper-{model_size}: {e}")
             return False
@@ -460,10 +668,10 @@ class PyTorchSTTBackend:
             print(f"[DEBUG] Early return - model already loaded")
             return
 
-        print(f"[DEBUG] Calling asyncio.to_thread for _load_model_sync")
+        print(f"[DEBUG] Running _load_model_sync on STT executor")
         # Run blocking load in thread pool
-        await asyncio.to_thread(self._load_model_sync, model_size)
-        print(f"[DEBUG] asyncio.to_thread completed")
+        await _run_on(_STT_EXECUTOR, self._load_model_sync, model_size)
+        print(f"[DEBUG] _load_model_sync completed")
     
     # Alias for compatibility
     load_model = load_model_async
@@ -479,20 +687,8 @@ class PyTorchSTTBackend:
             # Check if model is already cached
             is_cached = self._is_model_cached(model_size)
 
-            # Set up progress callback and tracker
-            # If cached: filter out non-download progress
-            # If not cached: report all progress (we're actually downloading)
-            progress_callback = create_hf_progress_callback(progress_model_name, progress_manager)
-            tracker = HFProgressTracker(progress_callback, filter_non_downloads=is_cached)
-
-            # Patch tqdm BEFORE importing transformers
-            print("[DEBUG] Starting tqdm patch BEFORE transformers import")
-            tracker_context = tracker.patch_download()
-            tracker_context.__enter__()
-            print("[DEBUG] tqdm patched, now importing transformers")
-
             # Import transformers
-            from transformers import WhisperProcessor, WhisperForConditionalGeneration
+            from transformers import WhisperProcessor, WhisperForConditionalGeneration, pipeline
 
             model_name = f"openai/whisper-{model_size}"
             print(f"[DEBUG] Model name: {model_name}")
@@ -513,13 +709,30 @@ class PyTorchSTTBackend:
                     status="downloading",
                 )
 
-            # Load models (tqdm is patched, but filters out non-download progress)
-            try:
-                self.processor = WhisperProcessor.from_pretrained(model_name)
-                self.model = WhisperForConditionalGeneration.from_pretrained(model_name)
-            finally:
-                # Exit the patch context
-                tracker_context.__exit__(None, None, None)
+            if not is_cached:
+                # Fetch files in parallel (PyTorch safetensors weights only),
+                # reporting progress through snapshot_download's tqdm_class hook
+                progress_callback = create_hf_progress_callback(progress_model_name, progress_manager)
+                snapshot_download(
+                    model_name,
+                    max_workers=8,
+                    ignore_patterns=["*.h5", "*.msgpack", "*.ot", "*.onnx", "pytorch_model*.bin"],
+                    tqdm_class=create_hf_tqdm_class(progress_callback),
+                )
+
+            # Load models from the local cache
+            self.processor = WhisperProcessor.from_pretrained(model_name)
+            # FP16 + FlashAttention-2 on CUDA when flash-attn is installed
+            use_cuda = self.device == "cuda"
+            self.model = WhisperForConditionalGeneration.from_pretrained(
+                model_name,
+                torch_dtype=torch.float16 if use_cuda else torch.float32,
+                attn_implementation=(
+                    "flash_attention_2"
+                    if use_cuda and importlib.util.find_spec("flash_attn") is not None
+                    else "sdpa"
+                ),
+            )
             
             # Only mark download as complete if we were tracking it
             if not is_cached:
@@ -527,6 +740,26 @@ class PyTorchSTTBackend:
                 task_manager.complete_download(progress_model_name)
             
             self.model.to(self.device)
+            _quantize_linears(self.model, "Whisper")
+
+            self._encoder_graph = None
+            if self.device == "cuda" and os.environ.get("VOICEBOX_WHISPER_CUDA_GRAPH") != "0":
+                try:
+                    self._capture_encoder_graph()
+                except Exception as e:
+                    print(f"Warning: CUDA graph capture failed, running Whisper encoder eagerly: {e}")
+                    self._encoder_graph = None
+                    self._encoder_in = None
+                    self._encoder_out = None
+
+            # Chunked, batched long-form transcription (model is already on device)
+            self._pipe = pipeline(
+                "automatic-speech-recognition",
+                model=self.model,
+                tokenizer=self.processor.tokenizer,
+                feature_extractor=self.processor.feature_extractor,
+                torch_dtype=self.model.dtype,
+            )
             self.model_size = model_size
             
             print(f"Whisper model {model_size} loaded successfully")
@@ -540,6 +773,55 @@ class PyTorchSTTBackend:
             task_manager.error_download(progress_model_name, str(e))
             raise
     
+    def _get_generate_kwargs(self, language: Optional[str]) -> dict:
+        """
+        Get the Whisper generate() kwargs for a language, built once per language.
+
+        Args:
+            language: Optional language hint
+
+        Returns:
+            Shared kwargs dict (copy before mutating)
+        """
+        generate_kwargs = self._generate_kwargs_cache.get(language)
+        if generate_kwargs is None:
+            generate_kwargs = {"task": "transcribe"}
+            if language:
+                generate_kwargs["language"] = language
+            self._generate_kwargs_cache[language] = generate_kwargs
+        return generate_kwargs
+
+    def _capture_encoder_graph(self):
+        """
+        Capture the Whisper encoder as a CUDA graph for single-window input.
+
+        Whisper always sees a fixed (1, n_mels, 3000) log-mel tensor for clips
+        up to 30s, so the encoder can be replayed from persistent buffers
+        instead of relaunching every kernel per call.
+        """
+        encoder = self.model.get_encoder()
+        frames = 2 * self.model.config.max_source_positions
+        self._encoder_in = torch.zeros(
+            1, self.model.config.num_mel_bins, frames,
+            device=self.device, dtype=self.model.dtype,
+        )
+
+        with torch.inference_mode():
+            # Warm up on a side stream so lazy initialization isn't captured
+            stream = torch.cuda.Stream()
+            stream.wait_stream(torch.cuda.current_stream())
+            with torch.cuda.stream(stream):
+                for _ in range(3):
+                    encoder(self._encoder_in)
+            torch.cuda.current_stream().wait_stream(stream)
+
+            graph = torch.cuda.CUDAGraph()
+            with torch.cuda.graph(graph):
+                self._encoder_out = encoder(self._encoder_in).last_hidden_state
+
+        self._encoder_graph = graph
+        print("Captured Whisper encoder CUDA graph")
+
     def unload_model(self):
         """Unload the model to free memory."""
         if self.model is not None:
@@ -547,6 +829,10 @@ class PyTorchSTTBackend:
             del self.processor
             self.model = None
             self.processor = None
+            self._pipe = None
+            self._encoder_graph = None
+            self._encoder_in = None
+            self._encoder_out = None
             
             if torch.cuda.is_available():
                 torch.cuda.empty_cache()
@@ -574,39 +860,49 @@ class PyTorchSTTBackend:
             """Run synchronous transcription in thread pool."""
             # Load audio
             audio, sr = load_audio(audio_path, sample_rate=16000)
-            
-            # Process audio
-            inputs = self.processor(
-                audio,
-                sampling_rate=16000,
-                return_tensors="pt",
-            )
-            inputs = inputs.to(self.device)
-            
-            # Set language if provided
-            forced_decoder_ids = None
-            if language:
-                # Support all languages from frontend: en, zh, ja, ko, de, fr, ru, pt, es, it
-                # Whisper supports these and many more
-                forced_decoder_ids = self.processor.get_decoder_prompt_ids(
-                    language=language,
-                    task="transcribe",
-                )
-            
-            # Generate transcription
-            with torch.no_grad():
-                predicted_ids = self.model.generate(
-                    inputs["input_features"],
-                    forced_decoder_ids=forced_decoder_ids,
+
+            # Support all languages from frontend: en, zh, ja, ko, de, fr, ru, pt, es, it
+            # Whisper supports these and many more. Copied because the
+            # pipeline adds its own keys to the dict it is given.
+            generate_kwargs = dict(self._get_generate_kwargs(language))
+
+            with torch.inference_mode():
+                if len(audio) <= WHISPER_WINDOW_SAMPLES:
+                    # Single 30s window: skip the pipeline's chunking machinery
+                    inputs = self.processor(audio, sampling_rate=16000, return_tensors="pt")
+                    # Cast to the model dtype (fp16 on CUDA) and make contiguous in one copy,
+                    # so generate() doesn't autocast or re-layout on every call
+                    feats = inputs["input_features"].to(
+                        dtype=self.model.dtype, memory_format=torch.contiguous_format,
+                    )
+                    use_cuda = self.device == "cuda"
+                    if use_cuda:
+                        # Pinned, non-blocking copy overlaps with the encoder launch
+                        feats = feats.pin_memory()
+
+                    if self._encoder_graph is not None and feats.shape == self._encoder_in.shape:
+                        from transformers.modeling_outputs import BaseModelOutput
+
+                        # Replay the captured encoder on its persistent input buffer
+                        self._encoder_in.copy_(feats, non_blocking=True)
+                        self._encoder_graph.replay()
+                        encoder_kwargs = {"encoder_outputs": BaseModelOutput(last_hidden_state=self._encoder_out)}
+                    else:
+                        encoder_kwargs = {"input_features": feats.to(self.device, non_blocking=use_cuda)}
+
+                    predicted_ids = self.model.generate(**encoder_kwargs, **generate_kwargs)
+                    return self.processor.batch_decode(predicted_ids, skip_special_tokens=True)[0].strip()
+
+                # Audio longer than 30s is split into chunks that are decoded in batches
+                result = self._pipe(
+                    {"raw": audio, "sampling_rate": 16000},
+                    chunk_length_s=30,
+                    batch_size=8,
+                    return_timestamps=False,
+                    generate_kwargs=generate_kwargs,
                 )
-            
-            # Decode
-            transcription = self.processor.batch_decode(
-                predicted_ids,
-                skip_special_tokens=True,
-            )[0]
-            
-            return transcription.strip()
+
+            return result["text"].strip()
         
         # Run blocking transcription in thread pool
-        return await asyncio.to_thread(_transcribe_sync)
+        return await _run_on(_STT_EXECUTOR, _transcribe_sync)
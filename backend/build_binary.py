@@ -14,14 +14,26 @@ def is_apple_silicon():
 
 
 def build_server():
-    """Build Python server as standalone binary."""
+    """
+    Build Python server as standalone binary.
+
+    Builds a one-folder bundle (dist/voicebox-server/voicebox-server) by
+    default: launches start in about a second because torch/transformers
+    libraries are loaded in place. Set VOICEBOX_ONEFILE=1 for a single-file
+    executable (dist/voicebox-server) - needed for the Tauri sidecar, which
+    ships one binary, at the cost of extracting every library to a temp dir
+    on each launch.
+    """
     backend_dir = Path(__file__).parent
+    onefile = os.getenv('VOICEBOX_ONEFILE') == '1'
 
     # PyInstaller arguments
     args = [
         'server.py',  # Use server.py as entry point instead of main.py
-        '--onefile',
+        '--onefile' if onefile else '--onedir',
         '--name', 'voicebox-server',
+        # Targeted hooks for qwen_tts / mlx / mlx_audio instead of collecting everything
+        '--additional-hooks-dir', str(backend_dir / 'pyinstaller_hooks'),
     ]
 
     # Add local qwen_tts path if specified (for editable installs)
@@ -49,27 +61,60 @@ def build_server():
         '--hidden-import', 'backend.utils.progress',
         '--hidden-import', 'backend.utils.hf_progress',
         '--hidden-import', 'backend.utils.validation',
+        '--hidden-import', 'backend.utils.hf_cache',
+        '--hidden-import', 'backend.utils.quantization',
         '--hidden-import', 'torch',
         '--hidden-import', 'transformers',
+        '--hidden-import', 'hf_transfer',
         '--hidden-import', 'fastapi',
         '--hidden-import', 'uvicorn',
+        # uvicorn picks its HTTP parser and event loop at runtime, so
+        # PyInstaller can't see them; bundle the fast C implementations
+        '--hidden-import', 'httptools',
         '--hidden-import', 'sqlalchemy',
-        '--hidden-import', 'librosa',
+        # librosa is not listed: PyInstaller still bundles it through the lazy
+        # import in backend.utils.audio, which only runs when resampling
         '--hidden-import', 'soundfile',
+        # qwen_tts submodules, data and metadata come from pyinstaller_hooks/hook-qwen_tts.py
         '--hidden-import', 'qwen_tts',
-        '--hidden-import', 'qwen_tts.inference',
-        '--hidden-import', 'qwen_tts.inference.qwen3_tts_model',
-        '--hidden-import', 'qwen_tts.inference.qwen3_tts_tokenizer',
-        '--hidden-import', 'qwen_tts.core',
-        '--hidden-import', 'qwen_tts.cli',
-        '--copy-metadata', 'qwen-tts',
-        '--collect-submodules', 'qwen_tts',
-        '--collect-data', 'qwen_tts',
         # Fix for pkg_resources and jaraco namespace packages
         '--hidden-import', 'pkg_resources.extern',
-        '--collect-submodules', 'jaraco',
+        '--hidden-import', 'jaraco.text',
+        '--hidden-import', 'jaraco.functools',
+        '--hidden-import', 'jaraco.context',
     ])
 
+    # Strip debug symbols from collected shared libraries (torch, MLX).
+    # UPX is disabled because it corrupts signed Mach-O binaries.
+    # Set VOICEBOX_DEBUG_SYMBOLS=1 to keep symbols for debugging.
+    if platform.system() in ('Linux', 'Darwin') and os.getenv('VOICEBOX_DEBUG_SYMBOLS') != '1':
+        args.extend(['--strip', '--noupx'])
+
+    # uvloop has no Windows build; elsewhere uvicorn prefers it over asyncio
+    if platform.system() != 'Windows':
+        args.extend(['--hidden-import', 'uvloop'])
+
+    # Exclude modules the server never imports (see pyinstaller_excludes.txt)
+    excludes_file = backend_dir / 'pyinstaller_excludes.txt'
+    for line in excludes_file.read_text().splitlines():
+        module = line.strip()
+        if module and not module.startswith('#'):
+            args.extend(['--exclude-module', module])
+
+    # CPU-only builds: CUDA libraries can't be filtered out of a CUDA torch
+    # wheel (libtorch links against them), so require the CPU wheel instead
+    # and drop the GPU-only Triton compiler
+    if os.getenv('CPU_ONLY') == '1':
+        import torch
+
+        if torch.version.cuda is not None:
+            raise SystemExit(
+                f"CPU_ONLY=1 but torch {torch.__version__} is a CUDA build. Install the CPU wheel first:\n"
+                "  pip install torch --index-url https://download.pytorch.org/whl/cpu --force-reinstall"
+            )
+        print("Building CPU-only binary - excluding Triton")
+        args.extend(['--exclude-module', 'triton'])
+
     # Add MLX-specific imports if building on Apple Silicon
     if is_apple_silicon():
         print("Building for Apple Silicon - including MLX dependencies")
@@ -81,23 +126,19 @@ def build_server():
             '--hidden-import', 'mlx_audio',
             '--hidden-import', 'mlx_audio.tts',
             '--hidden-import', 'mlx_audio.stt',
-            '--collect-submodules', 'mlx',
-            '--collect-submodules', 'mlx_audio',
-            # Use --collect-all so PyInstaller bundles both data files AND
-            # native shared libraries (.dylib, .metallib) for MLX.
-            # Previously only --collect-data was used, which caused MLX to
-            # raise OSError at runtime inside the bundled binary because
-            # the Metal shader libraries were missing.
-            '--collect-all', 'mlx',
-            '--collect-all', 'mlx_audio',
+            # Native libraries (.dylib) and Metal shader libraries (.metallib)
+            # come from pyinstaller_hooks/hook-mlx.py; without them MLX raises
+            # OSError at runtime inside the bundled binary
         ])
     else:
         print("Building for non-Apple Silicon platform - PyTorch only")
 
-    args.extend([
-        '--noconfirm',
-        '--clean',
-    ])
+    args.append('--noconfirm')
+
+    # Reuse PyInstaller's analysis cache in build/ on incremental rebuilds;
+    # set VOICEBOX_CLEAN_BUILD=1 to start from scratch (release builds)
+    if os.getenv('VOICEBOX_CLEAN_BUILD') == '1':
+        args.append('--clean')
 
     # Change to backend directory
     os.chdir(backend_dir)
@@ -105,7 +146,10 @@ def build_server():
     # Run PyInstaller
     PyInstaller.__main__.run(args)
     
-    print(f"Binary built in {backend_dir / 'dist' / 'voicebox-server'}")
+    if onefile:
+        print(f"Binary built in {backend_dir / 'dist' / 'voicebox-server'}")
+    else:
+        print(f"Binary built in {backend_dir / 'dist' / 'voicebox-server' / 'voicebox-server'}")
 
 
 if __name__ == '__main__':
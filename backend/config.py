@@ -5,18 +5,68 @@ Handles data directory configuration for production bundling.
 """
 
 import os
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 
-# Allow users to override the HuggingFace model download directory.
-# Set VOICEBOX_MODELS_DIR to an absolute path before starting the server.
-# This sets HF_HUB_CACHE so all huggingface_hub downloads go to that path.
-_custom_models_dir = os.environ.get("VOICEBOX_MODELS_DIR")
-if _custom_models_dir:
-    os.environ["HF_HUB_CACHE"] = _custom_models_dir
-    print(f"[config] Model download path set to: {_custom_models_dir}")
+def _apply_env_overrides():
+    """
+    Allow users to override the HuggingFace model download directory.
+
+    Set VOICEBOX_MODELS_DIR to an absolute path before starting the server.
+    This sets HF_HUB_CACHE so all huggingface_hub downloads go to that path.
+    """
+    custom_models_dir = os.environ.get("VOICEBOX_MODELS_DIR")
+    if not custom_models_dir or os.environ.get("HF_HUB_CACHE") == custom_models_dir:
+        return
+    os.environ["HF_HUB_CACHE"] = custom_models_dir
+    print(f"[config] Model download path set to: {custom_models_dir}")
+
+
+# Must run before huggingface_hub is imported anywhere: it reads HF_HUB_CACHE
+# into huggingface_hub.constants at import time
+_apply_env_overrides()
+
+@lru_cache(maxsize=None)
+def _ensure_dir(path: Path) -> Path:
+    """Create a directory the first time it is requested."""
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+@dataclass
+class Config:
+    """Runtime paths for the backend."""
+    data_dir: Path
+
+    @property
+    def db_path(self) -> Path:
+        """Database file path."""
+        return self.data_dir / "voicebox.db"
+
+    @property
+    def profiles_dir(self) -> Path:
+        """Profiles directory path (created on first use)."""
+        return _ensure_dir(self.data_dir / "profiles")
+
+    @property
+    def generations_dir(self) -> Path:
+        """Generations directory path (created on first use)."""
+        return _ensure_dir(self.data_dir / "generations")
+
+    @property
+    def cache_dir(self) -> Path:
+        """Cache directory path (created on first use)."""
+        return _ensure_dir(self.data_dir / "cache")
+
+    @property
+    def models_dir(self) -> Path:
+        """Models directory path (created on first use)."""
+        return _ensure_dir(self.data_dir / "models")
+
 
 # Default data directory (used in development)
-_data_dir = Path("data")
+CONFIG = Config(data_dir=Path("data"))
 
 def set_data_dir(path: str | Path):
     """
@@ -25,10 +75,10 @@ def set_data_dir(path: str | Path):
     Args:
         path: Path to the data directory
     """
-    global _data_dir
-    _data_dir = Path(path)
-    _data_dir.mkdir(parents=True, exist_ok=True)
-    print(f"Data directory set to: {_data_dir.absolute()}")
+    CONFIG.data_dir = Path(path)
+    CONFIG.data_dir.mkdir(parents=True, exist_ok=True)
+    _ensure_dir.cache_clear()
+    print(f"Data directory set to: {CONFIG.data_dir.absolute()}")
 
 def get_data_dir() -> Path:
     """
@@ -37,35 +87,27 @@ def get_data_dir() -> Path:
     Returns:
         Path to the data directory
     """
-    return _data_dir
+    return CONFIG.data_dir
 
 def get_db_path() -> Path:
     """Get database file path."""
-    return _data_dir / "voicebox.db"
+    return CONFIG.db_path
 
 def get_profiles_dir() -> Path:
     """Get profiles directory path."""
-    path = _data_dir / "profiles"
-    path.mkdir(parents=True, exist_ok=True)
-    return path
+    return CONFIG.profiles_dir
 
 def get_generations_dir() -> Path:
     """Get generations directory path."""
-    path = _data_dir / "generations"
-    path.mkdir(parents=True, exist_ok=True)
-    return path
+    return CONFIG.generations_dir
 
 def get_cache_dir() -> Path:
     """Get cache directory path."""
-    path = _data_dir / "cache"
-    path.mkdir(parents=True, exist_ok=True)
-    return path
+    return CONFIG.cache_dir
 
 def get_models_dir() -> Path:
     """Get models directory path."""
-    path = _data_dir / "models"
-    path.mkdir(parents=True, exist_ok=True)
-    return path
+    return CONFIG.models_dir
 
 # F5-TTS and E2-TTS model type configurations
 F5_MODEL_TYPES = {
@@ -2,16 +2,38 @@
 SQLite database ORM using SQLAlchemy.
 """
 
-from sqlalchemy import create_engine, Column, String, Integer, Float, DateTime, Text, ForeignKey, Boolean
-from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy import create_engine, event, Column, String, Integer, Float, DateTime, Text, ForeignKey, Boolean, Index
+from sqlalchemy.orm import DeclarativeBase, sessionmaker, Session
 from datetime import datetime
+import os
+import time
 import uuid
 from pathlib import Path
 
 from . import config
 
-Base = declarative_base()
+def uuid7() -> uuid.UUID:
+    """
+    Generate a time-ordered UUID (RFC 9562 version 7).
+
+    A 48-bit millisecond timestamp followed by random bits, so ids created
+    later sort later and new rows append to the end of the primary-key index.
+
+    Returns:
+        UUID whose string form is a drop-in replacement for uuid4()
+    """
+    value = (time.time_ns() // 1_000_000) << 80 | int.from_bytes(os.urandom(10), "big")
+    value = (value & ~(0xF << 76)) | (0x7 << 76)  # version 7
+    value = (value & ~(0x3 << 62)) | (0x2 << 62)  # RFC 4122 variant
+    return uuid.UUID(int=value)
+
+
+# Primary keys are UUID strings on purpose: they are the public identifiers in
+# API routes, the frontend, export/import archives and on-disk file names
+# (e.g. generations/<id>.wav), so they must stay stable across databases.
+# Lookups and joins on them go through SQLite's primary-key index.
+class Base(DeclarativeBase):
+    """Declarative base for all models."""
 
 
 class VoiceProfile(Base):
@@ -32,16 +54,22 @@ class ProfileSample(Base):
     __tablename__ = "profile_samples"
     
     id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
-    profile_id = Column(String, ForeignKey("profiles.id"), nullable=False)
+    profile_id = Column(String, ForeignKey("profiles.id"), nullable=False, index=True)
     audio_path = Column(String, nullable=False)
     reference_text = Column(Text, nullable=False)
+    # BLAKE2b digest of the uploaded file, used to skip re-processing re-uploads
+    content_hash = Column(String, index=True)
 
 
 class Generation(Base):
     """Generation history database model."""
     __tablename__ = "generations"
 
-    id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
+    # INTEGER PRIMARY KEY makes seq an alias of SQLite's rowid, so it stays
+    # fixed across VACUUM and keys the generations_fts index. id remains the
+    # ORM identity and the public key.
+    seq = Column(Integer, primary_key=True)
+    id = Column(String, unique=True, nullable=False, default=lambda: str(uuid7()))
     profile_id = Column(String, ForeignKey("profiles.id"), nullable=False)
     text = Column(Text, nullable=False)
     language = Column(String, default="en")
@@ -53,6 +81,14 @@ class Generation(Base):
     model_type = Column(String)
     created_at = Column(DateTime, default=datetime.utcnow)
 
+    # History listing pages newest-first on (created_at, id), optionally
+    # filtered by profile; the profile index also serves profile_id lookups
+    __table_args__ = (
+        Index("ix_generations_created_at_id", "created_at", "id"),
+        Index("ix_generations_profile_created_at_id", "profile_id", "created_at", "id"),
+    )
+    __mapper_args__ = {"primary_key": [id]}
+
 
 class Story(Base):
     """Story database model."""
@@ -71,13 +107,18 @@ class StoryItem(Base):
     
     id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
     story_id = Column(String, ForeignKey("stories.id"), nullable=False)
-    generation_id = Column(String, ForeignKey("generations.id"), nullable=False)
+    generation_id = Column(String, ForeignKey("generations.id"), nullable=False, index=True)
     start_time_ms = Column(Integer, nullable=False, default=0)  # Milliseconds from story start
     track = Column(Integer, nullable=False, default=0)  # Track number (0 = main track)
     trim_start_ms = Column(Integer, nullable=False, default=0)  # Milliseconds trimmed from start
     trim_end_ms = Column(Integer, nullable=False, default=0)  # Milliseconds trimmed from end
     created_at = Column(DateTime, default=datetime.utcnow)
 
+    # Also serves story_id lookups (leftmost column)
+    __table_args__ = (
+        Index("ix_story_items_story_track_time", "story_id", "track", "start_time_ms"),
+    )
+
 
 class Project(Base):
     """Audio studio project database model."""
@@ -105,7 +146,7 @@ class ChannelDeviceMapping(Base):
     __tablename__ = "channel_device_mappings"
     
     id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
-    channel_id = Column(String, ForeignKey("audio_channels.id"), nullable=False)
+    channel_id = Column(String, ForeignKey("audio_channels.id"), nullable=False, index=True)
     device_id = Column(String, nullable=False)  # OS device identifier
 
 
@@ -117,6 +158,13 @@ class ProfileChannelMapping(Base):
     channel_id = Column(String, ForeignKey("audio_channels.id"), primary_key=True)
 
 
+# Schema version stored in SQLite's PRAGMA user_version; bump it whenever a
+# migration is added to _run_migrations
+CURRENT_SCHEMA_VERSION = 7
+
+# Whether the generations_fts full-text index is available (set by init_db)
+generations_fts_enabled = False
+
 # Database setup will be initialized in init_db()
 engine = None
 SessionLocal = None
@@ -125,22 +173,41 @@ _db_path = None
 
 def init_db():
     """Initialize database tables."""
-    global engine, SessionLocal, _db_path
+    global engine, SessionLocal, _db_path, generations_fts_enabled
 
     _db_path = config.get_db_path()
     _db_path.parent.mkdir(parents=True, exist_ok=True)
 
+    # Sync endpoints run on FastAPI's 40-thread pool, each holding a session;
+    # size the pool so they don't queue behind the default 5 + 10 connections
     engine = create_engine(
         f"sqlite:///{_db_path}",
         connect_args={"check_same_thread": False},
+        pool_size=20,
+        max_overflow=20,
     )
+    event.listen(engine, "connect", _set_sqlite_pragmas)
+
+    # WAL lets /history reads proceed while /generate writes. The journal
+    # mode is stored in the database file, so it only needs setting once
+    # rather than on every pooled connection.
+    with engine.connect() as conn:
+        conn.exec_driver_sql("PRAGMA journal_mode=WAL")
 
     SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
     
-    # Run migrations before creating tables
-    _run_migrations(engine)
-    
-    Base.metadata.create_all(bind=engine)
+    # Migrate and create tables only when the schema is out of date, so warm
+    # starts issue no DDL
+    if _get_schema_version(engine) < CURRENT_SCHEMA_VERSION:
+        # Run migrations before creating tables
+        _run_migrations(engine)
+
+        Base.metadata.create_all(bind=engine)
+        _set_schema_version(engine)
+
+    # Checked outside the version gate so the index is created once SQLite
+    # supports it, even if it was unavailable when the schema was upgraded
+    generations_fts_enabled = _has_table(engine, "generations_fts") or _create_generations_fts(engine)
     
     # Create default channel if it doesn't exist
     db = SessionLocal()
@@ -153,27 +220,102 @@ def init_db():
                 is_default=True
             )
             db.add(default_channel)
+            db.flush()
             
-            # Assign all existing profiles to default channel
-            profiles = db.query(VoiceProfile).all()
-            for profile in profiles:
-                mapping = ProfileChannelMapping(
-                    profile_id=profile.id,
-                    channel_id=default_channel.id
-                )
-                db.add(mapping)
+            # Assign all existing profiles to default channel (one executemany)
+            profile_ids = db.query(VoiceProfile.id).all()
+            db.bulk_insert_mappings(ProfileChannelMapping, [
+                {"profile_id": profile_id, "channel_id": default_channel.id}
+                for (profile_id,) in profile_ids
+            ])
             
             db.commit()
     finally:
         db.close()
 
 
+def _set_sqlite_pragmas(dbapi_conn, connection_record):
+    """
+    Tune each new SQLite connection.
+
+    synchronous=NORMAL only fsyncs at checkpoints, which is still crash-safe
+    in WAL mode (enabled once per database file by init_db).
+    """
+    cursor = dbapi_conn.cursor()
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA mmap_size=268435456")  # 256 MB
+    cursor.execute("PRAGMA cache_size=-65536")  # 64 MB
+    cursor.close()
+
+
 def _run_migrations(engine):
     """Run database migrations."""
     from sqlalchemy import inspect, text
-    
+
     inspector = inspect(engine)
-    
+
+    _migrate_story_items(engine, inspector)
+
+    # Migration: Add avatar_path to profiles table
+    if 'profiles' in inspector.get_table_names():
+        columns = {col['name'] for col in inspector.get_columns('profiles')}
+        if 'avatar_path' not in columns:
+            print("Migrating profiles: adding avatar_path column")
+            with engine.connect() as conn:
+                conn.execute(text("ALTER TABLE profiles ADD COLUMN avatar_path VARCHAR"))
+                conn.commit()
+                print("Added avatar_path column to profiles")
+
+    # Migration: Add content_hash to profile_samples table
+    if 'profile_samples' in inspector.get_table_names():
+        columns = {col['name'] for col in inspector.get_columns('profile_samples')}
+        if 'content_hash' not in columns:
+            print("Migrating profile_samples: adding content_hash column")
+            with engine.connect() as conn:
+                conn.execute(text("ALTER TABLE profile_samples ADD COLUMN content_hash VARCHAR"))
+                conn.commit()
+                print("Added content_hash column to profile_samples")
+
+    # Migration: Add engine and model_type columns to generations table
+    if 'generations' in inspector.get_table_names():
+        columns = {col['name'] for col in inspector.get_columns('generations')}
+        if 'engine' not in columns:
+            print("Migrating generations: adding engine column")
+            with engine.connect() as conn:
+                conn.execute(text("ALTER TABLE generations ADD COLUMN engine VARCHAR"))
+                conn.commit()
+                print("Added engine column to generations")
+
+        # Re-check columns after potential engine migration
+        columns = {col['name'] for col in inspector.get_columns('generations')}
+        if 'model_type' not in columns:
+            print("Migrating generations: adding model_type column")
+            with engine.connect() as conn:
+                conn.execute(text("ALTER TABLE generations ADD COLUMN model_type VARCHAR"))
+                conn.commit()
+                print("Added model_type column to generations")
+
+    _migrate_generations_seq(engine, inspector)
+
+    # Migration: Drop indexes superseded by composite ones
+    with engine.connect() as conn:
+        conn.execute(text("DROP INDEX IF EXISTS ix_generations_profile_id"))
+        conn.commit()
+
+    # Migration: Add indexes to existing tables (create_all only indexes the
+    # tables it creates, and the story_items rebuild above drops them)
+    existing_tables = set(inspector.get_table_names())
+    for table in Base.metadata.sorted_tables:
+        if table.name in existing_tables:
+            for index in table.indexes:
+                index.create(engine, checkfirst=True)
+
+
+def _migrate_story_items(engine, inspector):
+    """Migrate the story_items table to the current layout."""
+    from sqlalchemy import text
+
     # Check if story_items table exists
     if 'story_items' not in inspector.get_table_names():
         return  # Table doesn't exist yet, will be created fresh
@@ -194,32 +336,23 @@ def _run_migrations(engine):
                 # First, add the new column temporarily
                 conn.execute(text("ALTER TABLE story_items ADD COLUMN start_time_ms INTEGER DEFAULT 0"))
                 
-                # Calculate timecodes from position ordering
-                result = conn.execute(text("""
-                    SELECT si.id, si.story_id, si.position, g.duration
-                    FROM story_items si
-                    JOIN generations g ON si.generation_id = g.id
-                    ORDER BY si.story_id, si.position
-                """))
-                
-                rows = result.fetchall()
-                
-                current_story_id = None
-                current_time_ms = 0
-                
-                for row in rows:
-                    item_id, story_id, position, duration = row
-                    
-                    if story_id != current_story_id:
-                        current_story_id = story_id
-                        current_time_ms = 0
-                    
-                    conn.execute(
-                        text("UPDATE story_items SET start_time_ms = :time WHERE id = :id"),
-                        {"time": current_time_ms, "id": item_id}
+                # Calculate timecodes from position ordering: each item starts
+                # after the earlier items in its story plus a 200ms gap. A
+                # correlated subquery keeps this to one statement without
+                # needing window functions or UPDATE ... FROM (SQLite 3.25+/3.33+)
+                conn.execute(text("""
+                    UPDATE story_items
+                    SET start_time_ms = (
+                        SELECT COALESCE(SUM(CAST(g.duration * 1000 AS INTEGER) + 200), 0)
+                        FROM story_items si
+                        JOIN generations g ON si.generation_id = g.id
+                        WHERE si.story_id = story_items.story_id
+                          AND si.position < story_items.position
+                    )
+                    WHERE EXISTS (
+                        SELECT 1 FROM generations g WHERE g.id = story_items.generation_id
                     )
-                    
-                    current_time_ms += int(duration * 1000) + 200
+                """))
                 
                 conn.commit()
             
@@ -280,34 +413,124 @@ def _run_migrations(engine):
             conn.commit()
             print("Added trim_end_ms column to story_items")
 
-    # Migration: Add avatar_path to profiles table
-    if 'profiles' in inspector.get_table_names():
-        columns = {col['name'] for col in inspector.get_columns('profiles')}
-        if 'avatar_path' not in columns:
-            print("Migrating profiles: adding avatar_path column")
-            with engine.connect() as conn:
-                conn.execute(text("ALTER TABLE profiles ADD COLUMN avatar_path VARCHAR"))
-                conn.commit()
-                print("Added avatar_path column to profiles")
 
-    # Migration: Add engine and model_type columns to generations table
-    if 'generations' in inspector.get_table_names():
-        columns = {col['name'] for col in inspector.get_columns('generations')}
-        if 'engine' not in columns:
-            print("Migrating generations: adding engine column")
-            with engine.connect() as conn:
-                conn.execute(text("ALTER TABLE generations ADD COLUMN engine VARCHAR"))
-                conn.commit()
-                print("Added engine column to generations")
+def _migrate_generations_seq(engine, inspector):
+    """Rebuild the generations table with an explicit seq rowid column."""
+    from sqlalchemy import text
 
-        # Re-check columns after potential engine migration
-        columns = {col['name'] for col in inspector.get_columns('generations')}
-        if 'model_type' not in columns:
-            print("Migrating generations: adding model_type column")
-            with engine.connect() as conn:
-                conn.execute(text("ALTER TABLE generations ADD COLUMN model_type VARCHAR"))
-                conn.commit()
-                print("Added model_type column to generations")
+    if 'generations' not in inspector.get_table_names():
+        return  # Table doesn't exist yet, will be created fresh
+
+    columns = {col['name'] for col in inspector.get_columns('generations')}
+    if 'seq' in columns:
+        return
+
+    print("Migrating generations: adding seq rowid column")
+
+    # SQLite can't change a table's primary key in place, so recreate the
+    # table. Copying the implicit rowid keeps existing row order. The old
+    # search index and its triggers go with the old table and are recreated
+    # by init_db; the indexes are recreated by _run_migrations.
+    with engine.connect() as conn:
+        conn.execute(text("""
+            CREATE TABLE generations_new (
+                seq INTEGER PRIMARY KEY,
+                id VARCHAR NOT NULL UNIQUE,
+                profile_id VARCHAR NOT NULL,
+                text TEXT NOT NULL,
+                language VARCHAR,
+                audio_path VARCHAR NOT NULL,
+                duration FLOAT NOT NULL,
+                seed INTEGER,
+                instruct TEXT,
+                engine VARCHAR,
+                model_type VARCHAR,
+                created_at DATETIME,
+                FOREIGN KEY (profile_id) REFERENCES profiles(id)
+            )
+        """))
+        conn.execute(text("""
+            INSERT INTO generations_new (seq, id, profile_id, text, language, audio_path,
+                                         duration, seed, instruct, engine, model_type, created_at)
+            SELECT rowid, id, profile_id, text, language, audio_path,
+                   duration, seed, instruct, engine, model_type, created_at FROM generations
+        """))
+        conn.execute(text("DROP TABLE IF EXISTS generations_fts"))
+        conn.execute(text("DROP TABLE generations"))
+        conn.execute(text("ALTER TABLE generations_new RENAME TO generations"))
+        conn.commit()
+        print("Migrated generations table to use a seq rowid column")
+
+
+def _create_generations_fts(engine) -> bool:
+    """
+    Create a trigram full-text index over generation text.
+
+    generations_fts is an external-content FTS5 table keyed by generations.seq
+    and kept in sync by triggers. The trigram tokenizer answers substring
+    searches (3+ characters) from the index. Requires SQLite 3.34+ built with
+    FTS5; without it, history search keeps using LIKE.
+
+    Returns:
+        True if the index was created
+    """
+    from sqlalchemy import text
+    from sqlalchemy.exc import OperationalError
+
+    statements = [
+        """CREATE VIRTUAL TABLE IF NOT EXISTS generations_fts USING fts5(
+            text, content='generations', content_rowid='seq', tokenize='trigram'
+        )""",
+        """CREATE TRIGGER IF NOT EXISTS generations_fts_insert AFTER INSERT ON generations BEGIN
+            INSERT INTO generations_fts(rowid, text) VALUES (new.seq, new.text);
+        END""",
+        """CREATE TRIGGER IF NOT EXISTS generations_fts_delete AFTER DELETE ON generations BEGIN
+            INSERT INTO generations_fts(generations_fts, rowid, text) VALUES ('delete', old.seq, old.text);
+        END""",
+        """CREATE TRIGGER IF NOT EXISTS generations_fts_update AFTER UPDATE OF text ON generations BEGIN
+            INSERT INTO generations_fts(generations_fts, rowid, text) VALUES ('delete', old.seq, old.text);
+            INSERT INTO generations_fts(rowid, text) VALUES (new.seq, new.text);
+        END""",
+        # Index rows written before the table existed
+        "INSERT INTO generations_fts(generations_fts) VALUES ('rebuild')",
+    ]
+
+    try:
+        with engine.connect() as conn:
+            for statement in statements:
+                conn.execute(text(statement))
+            conn.commit()
+    except OperationalError as e:
+        print(f"Full-text search unavailable, history search will use LIKE: {e}")
+        return False
+    return True
+
+
+def _has_table(engine, name: str) -> bool:
+    """Check whether a table exists without building an inspector."""
+    from sqlalchemy import text
+
+    with engine.connect() as conn:
+        return conn.execute(
+            text("SELECT 1 FROM sqlite_master WHERE name = :name"), {"name": name}
+        ).first() is not None
+
+
+def _get_schema_version(engine) -> int:
+    """Get the schema version recorded in the database (0 if never set)."""
+    from sqlalchemy import text
+
+    with engine.connect() as conn:
+        return conn.execute(text("PRAGMA user_version")).scalar()
+
+
+def _set_schema_version(engine):
+    """Record that the database schema is up to date."""
+    from sqlalchemy import text
+
+    with engine.connect() as conn:
+        conn.execute(text(f"PRAGMA user_version = {CURRENT_SCHEMA_VERSION}"))
+        conn.commit()
 
 
 def get_db():
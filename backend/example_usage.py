@@ -8,17 +8,23 @@ This script demonstrates how to:
 4. List history
 """
 
-import requests
+import asyncio
 import time
 from pathlib import Path
 
+import httpx
+
 # API base URL
 BASE_URL = "http://localhost:8000"
 
+# Shared client so every call reuses one keep-alive connection
+# (generation can take a while, hence the long timeout)
+client = httpx.Client(base_url=BASE_URL, timeout=300)
+
 
 def check_health():
     """Check if the server is running."""
-    response = requests.get(f"{BASE_URL}/health")
+    response = client.get("/health")
     data = response.json()
     print(f"Server status: {data['status']}")
     print(f"Model loaded: {data['model_loaded']}")
@@ -29,8 +35,8 @@ def check_health():
 
 def create_profile(name: str, description: str = None, language: str = "en"):
     """Create a new voice profile."""
-    response = requests.post(
-        f"{BASE_URL}/profiles",
+    response = client.post(
+        "/profiles",
         json={
             "name": name,
             "description": description,
@@ -45,11 +51,12 @@ def create_profile(name: str, description: str = None, language: str = "en"):
 
 def add_sample(profile_id: str, audio_file: str, reference_text: str):
     """Add a sample to a voice profile."""
+    # httpx streams open file objects into the multipart body
     with open(audio_file, "rb") as f:
-        files = {"file": f}
+        files = {"file": (Path(audio_file).name, f, "audio/wav")}
         data = {"reference_text": reference_text}
-        response = requests.post(
-            f"{BASE_URL}/profiles/{profile_id}/samples",
+        response = client.post(
+            f"/profiles/{profile_id}/samples",
             files=files,
             data=data,
         )
@@ -64,8 +71,8 @@ def generate_speech(profile_id: str, text: str, language: str = "en", seed: int
     print(f"Generating speech: '{text[:50]}...'")
     start_time = time.time()
     
-    response = requests.post(
-        f"{BASE_URL}/generate",
+    response = client.post(
+        "/generate",
         json={
             "profile_id": profile_id,
             "text": text,
@@ -82,20 +89,45 @@ def generate_speech(profile_id: str, text: str, language: str = "en", seed: int
     return generation
 
 
+async def generate_speech_batch(profile_id: str, texts: list, language: str = "en"):
+    """Generate speech for several texts concurrently."""
+    print(f"Generating {len(texts)} clips concurrently...")
+    start_time = time.time()
+
+    async with httpx.AsyncClient(base_url=BASE_URL, timeout=300) as async_client:
+        responses = await asyncio.gather(*[
+            async_client.post(
+                "/generate",
+                json={"profile_id": profile_id, "text": text, "language": language},
+            )
+            for text in texts
+        ])
+
+    generations = []
+    for response in responses:
+        response.raise_for_status()
+        generations.append(response.json())
+
+    elapsed = time.time() - start_time
+    print(f"Generated {len(generations)} clips in {elapsed:.2f}s")
+    return generations
+
+
 def download_audio(generation_id: str, output_file: str):
     """Download generated audio."""
-    response = requests.get(f"{BASE_URL}/audio/{generation_id}")
-    response.raise_for_status()
-    
-    with open(output_file, "wb") as f:
-        f.write(response.content)
+    # Stream to disk rather than holding the whole file in memory
+    with client.stream("GET", f"/audio/{generation_id}") as response:
+        response.raise_for_status()
+        with open(output_file, "wb") as f:
+            for chunk in response.iter_bytes(chunk_size=1 << 16):
+                f.write(chunk)
     
     print(f"Saved audio to: {output_file}")
 
 
 def list_profiles():
     """List all voice profiles."""
-    response = requests.get(f"{BASE_URL}/profiles")
+    response = client.get("/profiles")
     response.raise_for_status()
     profiles = response.json()
     
@@ -112,7 +144,7 @@ def list_history(profile_id: str = None, limit: int = 10):
     if profile_id:
         params["profile_id"] = profile_id
     
-    response = requests.get(f"{BASE_URL}/history", params=params)
+    response = client.get("/history", params=params)
     response.raise_for_status()
     history = response.json()
     
@@ -133,8 +165,8 @@ def transcribe_audio(audio_file: str, language: str = None):
         if language:
             data["language"] = language
         
-        response = requests.post(
-            f"{BASE_URL}/transcribe",
+        response = client.post(
+            "/transcribe",
             files=files,
             data=data,
         )
@@ -193,6 +225,9 @@ def main():
     # # 5. Download audio
     # print("\n5. Downloading audio...")
     # download_audio(generation["id"], "output.wav")
+    #
+    # # Many clips at once (the server batches concurrent requests)
+    # asyncio.run(generate_speech_batch(profile_id, ["First line.", "Second line."]))
     print()
     
     # 6. List profiles
@@ -5,20 +5,37 @@ Handles exporting profiles to ZIP archives and importing them back.
 Also handles exporting individual generations.
 """
 
+import asyncio
 import json
+import shutil
+import tempfile
 import zipfile
 import io
 from pathlib import Path
-from typing import Optional
+from typing import BinaryIO, Iterator, List, Optional, Tuple, Union
 from sqlalchemy.orm import Session
 
 from .models import VoiceProfileResponse
-from .database import VoiceProfile as DBVoiceProfile, ProfileSample as DBProfileSample, Generation as DBGeneration
+from .database import VoiceProfile as DBVoiceProfile, ProfileSample as DBProfileSample, Generation as DBGeneration, uuid7
 from .profiles import create_profile, add_profile_sample
 from .models import VoiceProfileCreate
 from . import config
 
 
+# Read size when copying files into a streamed archive
+_ZIP_CHUNK_SIZE = 1 << 20
+
+
+def _extract_to_temp(zip_file: zipfile.ZipFile, name: str, suffix: str) -> str:
+    """Copy a ZIP member into a new temporary file in 1MB chunks.
+
+    Returns the temporary file path; the caller is responsible for deleting it.
+    """
+    with zip_file.open(name) as src, tempfile.NamedTemporaryFile(suffix=suffix, delete=False) as tmp:
+        shutil.copyfileobj(src, tmp, _ZIP_CHUNK_SIZE)
+        return tmp.name
+
+
 def _get_profiles_dir() -> Path:
     """Get profiles directory from config."""
     return config.get_profiles_dir()
@@ -47,16 +64,67 @@ def _get_unique_profile_name(name: str, db: Session) -> str:
         counter += 1
 
 
-def export_profile_to_zip(profile_id: str, db: Session) -> bytes:
+class _ZipStreamBuffer(io.RawIOBase):
+    """Unseekable sink that hands back whatever ZipFile has written so far."""
+
+    def __init__(self):
+        super().__init__()
+        self._chunks: List[bytes] = []
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def drain(self) -> bytes:
+        chunks, self._chunks = self._chunks, []
+        return b"".join(chunks)
+
+
+def _iter_zip(entries: List[Tuple[str, Union[Path, bytes]]]) -> Iterator[bytes]:
     """
-    Export a voice profile to a ZIP archive.
+    Build a ZIP archive incrementally, yielding it chunk by chunk.
+
+    Entries are stored uncompressed (audio barely deflates), and files are
+    copied in 1MB pieces, so memory stays flat regardless of archive size.
+
+    Args:
+        entries: (archive name, file path or in-memory contents) pairs
+
+    Yields:
+        Consecutive chunks of the ZIP archive
+    """
+    buffer = _ZipStreamBuffer()
+    with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_STORED) as zip_file:
+        for arcname, source in entries:
+            if isinstance(source, bytes):
+                zip_file.writestr(arcname, source)
+            else:
+                zinfo = zipfile.ZipInfo.from_file(source, arcname)
+                zinfo.compress_type = zipfile.ZIP_STORED
+                with open(source, 'rb') as src, zip_file.open(zinfo, 'w') as dest:
+                    while chunk := src.read(_ZIP_CHUNK_SIZE):
+                        dest.write(chunk)
+                        yield buffer.drain()
+            yield buffer.drain()
+    yield buffer.drain()
+
+
+def iter_profile_zip(profile_id: str, db: Session) -> Iterator[bytes]:
+    """
+    Export a voice profile to a streamed ZIP archive.
+    
+    The profile is validated before this returns, so errors surface before
+    any of the archive is sent.
     
     Args:
         profile_id: Profile ID to export
         db: Database session
         
     Returns:
-        ZIP file contents as bytes
+        Iterator over the ZIP archive's bytes
         
     Raises:
         ValueError: If profile not found or has no samples
@@ -71,64 +139,75 @@ def export_profile_to_zip(profile_id: str, db: Session) -> bytes:
     if not samples:
         raise ValueError(f"Profile {profile_id} has no samples")
     
-    # Create ZIP in memory
-    zip_buffer = io.BytesIO()
-    
-    with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED) as zip_file:
-        # Check if profile has avatar
-        has_avatar = False
-        if profile.avatar_path:
-            avatar_path = Path(profile.avatar_path)
-            if avatar_path.exists():
-                has_avatar = True
-                # Add avatar to ZIP root with original extension
-                avatar_ext = avatar_path.suffix
-                zip_file.write(avatar_path, f"avatar{avatar_ext}")
-
-        # Create manifest.json
-        manifest = {
-            "version": "1.0",
-            "profile": {
-                "name": profile.name,
-                "description": profile.description,
-                "language": profile.language,
-            },
-            "has_avatar": has_avatar,
-        }
-        zip_file.writestr("manifest.json", json.dumps(manifest, indent=2))
+    entries: List[Tuple[str, Union[Path, bytes]]] = []
+
+    # Check if profile has avatar
+    has_avatar = False
+    if profile.avatar_path:
+        avatar_path = Path(profile.avatar_path)
+        if avatar_path.exists():
+            has_avatar = True
+            # Add avatar to ZIP root with original extension
+            avatar_ext = avatar_path.suffix
+            entries.append((f"avatar{avatar_ext}", avatar_path))
+
+    # Create manifest.json
+    manifest = {
+        "version": "1.0",
+        "profile": {
+            "name": profile.name,
+            "description": profile.description,
+            "language": profile.language,
+        },
+        "has_avatar": has_avatar,
+    }
+    entries.append(("manifest.json", json.dumps(manifest, indent=2).encode()))
+
+    # Create samples.json mapping
+    samples_data = {}
+
+    for sample in samples:
+        # Get filename from audio_path (should be {sample_id}.wav)
+        audio_path = Path(sample.audio_path)
+        filename = audio_path.name
 
-        # Create samples.json mapping
-        samples_data = {}
-        profile_dir = _get_profiles_dir() / profile_id
+        if not audio_path.exists():
+            raise ValueError(f"Audio file not found: {audio_path}")
 
-        for sample in samples:
-            # Get filename from audio_path (should be {sample_id}.wav)
-            audio_path = Path(sample.audio_path)
-            filename = audio_path.name
+        # Add to samples directory in ZIP
+        entries.append((f"samples/{filename}", audio_path))
 
-            # Read audio file
-            if not audio_path.exists():
-                raise ValueError(f"Audio file not found: {audio_path}")
+        # Map filename to reference text
+        samples_data[filename] = sample.reference_text
 
-            # Add to samples directory in ZIP
-            zip_path = f"samples/{filename}"
-            zip_file.write(audio_path, zip_path)
+    entries.append(("samples.json", json.dumps(samples_data, indent=2).encode()))
 
-            # Map filename to reference text
-            samples_data[filename] = sample.reference_text
+    return _iter_zip(entries)
 
-        zip_file.writestr("samples.json", json.dumps(samples_data, indent=2))
+
+def export_profile_to_zip(profile_id: str, db: Session) -> bytes:
+    """
+    Export a voice profile to a ZIP archive.
     
-    zip_buffer.seek(0)
-    return zip_buffer.read()
+    Args:
+        profile_id: Profile ID to export
+        db: Database session
+        
+    Returns:
+        ZIP file contents as bytes
+        
+    Raises:
+        ValueError: If profile not found or has no samples
+    """
+    return b"".join(iter_profile_zip(profile_id, db))
 
 
-async def import_profile_from_zip(file_bytes: bytes, db: Session) -> VoiceProfileResponse:
+async def import_profile_from_zip(file_bytes: Union[bytes, BinaryIO], db: Session) -> VoiceProfileResponse:
     """
     Import a voice profile from a ZIP archive.
     
     Args:
-        file_bytes: ZIP file contents
+        file_bytes: ZIP file contents, or a seekable file object holding them
         db: Database session
         
     Returns:
@@ -137,7 +216,7 @@ async def import_profile_from_zip(file_bytes: bytes, db: Session) -> VoiceProfil
     Raises:
         ValueError: If ZIP is invalid or missing required files
     """
-    zip_buffer = io.BytesIO(file_bytes)
+    zip_buffer = io.BytesIO(file_bytes) if isinstance(file_bytes, bytes) else file_bytes
     
     try:
         with zipfile.ZipFile(zip_buffer, 'r') as zip_file:
@@ -190,10 +269,9 @@ async def import_profile_from_zip(file_bytes: bytes, db: Session) -> VoiceProfil
                 try:
                     avatar_file = avatar_files[0]
                     # Extract to temporary file
-                    import tempfile
-                    with tempfile.NamedTemporaryFile(suffix=Path(avatar_file).suffix, delete=False) as tmp:
-                        tmp.write(zip_file.read(avatar_file))
-                        tmp_path = tmp.name
+                    tmp_path = await asyncio.to_thread(
+                        _extract_to_temp, zip_file, avatar_file, Path(avatar_file).suffix
+                    )
 
                     try:
                         from .profiles import upload_avatar
@@ -216,10 +294,7 @@ async def import_profile_from_zip(file_bytes: bytes, db: Session) -> VoiceProfil
                     raise ValueError(f"Sample file not found in ZIP: {zip_path}")
                 
                 # Extract to temporary file
-                import tempfile
-                with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tmp:
-                    tmp.write(zip_file.read(zip_path))
-                    tmp_path = tmp.name
+                tmp_path = await asyncio.to_thread(_extract_to_temp, zip_file, zip_path, ".wav")
                 
                 try:
                     # Add sample to profile
@@ -245,27 +320,46 @@ async def import_profile_from_zip(file_bytes: bytes, db: Session) -> VoiceProfil
         raise ValueError(f"Error importing profile: {str(e)}")
 
 
-def export_generation_to_zip(generation_id: str, db: Session) -> bytes:
+def get_generation_with_profile(
+    generation_id: str,
+    db: Session,
+) -> Optional[Tuple[DBGeneration, Optional[DBVoiceProfile]]]:
     """
-    Export a generation to a ZIP archive.
+    Load a generation and its profile in a single query.
     
     Args:
-        generation_id: Generation ID to export
+        generation_id: Generation ID
         db: Database session
         
     Returns:
-        ZIP file contents as bytes
+        (generation, profile) pair - profile is None if it no longer
+        exists - or None if the generation is not found
+    """
+    return db.query(DBGeneration, DBVoiceProfile).outerjoin(
+        DBVoiceProfile,
+        DBGeneration.profile_id == DBVoiceProfile.id
+    ).filter(
+        DBGeneration.id == generation_id
+    ).first()
+
+
+def iter_generation_zip(
+    generation: DBGeneration,
+    profile: Optional[DBVoiceProfile],
+) -> Iterator[bytes]:
+    """
+    Export a generation to a streamed ZIP archive.
+    
+    Args:
+        generation: Generation to export
+        profile: The generation's profile, as returned by get_generation_with_profile
+        
+    Returns:
+        Iterator over the ZIP archive's bytes
         
     Raises:
-        ValueError: If generation not found
+        ValueError: If the profile or audio file is missing
     """
-    # Get generation
-    generation = db.query(DBGeneration).filter_by(id=generation_id).first()
-    if not generation:
-        raise ValueError(f"Generation {generation_id} not found")
-    
-    # Get profile info
-    profile = db.query(DBVoiceProfile).filter_by(id=generation.profile_id).first()
     if not profile:
         raise ValueError(f"Profile {generation.profile_id} not found")
     
@@ -274,45 +368,59 @@ def export_generation_to_zip(generation_id: str, db: Session) -> bytes:
     if not audio_path.exists():
         raise ValueError(f"Audio file not found: {audio_path}")
     
-    # Create ZIP in memory
-    zip_buffer = io.BytesIO()
-    
-    with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED) as zip_file:
-        # Create manifest.json
-        manifest = {
-            "version": "1.0",
-            "generation": {
-                "id": generation.id,
-                "text": generation.text,
-                "language": generation.language,
-                "duration": generation.duration,
-                "seed": generation.seed,
-                "instruct": generation.instruct,
-                "created_at": generation.created_at.isoformat(),
-            },
-            "profile": {
-                "id": profile.id,
-                "name": profile.name,
-                "description": profile.description,
-                "language": profile.language,
-            }
+    # Create manifest.json
+    manifest = {
+        "version": "1.0",
+        "generation": {
+            "id": generation.id,
+            "text": generation.text,
+            "language": generation.language,
+            "duration": generation.duration,
+            "seed": generation.seed,
+            "instruct": generation.instruct,
+            "created_at": generation.created_at.isoformat(),
+        },
+        "profile": {
+            "id": profile.id,
+            "name": profile.name,
+            "description": profile.description,
+            "language": profile.language,
         }
-        zip_file.writestr("manifest.json", json.dumps(manifest, indent=2))
-        
+    }
+    
+    return _iter_zip([
+        ("manifest.json", json.dumps(manifest, indent=2).encode()),
         # Add audio file
-        filename = audio_path.name
-        zip_file.write(audio_path, f"audio/{filename}")
+        (f"audio/{audio_path.name}", audio_path),
+    ])
+
+
+def export_generation_to_zip(generation_id: str, db: Session) -> bytes:
+    """
+    Export a generation to a ZIP archive.
     
-    zip_buffer.seek(0)
-    return zip_buffer.read()
+    Args:
+        generation_id: Generation ID to export
+        db: Database session
+        
+    Returns:
+        ZIP file contents as bytes
+        
+    Raises:
+        ValueError: If generation not found
+    """
+    row = get_generation_with_profile(generation_id, db)
+    if not row:
+        raise ValueError(f"Generation {generation_id} not found")
+    return b"".join(iter_generation_zip(*row))
 
 
-async def import_generation_from_zip(file_bytes: bytes, db: Session) -> dict:
+async def import_generation_from_zip(file_bytes: Union[bytes, BinaryIO], db: Session) -> dict:
     """
     Import a generation from a ZIP archive.
     
     Args:
-        file_bytes: ZIP file contents
+        file_bytes: ZIP file contents, or a seekable file object holding them
         db: Database session
         
     Returns:
@@ -322,12 +430,10 @@ async def import_generation_from_zip(file_bytes: bytes, db: Session) -> dict:
         ValueError: If ZIP is invalid or missing required files
     """
     from pathlib import Path
-    import tempfile
-    import shutil
     from datetime import datetime
     from . import config
     
-    zip_buffer = io.BytesIO(file_bytes)
+    zip_buffer = io.BytesIO(file_bytes) if isinstance(file_bytes, bytes) else file_bytes
     
     try:
         with zipfile.ZipFile(zip_buffer, 'r') as zip_file:
@@ -383,9 +489,7 @@ async def import_generation_from_zip(file_bytes: bytes, db: Session) -> dict:
                     raise ValueError("No voice profiles found. Please create a profile before importing generations.")
             
             # Extract audio file to temporary location
-            with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tmp:
-                tmp.write(zip_file.read(audio_file_path))
-                tmp_path = tmp.name
+            tmp_path = await asyncio.to_thread(_extract_to_temp, zip_file, audio_file_path, ".wav")
             
             try:
                 # Create generations directory
@@ -393,11 +497,11 @@ async def import_generation_from_zip(file_bytes: bytes, db: Session) -> dict:
                 generations_dir.mkdir(parents=True, exist_ok=True)
                 
                 # Generate new ID for this generation
-                new_generation_id = str(__import__('uuid').uuid4())
+                new_generation_id = str(uuid7())
                 
                 # Copy audio to generations directory
                 audio_dest = generations_dir / f"{new_generation_id}.wav"
-                shutil.copy(tmp_path, audio_dest)
+                await asyncio.to_thread(shutil.copy, tmp_path, audio_dest)
                 
                 # Create generation record
                 db_generation = DBGeneration(
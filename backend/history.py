@@ -4,15 +4,16 @@ Generation history management module.
 
 from typing import List, Optional, Tuple
 from datetime import datetime
-import uuid
+import asyncio
+import sqlite3
 import shutil
 from pathlib import Path
 from sqlalchemy.orm import Session
-from sqlalchemy import or_
+from sqlalchemy import delete, func, or_, select, text as sql_text, tuple_
 
 from .models import GenerationRequest, GenerationResponse, HistoryQuery, HistoryResponse, HistoryListResponse
-from .database import Generation as DBGeneration, VoiceProfile as DBVoiceProfile
-from . import config
+from .database import Generation as DBGeneration, VoiceProfile as DBVoiceProfile, uuid7
+from . import config, database
 
 
 def _get_generations_dir() -> Path:
@@ -20,6 +21,39 @@ def _get_generations_dir() -> Path:
     return config.get_generations_dir()
 
 
+# History listing statements, built once per process; list_generations only
+# adds filters and pagination. Selecting just the response columns (with the
+# profile name joined in) skips building ORM entities for every row.
+_HISTORY_SELECT = select(
+    DBGeneration.id,
+    DBGeneration.profile_id,
+    DBVoiceProfile.name.label('profile_name'),
+    DBGeneration.text,
+    DBGeneration.language,
+    DBGeneration.audio_path,
+    DBGeneration.duration,
+    DBGeneration.seed,
+    DBGeneration.instruct,
+    DBGeneration.created_at,
+).join(
+    DBVoiceProfile,
+    DBGeneration.profile_id == DBVoiceProfile.id
+)
+
+# Newest first, id breaks ties so pages are stable
+_HISTORY_ORDER = (DBGeneration.created_at.desc(), DBGeneration.id.desc())
+
+# DELETE ... RETURNING needs SQLite 3.35+
+_HAS_DELETE_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+
+_FTS_MATCH = sql_text("SELECT rowid FROM generations_fts WHERE generations_fts MATCH :phrase")
+
+
+def _count(db: Session, stmt) -> int:
+    """Count the rows a select would return."""
+    return db.scalar(select(func.count()).select_from(stmt.subquery()))
+
+
 async def create_generation(
     profile_id: str,
     text: str,
@@ -51,7 +85,7 @@ async def create_generation(
         Created generation entry
     """
     db_generation = DBGeneration(
-        id=str(uuid.uuid4()),
+        id=str(uuid7()),
         profile_id=profile_id,
         text=text,
         language=language,
@@ -64,11 +98,14 @@ async def create_generation(
         created_at=datetime.utcnow(),
     )
 
+    # Every field is set above, so build the response before commit expires
+    # the instance; reading it afterwards would reload the row
+    response = GenerationResponse.model_validate(db_generation)
+
     db.add(db_generation)
     db.commit()
-    db.refresh(db_generation)
 
-    return GenerationResponse.model_validate(db_generation)
+    return response
 
 
 async def get_generation(
@@ -85,7 +122,7 @@ async def get_generation(
     Returns:
         Generation or None if not found
     """
-    generation = db.query(DBGeneration).filter_by(id=generation_id).first()
+    generation = db.get(DBGeneration, generation_id)
     if not generation:
         return None
     
@@ -106,55 +143,55 @@ async def list_generations(
     Returns:
         HistoryListResponse with items and total count
     """
-    # Build base query with join to get profile name
-    q = db.query(
-        DBGeneration,
-        DBVoiceProfile.name.label('profile_name')
-    ).join(
-        DBVoiceProfile,
-        DBGeneration.profile_id == DBVoiceProfile.id
-    )
+    filters = []
     
     # Apply profile filter
     if query.profile_id:
-        q = q.filter(DBGeneration.profile_id == query.profile_id)
+        filters.append(DBGeneration.profile_id == query.profile_id)
     
-    # Apply search filter (searches in text content)
-    if query.search:
+    # Apply search filter (searches in text content). The trigram index only
+    # covers terms of 3+ characters; shorter ones use LIKE.
+    if query.search and database.generations_fts_enabled and len(query.search) >= 3:
+        phrase = '"' + query.search.replace('"', '""') + '"'
+        filters.append(DBGeneration.seq.in_(_FTS_MATCH.bindparams(phrase=phrase)))
+    elif query.search:
         search_pattern = f"%{query.search}%"
-        q = q.filter(DBGeneration.text.like(search_pattern))
-    
-    # Get total count before pagination
-    total_count = q.count()
-    
-    # Apply ordering (newest first)
-    q = q.order_by(DBGeneration.created_at.desc())
-    
-    # Apply pagination
-    q = q.offset(query.offset).limit(query.limit)
-    
-    # Execute query
-    results = q.all()
-    
-    # Convert to HistoryResponse with profile_name
-    items = []
-    for generation, profile_name in results:
-        items.append(HistoryResponse(
-            id=generation.id,
-            profile_id=generation.profile_id,
-            profile_name=profile_name,
-            text=generation.text,
-            language=generation.language,
-            audio_path=generation.audio_path,
-            duration=generation.duration,
-            seed=generation.seed,
-            instruct=generation.instruct,
-            created_at=generation.created_at,
-        ))
+        filters.append(DBGeneration.text.like(search_pattern))
+    
+    stmt = _HISTORY_SELECT.where(*filters)
+    ordered = stmt.order_by(*_HISTORY_ORDER)
+    
+    # Apply pagination: seek past the cursor when given (cost doesn't grow
+    # with page depth), otherwise fall back to OFFSET
+    if query.cursor_created_at is not None and query.cursor_id is not None:
+        # The cursor filter narrows the rows, so the total needs its own count
+        total_count = _count(db, stmt)
+        results = db.execute(ordered.where(
+            tuple_(DBGeneration.created_at, DBGeneration.id)
+            < tuple_(query.cursor_created_at, query.cursor_id)
+        ).limit(query.limit)).all()
+    else:
+        # Window count is computed over all filtered rows before OFFSET/LIMIT,
+        # so the page and the total come from the same scan
+        results = db.execute(ordered.add_columns(
+            func.count().over().label('total')
+        ).offset(query.offset).limit(query.limit)).all()
+        if results:
+            total_count = results[0].total
+        else:
+            total_count = _count(db, stmt) if query.offset else 0
+    
+    # Convert to HistoryResponse (rows carry the same field names)
+    items = [HistoryResponse.model_validate(row) for row in results]
+    
+    # A full page may have more after it
+    next_cursor = items[-1] if len(items) == query.limit else None
     
     return HistoryListResponse(
         items=items,
         total=total_count,
+        next_cursor_created_at=next_cursor.created_at if next_cursor else None,
+        next_cursor_id=next_cursor.id if next_cursor else None,
     )
 
 
@@ -172,18 +209,12 @@ async def delete_generation(
     Returns:
         True if deleted, False if not found
     """
-    generation = db.query(DBGeneration).filter_by(id=generation_id).first()
-    if not generation:
+    audio_paths = _delete_returning_audio_paths(db, DBGeneration.id == generation_id)
+    if not audio_paths:
         return False
     
     # Delete audio file
-    audio_path = Path(generation.audio_path)
-    if audio_path.exists():
-        audio_path.unlink()
-    
-    # Delete from database
-    db.delete(generation)
-    db.commit()
+    Path(audio_paths[0]).unlink(missing_ok=True)
     
     return True
 
@@ -202,22 +233,42 @@ async def delete_generations_by_profile(
     Returns:
         Number of generations deleted
     """
-    generations = db.query(DBGeneration).filter_by(profile_id=profile_id).all()
-    
-    count = 0
-    for generation in generations:
-        # Delete audio file
-        audio_path = Path(generation.audio_path)
-        if audio_path.exists():
-            audio_path.unlink()
-        
-        # Delete from database
-        db.delete(generation)
-        count += 1
+    audio_paths = _delete_returning_audio_paths(db, DBGeneration.profile_id == profile_id)
     
-    db.commit()
+    # Delete audio files off the event loop
+    await asyncio.to_thread(_unlink_files, audio_paths)
     
-    return count
+    return len(audio_paths)
+
+
+def _delete_returning_audio_paths(db: Session, condition) -> List[str]:
+    """
+    Delete matching generations and commit.
+
+    Args:
+        db: Database session
+        condition: WHERE clause selecting the generations
+        
+    Returns:
+        Audio paths of the deleted generations
+    """
+    if _HAS_DELETE_RETURNING:
+        # Row removal and path lookup in a single statement
+        audio_paths = list(db.scalars(
+            delete(DBGeneration).where(condition).returning(DBGeneration.audio_path),
+            execution_options={"synchronize_session": False},
+        ))
+    else:
+        audio_paths = list(db.scalars(select(DBGeneration.audio_path).where(condition)))
+        db.execute(delete(DBGeneration).where(condition), execution_options={"synchronize_session": False})
+    db.commit()
+    return audio_paths
+
+
+def _unlink_files(paths: List[str]) -> None:
+    """Delete files, ignoring ones that are already gone."""
+    for path in paths:
+        Path(path).unlink(missing_ok=True)
 
 
 async def get_generation_stats(db: Session) -> dict:
@@ -230,22 +281,17 @@ async def get_generation_stats(db: Session) -> dict:
     Returns:
         Statistics dictionary
     """
-    from sqlalchemy import func
-    
-    total = db.query(func.count(DBGeneration.id)).scalar()
-    
-    total_duration = db.query(func.sum(DBGeneration.duration)).scalar() or 0
-    
-    # Get generations by profile
+    # Per-profile counts and durations in one query; totals are summed from them
     by_profile = db.query(
         DBGeneration.profile_id,
-        func.count(DBGeneration.id).label('count')
+        func.count(DBGeneration.id).label('count'),
+        func.coalesce(func.sum(DBGeneration.duration), 0).label('duration'),
     ).group_by(DBGeneration.profile_id).all()
     
     return {
-        "total_generations": total,
-        "total_duration_seconds": total_duration,
+        "total_generations": sum(count for _, count, _ in by_profile),
+        "total_duration_seconds": sum(duration for _, _, duration in by_profile),
         "generations_by_profile": {
-            profile_id: count for profile_id, count in by_profile
+            profile_id: count for profile_id, count, _ in by_profile
         },
     }
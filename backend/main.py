@@ -9,31 +9,52 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import FileResponse, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 from sqlalchemy.orm import Session
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from datetime import datetime
 import asyncio
 import uvicorn
 import argparse
-import torch
 import tempfile
+import shutil
+import hashlib
 import io
 from pathlib import Path
 import uuid
 import asyncio
 import signal
 import os
+import re
+import time
+from contextlib import asynccontextmanager
 from urllib.parse import quote
 
 
+# Characters dropped when deriving download filenames from user text
+_UNSAFE_FILENAME_CHARS = re.compile(r"[^\w \-]+")
+_UNSAFE_ASCII_FILENAME_CHARS = re.compile(r"[^A-Za-z0-9 ._\-]+")
+
+
+def _safe_filename(text: str, default: str, limit: Optional[int] = None) -> str:
+    """Reduce user text to letters, digits, spaces, hyphens and underscores.
+
+    Args:
+        text: Profile name, story name or generation text
+        default: Name to use if nothing is left
+        limit: Only consider the first ``limit`` characters
+
+    Returns:
+        Filename stem safe to put in a download name
+    """
+    return _UNSAFE_FILENAME_CHARS.sub("", text[:limit]).strip() or default
+
+
 def _safe_content_disposition(disposition_type: str, filename: str) -> str:
     """Build a Content-Disposition header that is safe for non-ASCII filenames.
 
     Uses RFC 5987 ``filename*`` parameter so that browsers can decode
     UTF-8 filenames while the ``filename`` fallback stays ASCII-only.
     """
-    ascii_name = "".join(
-        c for c in filename if c.isascii() and (c.isalnum() or c in " -_.")
-    ).strip() or "download"
+    ascii_name = _UNSAFE_ASCII_FILENAME_CHARS.sub("", filename).strip() or "download"
     utf8_name = quote(filename, safe="")
     return (
         f'{disposition_type}; filename="{ascii_name}"; '
@@ -41,6 +62,63 @@ def _safe_content_disposition(disposition_type: str, filename: str) -> str:
     )
 
 
+@asynccontextmanager
+async def _spooled_upload(file: UploadFile, suffix: str, hasher=None):
+    """Stream an upload to a temporary file in 1MB chunks off the event loop.
+
+    Yields the temporary file path and deletes the file on exit. If a
+    hashlib object is given, it is updated with the contents as they are
+    copied.
+    """
+    def _copy() -> str:
+        with tempfile.NamedTemporaryFile(suffix=suffix, delete=False) as tmp:
+            if hasher is None:
+                shutil.copyfileobj(file.file, tmp, 1 << 20)
+            else:
+                while chunk := file.file.read(1 << 20):
+                    hasher.update(chunk)
+                    tmp.write(chunk)
+            return tmp.name
+
+    tmp_path = await asyncio.to_thread(_copy)
+    try:
+        yield tmp_path
+    finally:
+        Path(tmp_path).unlink(missing_ok=True)
+
+
+def _upload_size(file: UploadFile) -> int:
+    """Size of an upload in bytes, without reading it into memory."""
+    if file.size is not None:
+        return file.size
+    position = file.file.tell()
+    size = file.file.seek(0, os.SEEK_END)
+    file.file.seek(position)
+    return size
+
+
+def _stat_or_404(path: Path, detail: str) -> os.stat_result:
+    """Stat a file to be served, raising 404 if it doesn't exist.
+
+    Passing the result to FileResponse as stat_result reuses this one stat
+    for the existence check and the response headers.
+    """
+    try:
+        return os.stat(path)
+    except FileNotFoundError:
+        raise HTTPException(status_code=404, detail=detail)
+
+
+def _audio_file_response(path: Path, filename: str) -> FileResponse:
+    """Serve a WAV file inline.
+
+    Starlette hands the path to the server for zero-copy sending when the
+    server supports the ASGI pathsend extension.
+    """
+    stat_result = _stat_or_404(path, "Audio file not found")
+    return FileResponse(path, media_type="audio/wav", filename=filename, stat_result=stat_result)
+
+
 from . import database, models, profiles, history, tts, transcribe, config, export_import, channels, stories, __version__
 from .backends import get_tts_backend
 from .database import get_db, Generation as DBGeneration, VoiceProfile as DBVoiceProfile
@@ -86,15 +164,87 @@ async def shutdown():
     return {"message": "Shutting down..."}
 
 
+# (checked_at, model_id, result) of the last model cache check for /health
+_model_downloaded_cache: Tuple[float, Optional[str], Optional[bool]] = (0.0, None, None)
+_MODEL_DOWNLOADED_TTL_S = 30.0
+
+
+def _check_model_downloaded(model_id: str) -> Optional[bool]:
+    """Scan the HuggingFace cache for a downloaded model (walks the cache dir)."""
+    from huggingface_hub import constants as hf_constants
+
+    model_downloaded = None
+    # Method 1: Try scan_cache_dir if available
+    try:
+        from huggingface_hub import scan_cache_dir
+        cache_info = scan_cache_dir()
+        for repo in cache_info.repos:
+            if repo.repo_id == model_id:
+                model_downloaded = True
+                break
+    except (ImportError, Exception):
+        # Method 2: Check cache directory (using HuggingFace's OS-specific cache location)
+        cache_dir = hf_constants.HF_HUB_CACHE
+        repo_cache = Path(cache_dir) / ("models--" + model_id.replace("/", "--"))
+        if repo_cache.exists():
+            has_model_files = (
+                any(repo_cache.rglob("*.bin")) or
+                any(repo_cache.rglob("*.safetensors")) or
+                any(repo_cache.rglob("*.pt")) or
+                any(repo_cache.rglob("*.pth")) or
+                any(repo_cache.rglob("*.npz"))  # MLX models may use npz
+            )
+            model_downloaded = has_model_files
+    return model_downloaded
+
+
+async def _get_model_downloaded(model_id: str) -> Optional[bool]:
+    """Cached, off-loop wrapper around _check_model_downloaded for /health polling."""
+    global _model_downloaded_cache
+
+    checked_at, cached_id, cached = _model_downloaded_cache
+    if cached_id == model_id and time.monotonic() - checked_at < _MODEL_DOWNLOADED_TTL_S:
+        return cached
+
+    result = await asyncio.to_thread(_check_model_downloaded, model_id)
+    _model_downloaded_cache = (time.monotonic(), model_id, result)
+    return result
+
+
+# Startup warm-up job (see startup_event); /health checks it before importing torch
+_warm_up_future: Optional[asyncio.Future] = None
+
+
+def _default_model_id(backend_type: str) -> str:
+    """HuggingFace repo of the default (1.7B) TTS model for a backend."""
+    if backend_type == "mlx":
+        return "mlx-community/Qwen3-TTS-12Hz-1.7B-Base-bf16"
+    return "Qwen/Qwen3-TTS-12Hz-1.7B-Base"
+
+
 @app.get("/health", response_model=models.HealthResponse)
 async def health():
     """Health check endpoint."""
-    from huggingface_hub import hf_hub_download, constants as hf_constants
-    from pathlib import Path
-    import os
+    backend_type = get_backend_type()
+
+    # While the startup warm-up is importing torch, importing it here would
+    # block the event loop on the import lock; answer without GPU details
+    if _warm_up_future is not None and not _warm_up_future.done():
+        try:
+            model_downloaded = await _get_model_downloaded(_default_model_id(backend_type))
+        except Exception:
+            model_downloaded = None
+        return models.HealthResponse(
+            status="starting",
+            model_loaded=False,
+            model_downloaded=model_downloaded,
+            gpu_available=backend_type == "mlx",
+            backend_type=backend_type,
+        )
+
+    import torch
 
     tts_model = tts.get_tts_model()
-    backend_type = get_backend_type()
 
     # Check for GPU availability (CUDA, MPS, Intel Arc XPU, or DirectML)
     has_cuda = torch.cuda.is_available()
@@ -168,33 +318,7 @@ async def health():
     model_downloaded = None
     try:
         # Check if the default model (1.7B) is cached
-        # Use different model IDs based on backend
-        if backend_type == "mlx":
-            default_model_id = "mlx-community/Qwen3-TTS-12Hz-1.7B-Base-bf16"
-        else:
-            default_model_id = "Qwen/Qwen3-TTS-12Hz-1.7B-Base"
-        
-        # Method 1: Try scan_cache_dir if available
-        try:
-            from huggingface_hub import scan_cache_dir
-            cache_info = scan_cache_dir()
-            for repo in cache_info.repos:
-                if repo.repo_id == default_model_id:
-                    model_downloaded = True
-                    break
-        except (ImportError, Exception):
-            # Method 2: Check cache directory (using HuggingFace's OS-specific cache location)
-            cache_dir = hf_constants.HF_HUB_CACHE
-            repo_cache = Path(cache_dir) / ("models--" + default_model_id.replace("/", "--"))
-            if repo_cache.exists():
-                has_model_files = (
-                    any(repo_cache.rglob("*.bin")) or
-                    any(repo_cache.rglob("*.safetensors")) or
-                    any(repo_cache.rglob("*.pt")) or
-                    any(repo_cache.rglob("*.pth")) or
-                    any(repo_cache.rglob("*.npz"))  # MLX models may use npz
-                )
-                model_downloaded = has_model_files
+        model_downloaded = await _get_model_downloaded(_default_model_id(backend_type))
     except Exception:
         pass
     
@@ -241,17 +365,14 @@ async def import_profile(
     # Validate file size (max 100MB)
     MAX_FILE_SIZE = 100 * 1024 * 1024  # 100MB
     
-    # Read file content
-    content = await file.read()
-    
-    if len(content) > MAX_FILE_SIZE:
+    if _upload_size(file) > MAX_FILE_SIZE:
         raise HTTPException(
             status_code=400,
             detail=f"File too large. Maximum size is {MAX_FILE_SIZE / (1024 * 1024)}MB"
         )
     
     try:
-        profile = await export_import.import_profile_from_zip(content, db)
+        profile = await export_import.import_profile_from_zip(file.file, db)
         return profile
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -310,26 +431,21 @@ async def add_profile_sample(
     _uploaded_ext = Path(file.filename or '').suffix.lower()
     file_suffix = _uploaded_ext if _uploaded_ext in _allowed_audio_exts else '.wav'
 
-    with tempfile.NamedTemporaryFile(suffix=file_suffix, delete=False) as tmp:
-        content = await file.read()
-        tmp.write(content)
-        tmp_path = tmp.name
-
-    try:
-        sample = await profiles.add_profile_sample(
-            profile_id,
-            tmp_path,
-            reference_text,
-            db,
-        )
-        return sample
-    except ValueError as e:
-        raise HTTPException(status_code=400, detail=str(e))
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to process audio file: {str(e)}")
-    finally:
-        # Clean up temp file
-        Path(tmp_path).unlink(missing_ok=True)
+    content_hash = hashlib.blake2b(digest_size=16)
+    async with _spooled_upload(file, file_suffix, content_hash) as tmp_path:
+        try:
+            sample = await profiles.add_profile_sample(
+                profile_id,
+                tmp_path,
+                reference_text,
+                db,
+                content_hash=content_hash.hexdigest(),
+            )
+            return sample
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=f"Failed to process audio file: {str(e)}")
 
 
 @app.get("/profiles/{profile_id}/samples", response_model=List[models.ProfileSampleResponse])
@@ -374,19 +490,12 @@ async def upload_profile_avatar(
 ):
     """Upload or update avatar image for a profile."""
     # Save uploaded file to temp location
-    with tempfile.NamedTemporaryFile(delete=False, suffix=Path(file.filename).suffix) as tmp:
-        content = await file.read()
-        tmp.write(content)
-        tmp_path = tmp.name
-
-    try:
-        profile = await profiles.upload_avatar(profile_id, tmp_path, db)
-        return profile
-    except ValueError as e:
-        raise HTTPException(status_code=400, detail=str(e))
-    finally:
-        # Clean up temp file
-        Path(tmp_path).unlink(missing_ok=True)
+    async with _spooled_upload(file, Path(file.filename).suffix) as tmp_path:
+        try:
+            profile = await profiles.upload_avatar(profile_id, tmp_path, db)
+            return profile
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
 
 
 @app.get("/profiles/{profile_id}/avatar")
@@ -403,10 +512,9 @@ async def get_profile_avatar(
         raise HTTPException(status_code=404, detail="No avatar found for this profile")
 
     avatar_path = Path(profile.avatar_path)
-    if not avatar_path.exists():
-        raise HTTPException(status_code=404, detail="Avatar file not found")
+    stat_result = _stat_or_404(avatar_path, "Avatar file not found")
 
-    return FileResponse(avatar_path)
+    return FileResponse(avatar_path, stat_result=stat_result)
 
 
 @app.delete("/profiles/{profile_id}/avatar")
@@ -434,17 +542,15 @@ async def export_profile(
             raise HTTPException(status_code=404, detail="Profile not found")
         
         # Export to ZIP
-        zip_bytes = export_import.export_profile_to_zip(profile_id, db)
+        zip_stream = export_import.iter_profile_zip(profile_id, db)
         
         # Create safe filename
-        safe_name = "".join(c for c in profile.name if c.isalnum() or c in (' ', '-', '_')).strip()
-        if not safe_name:
-            safe_name = "profile"
+        safe_name = _safe_filename(profile.name, "profile")
         filename = f"profile-{safe_name}.voicebox.zip"
         
         # Return as streaming response
         return StreamingResponse(
-            io.BytesIO(zip_bytes),
+            zip_stream,
             media_type="application/zip",
             headers={
                 "Content-Disposition": _safe_content_disposition("attachment", filename)
@@ -586,7 +692,7 @@ async def generate_speech(
 ):
     """Generate speech from text using a voice profile."""
     task_manager = get_task_manager()
-    generation_id = str(uuid.uuid4())
+    generation_id = str(database.uuid7())
 
     try:
         # Start tracking generation
@@ -681,7 +787,7 @@ async def generate_speech(
         audio_path = config.get_generations_dir() / f"{generation_id}.wav"
 
         from .utils.audio import save_audio
-        save_audio(audio, str(audio_path), sample_rate)
+        await asyncio.to_thread(save_audio, audio, str(audio_path), sample_rate)
 
         # Create history entry
         generation = await history.create_generation(
@@ -759,24 +865,30 @@ async def stream_speech(
 
     voice_prompt = await profiles.create_voice_prompt_for_profile(data.profile_id, db)
 
-    audio, sample_rate = await tts_model.generate(
+    # Generate sentence by sentence so playback can start after the first
+    # one. The first chunk is produced before the response starts, so model
+    # errors still surface as an HTTP error and its sample rate sets the header.
+    chunks = tts.generate_stream(
+        tts_model,
         data.text,
         voice_prompt,
         data.language,
         data.seed,
         data.instruct,
     )
+    first_audio, sample_rate = await chunks.__anext__()
 
-    wav_bytes = tts.audio_to_wav_bytes(audio, sample_rate)
-
-    async def _wav_stream():
-        # Yield in chunks so large responses don't block the event loop
-        chunk_size = 64 * 1024  # 64 KB
-        for i in range(0, len(wav_bytes), chunk_size):
-            yield wav_bytes[i : i + chunk_size]
+    async def _wav_frames():
+        try:
+            yield tts.wav_stream_header(sample_rate)
+            yield tts.audio_to_pcm16_bytes(first_audio)
+            async for audio, _ in chunks:
+                yield tts.audio_to_pcm16_bytes(audio)
+        finally:
+            await chunks.aclose()
 
     return StreamingResponse(
-        _wav_stream(),
+        _wav_frames(),
         media_type="audio/wav",
         headers={"Content-Disposition": 'attachment; filename="speech.wav"'},
     )
@@ -792,6 +904,8 @@ async def list_history(
     search: Optional[str] = None,
     limit: int = 50,
     offset: int = 0,
+    cursor_created_at: Optional[datetime] = None,
+    cursor_id: Optional[str] = None,
     db: Session = Depends(get_db),
 ):
     """List generation history with optional filters."""
@@ -800,6 +914,8 @@ async def list_history(
         search=search,
         limit=limit,
         offset=offset,
+        cursor_created_at=cursor_created_at,
+        cursor_id=cursor_id,
     )
     return await history.list_generations(query, db)
 
@@ -819,17 +935,14 @@ async def import_generation(
     # Validate file size (max 50MB)
     MAX_FILE_SIZE = 50 * 1024 * 1024  # 50MB
     
-    # Read file content
-    content = await file.read()
-    
-    if len(content) > MAX_FILE_SIZE:
+    if _upload_size(file) > MAX_FILE_SIZE:
         raise HTTPException(
             status_code=400,
             detail=f"File too large. Maximum size is {MAX_FILE_SIZE / (1024 * 1024)}MB"
         )
     
     try:
-        result = await export_import.import_generation_from_zip(content, db)
+        result = await export_import.import_generation_from_zip(file.file, db)
         return result
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -837,8 +950,11 @@ async def import_generation(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+# Endpoints that only read the database and stat files are plain functions:
+# the SQLAlchemy session is synchronous, so FastAPI runs them in its
+# threadpool instead of blocking the event loop.
 @app.get("/history/{generation_id}", response_model=models.HistoryResponse)
-async def get_generation(
+def get_generation(
     generation_id: str,
     db: Session = Depends(get_db),
 ):
@@ -885,29 +1001,28 @@ async def delete_generation(
 
 
 @app.get("/history/{generation_id}/export")
-async def export_generation(
+def export_generation(
     generation_id: str,
     db: Session = Depends(get_db),
 ):
     """Export a generation as a ZIP archive."""
     try:
-        # Get generation to create filename
-        generation = db.query(DBGeneration).filter_by(id=generation_id).first()
-        if not generation:
+        # One query for the filename and the archive manifest
+        row = export_import.get_generation_with_profile(generation_id, db)
+        if not row:
             raise HTTPException(status_code=404, detail="Generation not found")
+        generation, profile = row
         
         # Export to ZIP
-        zip_bytes = export_import.export_generation_to_zip(generation_id, db)
+        zip_stream = export_import.iter_generation_zip(generation, profile)
         
         # Create safe filename from text
-        safe_text = "".join(c for c in generation.text[:30] if c.isalnum() or c in (' ', '-', '_')).strip()
-        if not safe_text:
-            safe_text = "generation"
+        safe_text = _safe_filename(generation.text, "generation", limit=30)
         filename = f"generation-{safe_text}.voicebox.zip"
         
         # Return as streaming response
         return StreamingResponse(
-            io.BytesIO(zip_bytes),
+            zip_stream,
             media_type="application/zip",
             headers={
                 "Content-Disposition": _safe_content_disposition("attachment", filename)
@@ -920,23 +1035,20 @@ async def export_generation(
 
 
 @app.get("/history/{generation_id}/export-audio")
-async def export_generation_audio(
+def export_generation_audio(
     generation_id: str,
     db: Session = Depends(get_db),
 ):
     """Export only the audio file from a generation."""
-    generation = db.query(DBGeneration).filter_by(id=generation_id).first()
+    generation = db.get(DBGeneration, generation_id)
     if not generation:
         raise HTTPException(status_code=404, detail="Generation not found")
     
     audio_path = Path(generation.audio_path)
-    if not audio_path.exists():
-        raise HTTPException(status_code=404, detail="Audio file not found")
+    stat_result = _stat_or_404(audio_path, "Audio file not found")
     
     # Create safe filename from text
-    safe_text = "".join(c for c in generation.text[:30] if c.isalnum() or c in (' ', '-', '_')).strip()
-    if not safe_text:
-        safe_text = "generation"
+    safe_text = _safe_filename(generation.text, "generation", limit=30)
     filename = f"{safe_text}.wav"
     
     return FileResponse(
@@ -944,7 +1056,8 @@ async def export_generation_audio(
         media_type="audio/wav",
         headers={
             "Content-Disposition": _safe_content_disposition("attachment", filename)
-        }
+        },
+        stat_result=stat_result,
     )
 
 
@@ -959,62 +1072,55 @@ async def transcribe_audio(
 ):
     """Transcribe audio file to text."""
     # Save uploaded file to temporary location
-    with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tmp:
-        content = await file.read()
-        tmp.write(content)
-        tmp_path = tmp.name
-    
-    try:
-        # Get audio duration
-        from .utils.audio import load_audio
-        audio, sr = load_audio(tmp_path)
-        duration = len(audio) / sr
+    async with _spooled_upload(file, ".wav") as tmp_path:
+        try:
+            # Get audio duration
+            from .utils.audio import load_audio
+            audio, sr = await asyncio.to_thread(load_audio, tmp_path)
+            duration = len(audio) / sr
         
-        # Transcribe
-        whisper_model = transcribe.get_whisper_model()
+            # Transcribe
+            whisper_model = transcribe.get_whisper_model()
 
-        # Check if Whisper model is downloaded (uses default size "base")
-        model_size = whisper_model.model_size
-        model_name = f"openai/whisper-{model_size}"
+            # Check if Whisper model is downloaded (uses default size "base")
+            model_size = whisper_model.model_size
+            model_name = f"openai/whisper-{model_size}"
 
-        # Check if model is cached
-        from huggingface_hub import constants as hf_constants
-        repo_cache = Path(hf_constants.HF_HUB_CACHE) / ("models--" + model_name.replace("/", "--"))
-        if not repo_cache.exists():
-            # Start download in background
-            progress_model_name = f"whisper-{model_size}"
+            # Check if model is cached
+            from huggingface_hub import constants as hf_constants
+            repo_cache = Path(hf_constants.HF_HUB_CACHE) / ("models--" + model_name.replace("/", "--"))
+            if not repo_cache.exists():
+                # Start download in background
+                progress_model_name = f"whisper-{model_size}"
 
-            async def download_whisper_background():
-                try:
-                    await whisper_model.load_model_async(model_size)
-                except Exception as e:
-                    get_task_manager().error_download(progress_model_name, str(e))
+                async def download_whisper_background():
+                    try:
+                        await whisper_model.load_model_async(model_size)
+                    except Exception as e:
+                        get_task_manager().error_download(progress_model_name, str(e))
 
-            get_task_manager().start_download(progress_model_name)
-            asyncio.create_task(download_whisper_background())
+                get_task_manager().start_download(progress_model_name)
+                asyncio.create_task(download_whisper_background())
 
-            # Return 202 Accepted
-            raise HTTPException(
-                status_code=202,
-                detail={
-                    "message": f"Whisper model {model_size} is being downloaded. Please wait and try again.",
-                    "model_name": progress_model_name,
-                    "downloading": True
-                }
-            )
+                # Return 202 Accepted
+                raise HTTPException(
+                    status_code=202,
+                    detail={
+                        "message": f"Whisper model {model_size} is being downloaded. Please wait and try again.",
+                        "model_name": progress_model_name,
+                        "downloading": True
+                    }
+                )
 
-        text = await whisper_model.transcribe(tmp_path, language)
+            text = await whisper_model.transcribe(tmp_path, language)
         
-        return models.TranscriptionResponse(
-            text=text,
-            duration=duration,
-        )
+            return models.TranscriptionResponse(
+                text=text,
+                duration=duration,
+            )
         
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        # Clean up temp file
-        Path(tmp_path).unlink(missing_ok=True)
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=str(e))
 
 
 # ============================================
@@ -1201,9 +1307,7 @@ async def export_story_audio(
             raise HTTPException(status_code=400, detail="Story has no audio items")
         
         # Create safe filename
-        safe_name = "".join(c for c in story.name if c.isalnum() or c in (' ', '-', '_')).strip()
-        if not safe_name:
-            safe_name = "story"
+        safe_name = _safe_filename(story.name, "story")
         filename = f"{safe_name}.wav"
         
         # Return as streaming response
@@ -1225,25 +1329,18 @@ async def export_story_audio(
 # ============================================
 
 @app.get("/audio/{generation_id}")
-async def get_audio(generation_id: str, db: Session = Depends(get_db)):
+def get_audio(generation_id: str, db: Session = Depends(get_db)):
     """Serve generated audio file."""
-    generation = await history.get_generation(generation_id, db)
+    generation = db.get(DBGeneration, generation_id)
     if not generation:
         raise HTTPException(status_code=404, detail="Generation not found")
     
     audio_path = Path(generation.audio_path)
-    if not audio_path.exists():
-        raise HTTPException(status_code=404, detail="Audio file not found")
-    
-    return FileResponse(
-        audio_path,
-        media_type="audio/wav",
-        filename=f"generation_{generation_id}.wav",
-    )
+    return _audio_file_response(audio_path, f"generation_{generation_id}.wav")
 
 
 @app.get("/samples/{sample_id}")
-async def get_sample_audio(sample_id: str, db: Session = Depends(get_db)):
+def get_sample_audio(sample_id: str, db: Session = Depends(get_db)):
     """Serve profile sample audio file."""
     from .database import ProfileSample as DBProfileSample
     
@@ -1252,14 +1349,7 @@ async def get_sample_audio(sample_id: str, db: Session = Depends(get_db)):
         raise HTTPException(status_code=404, detail="Sample not found")
     
     audio_path = Path(sample.audio_path)
-    if not audio_path.exists():
-        raise HTTPException(status_code=404, detail="Audio file not found")
-    
-    return FileResponse(
-        audio_path,
-        media_type="audio/wav",
-        filename=f"sample_{sample_id}.wav",
-    )
+    return _audio_file_response(audio_path, f"sample_{sample_id}.wav")
 
 
 # ============================================
@@ -1760,6 +1850,10 @@ async def delete_model(model_name: str):
                 detail=f"Failed to delete model cache directory: {str(e)}"
             )
         
+        # Don't let /health report the deleted model from its cached scan
+        global _model_downloaded_cache
+        _model_downloaded_cache = (0.0, None, None)
+        
         return {"message": f"Model {model_name} deleted successfully"}
         
     except HTTPException:
@@ -1773,6 +1867,7 @@ async def clear_cache():
     """Clear all voice prompt caches (memory and disk)."""
     try:
         deleted_count = clear_voice_prompt_cache()
+        profiles.forget_voice_prompts()
         return {
             "message": f"Voice prompt cache cleared successfully",
             "files_deleted": deleted_count,
@@ -1853,6 +1948,8 @@ async def get_active_tasks():
 
 def _get_gpu_status() -> str:
     """Get GPU availability status."""
+    import torch
+
     backend_type = get_backend_type()
     if torch.cuda.is_available():
         return f"CUDA ({torch.cuda.get_device_name(0)})"
@@ -1863,6 +1960,16 @@ def _get_gpu_status() -> str:
     return "None (CPU only)"
 
 
+def _warm_up_backends():
+    """Import torch, report the GPU and create the default backend instances."""
+    try:
+        print(f"GPU available: {_get_gpu_status()}")
+        tts.get_tts_model()
+        transcribe.get_whisper_model()
+    except Exception as e:
+        print(f"Warning: Could not pre-load backends: {e}")
+
+
 @app.on_event("startup")
 async def startup_event():
     """Run on application startup."""
@@ -1871,7 +1978,13 @@ async def startup_event():
     print(f"Database initialized at {database._db_path}")
     backend_type = get_backend_type()
     print(f"Backend: {backend_type.upper()}")
-    print(f"GPU available: {_get_gpu_status()}")
+
+    # Importing torch takes seconds; do it (and the GPU probe) off the event
+    # loop so the server starts answering requests right away. Creating the
+    # default TTS/STT backends here too means the first /generate or
+    # /transcribe doesn't import the backend module on the event loop.
+    global _warm_up_future
+    _warm_up_future = asyncio.get_running_loop().run_in_executor(None, _warm_up_backends)
 
     # Initialize progress manager with main event loop for thread-safe operations
     try:
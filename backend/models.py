@@ -83,6 +83,9 @@ class HistoryQuery(BaseModel):
     search: Optional[str] = None
     limit: int = Field(default=50, ge=1, le=100)
     offset: int = Field(default=0, ge=0)
+    # Keyset cursor: the last item of the previous page (takes precedence over offset)
+    cursor_created_at: Optional[datetime] = None
+    cursor_id: Optional[str] = None
 
 
 class HistoryResponse(BaseModel):
@@ -106,6 +109,9 @@ class HistoryListResponse(BaseModel):
     """Response model for history list."""
     items: List[HistoryResponse]
     total: int
+    # Cursor for the next page (None when this is the last page)
+    next_cursor_created_at: Optional[datetime] = None
+    next_cursor_id: Optional[str] = None
 
 
 class TranscriptionRequest(BaseModel):
@@ -2,7 +2,10 @@
 Platform detection for backend selection.
 """
 
+import importlib.util
 import platform
+import sys
+from functools import lru_cache
 from typing import Literal
 
 
@@ -33,3 +36,40 @@ def get_backend_type() -> Literal["mlx", "pytorch"]:
             # Fall through to PyTorch.
             return "pytorch"
     return "pytorch"
+
+
+def _has_module(name: str) -> bool:
+    """Check if a module is installed without importing it."""
+    return importlib.util.find_spec(name) is not None
+
+
+@lru_cache(maxsize=1)
+def get_torch_device():
+    """
+    Get the best available PyTorch device, probed once per process.
+
+    Returns:
+        "cuda", "xpu" (Intel Arc via IPEX), a torch_directml device on
+        Windows, or "cpu". Apple Silicon is handled by the MLX backend.
+    """
+    import torch
+
+    if torch.cuda.is_available():
+        return "cuda"
+    # Intel Arc / Intel Xe GPU via intel-extension-for-pytorch (IPEX)
+    if sys.platform in ("linux", "win32") and _has_module("intel_extension_for_pytorch"):
+        try:
+            import intel_extension_for_pytorch  # noqa: F401
+            if hasattr(torch, 'xpu') and torch.xpu.is_available():
+                return "xpu"
+        except ImportError:
+            pass
+    # Any GPU on Windows via DirectML (torch-directml)
+    if sys.platform == "win32" and _has_module("torch_directml"):
+        try:
+            import torch_directml
+            if torch_directml.device_count() > 0:
+                return torch_directml.device(0)
+        except ImportError:
+            pass
+    return "cpu"
@@ -2,6 +2,7 @@
 Voice profile management module.
 """
 
+from collections import OrderedDict
 from typing import List, Optional
 from datetime import datetime
 import uuid
@@ -32,6 +33,23 @@ def _get_profiles_dir() -> Path:
     return config.get_profiles_dir()
 
 
+# Voice prompts per profile, keyed on the TTS model and the profile's samples,
+# so repeat generations skip re-hashing (and re-combining) the sample audio
+_voice_prompt_cache: "OrderedDict[tuple, dict]" = OrderedDict()
+_VOICE_PROMPT_CACHE_SIZE = 64
+
+
+def forget_voice_prompts(profile_id: Optional[str] = None) -> None:
+    """
+    Drop cached voice prompts.
+
+    Args:
+        profile_id: Profile to forget (default: all profiles)
+    """
+    for key in [k for k in _voice_prompt_cache if profile_id is None or k[0] == profile_id]:
+        del _voice_prompt_cache[key]
+
+
 async def create_profile(
     data: VoiceProfileCreate,
     db: Session,
@@ -72,6 +90,7 @@ async def add_profile_sample(
     audio_path: str,
     reference_text: str,
     db: Session,
+    content_hash: Optional[str] = None,
 ) -> ProfileSampleResponse:
     """
     Add a sample to a voice profile.
@@ -81,6 +100,9 @@ async def add_profile_sample(
         audio_path: Path to temporary audio file
         reference_text: Transcript of audio
         db: Database session
+        content_hash: Digest of the uploaded file; if the profile already has
+            a sample with the same digest and transcript, it is returned
+            instead of decoding and storing the file again
         
     Returns:
         Created sample
@@ -90,6 +112,16 @@ async def add_profile_sample(
     if not profile:
         raise ValueError(f"Profile {profile_id} not found")
     
+    # Re-upload (e.g. a client retry) of a sample the profile already has
+    if content_hash:
+        existing = db.query(DBProfileSample).filter_by(
+            profile_id=profile_id,
+            content_hash=content_hash,
+            reference_text=reference_text,
+        ).first()
+        if existing and Path(existing.audio_path).exists():
+            return ProfileSampleResponse.model_validate(existing)
+    
     # Validate audio
     is_valid, error_msg = validate_reference_audio(audio_path)
     if not is_valid:
@@ -111,6 +143,7 @@ async def add_profile_sample(
         profile_id=profile_id,
         audio_path=str(dest_path),
         reference_text=reference_text,
+        content_hash=content_hash,
     )
     
     db.add(db_sample)
@@ -124,6 +157,7 @@ async def add_profile_sample(
     # Invalidate combined audio cache for this profile
     # Since a new sample was added, any cached combined audio is now stale
     clear_profile_cache(profile_id)
+    forget_voice_prompts(profile_id)
     
     return ProfileSampleResponse.model_validate(db_sample)
 
@@ -248,6 +282,7 @@ async def delete_profile(
     
     # Clean up combined audio cache files for this profile
     clear_profile_cache(profile_id)
+    forget_voice_prompts(profile_id)
     
     return True
 
@@ -285,6 +320,7 @@ async def delete_profile_sample(
     # Invalidate combined audio cache for this profile
     # Since the sample set changed, any cached combined audio is now stale
     clear_profile_cache(profile_id)
+    forget_voice_prompts(profile_id)
     
     return True
 
@@ -319,6 +355,7 @@ async def update_profile_sample(
     # Invalidate combined audio cache for this profile
     # Since the reference text changed, cache keys and combined text are now stale
     clear_profile_cache(profile_id)
+    forget_voice_prompts(profile_id)
     
     return ProfileSampleResponse.model_validate(sample)
 
@@ -339,14 +376,48 @@ async def create_voice_prompt_for_profile(
     Returns:
         Voice prompt dictionary
     """
-    # Get all samples for profile
-    samples = db.query(DBProfileSample).filter_by(profile_id=profile_id).all()
+    # Get all samples for profile. Only the columns the prompt (and its cache
+    # key) depend on are loaded: on a cache hit nothing else is needed, so
+    # skipping ORM object construction keeps repeat /generate calls cheap.
+    samples = db.query(
+        DBProfileSample.id,
+        DBProfileSample.audio_path,
+        DBProfileSample.reference_text,
+    ).filter_by(profile_id=profile_id).all()
 
     if not samples:
         raise ValueError(f"No samples found for profile {profile_id}")
 
     tts_model = get_tts_model()
 
+    # Prompts depend on the loaded model as well as the samples
+    cache_key = (
+        profile_id,
+        id(tts_model),
+        getattr(tts_model, "_current_model_size", None),
+        tuple(tuple(s) for s in samples),
+    )
+    if use_cache and cache_key in _voice_prompt_cache:
+        _voice_prompt_cache.move_to_end(cache_key)
+        return _voice_prompt_cache[cache_key]
+
+    voice_prompt = await _build_voice_prompt(profile_id, samples, tts_model, use_cache)
+
+    if use_cache:
+        _voice_prompt_cache[cache_key] = voice_prompt
+        if len(_voice_prompt_cache) > _VOICE_PROMPT_CACHE_SIZE:
+            _voice_prompt_cache.popitem(last=False)
+
+    return voice_prompt
+
+
+async def _build_voice_prompt(
+    profile_id: str,
+    samples: list,
+    tts_model,
+    use_cache: bool,
+) -> dict:
+    """Build a voice prompt from (id, audio_path, reference_text) sample rows, combining them if several."""
     if len(samples) == 1:
         # Single sample - use directly
         sample = samples[0]
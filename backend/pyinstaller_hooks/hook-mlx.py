@@ -0,0 +1,12 @@
+"""
+PyInstaller hook for MLX.
+
+Bundles the native libraries and Metal shader libraries MLX needs at
+runtime. Without the .metallib files MLX raises OSError inside the bundle.
+"""
+
+from PyInstaller.utils.hooks import collect_data_files, collect_dynamic_libs
+
+binaries = collect_dynamic_libs('mlx')
+datas = [d for d in collect_data_files('mlx') if d[0].endswith(('.metallib', '.json'))]
+hiddenimports = ['mlx.core', 'mlx.nn', 'mlx.utils']
@@ -0,0 +1,17 @@
+"""
+PyInstaller hook for mlx-audio.
+
+mlx_audio.tts.load / mlx_audio.stt.load import the model architecture by
+name at runtime, so only the architectures the MLX backend loads are
+collected (Qwen3-TTS and Whisper) instead of every model in the package.
+"""
+
+from PyInstaller.utils.hooks import collect_data_files, collect_dynamic_libs, collect_submodules
+
+binaries = collect_dynamic_libs('mlx_audio')
+datas = collect_data_files('mlx_audio')
+hiddenimports = (
+    ['mlx_audio.tts', 'mlx_audio.tts.utils', 'mlx_audio.stt', 'mlx_audio.stt.utils']
+    + collect_submodules('mlx_audio.tts.models.qwen3_tts')
+    + collect_submodules('mlx_audio.stt.models.whisper')
+)
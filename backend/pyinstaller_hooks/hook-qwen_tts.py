@@ -0,0 +1,15 @@
+"""
+PyInstaller hook for qwen-tts.
+
+Collects the inference entry points and the model definitions under
+qwen_tts.core (registered with transformers at runtime), but not the CLI.
+"""
+
+from PyInstaller.utils.hooks import collect_data_files, collect_submodules, copy_metadata
+
+datas = collect_data_files('qwen_tts') + copy_metadata('qwen-tts')
+hiddenimports = [
+    'qwen_tts.inference',
+    'qwen_tts.inference.qwen3_tts_model',
+    'qwen_tts.inference.qwen3_tts_tokenizer',
+] + collect_submodules('qwen_tts.core')
@@ -78,12 +78,15 @@ if __name__ == "__main__":
         logger.info("Database initialized successfully")
 
         logger.info(f"Starting uvicorn server on {args.host}:{args.port}...")
-        uvicorn.run(
+        # Run uvicorn.Server directly: uvicorn.run() also sets up reload and
+        # multi-worker supervision, which the bundled server never uses
+        server = uvicorn.Server(uvicorn.Config(
             app,
             host=args.host,
             port=args.port,
             log_level="info",
-        )
+        ))
+        server.run()
     except Exception as e:
         logger.error(f"Server startup failed: {e}", exc_info=True)
         sys.exit(1)
@@ -6,12 +6,20 @@ Sets up import paths and fixtures for testing.
 
 import sys
 from pathlib import Path
+from unittest.mock import patch
+
+import pytest
 
 # Add backend directory to path so imports work correctly
 backend_dir = Path(__file__).parent.parent.absolute()
 if str(backend_dir) not in sys.path:
     sys.path.insert(0, str(backend_dir))
 
+try:
+    from backend import database
+except ImportError:
+    import database
+
 # Configure pytest-asyncio
 pytest_plugins = ('pytest_asyncio',)
 
@@ -21,3 +29,15 @@ def pytest_configure(config):
     config.addinivalue_line(
         "markers", "asyncio: mark test as an async test"
     )
+
+
+@pytest.fixture
+def db(tmp_path):
+    """Session on a fresh database in tmp_path, seeded with voice profile p1."""
+    with patch.object(database.config, "get_db_path", return_value=tmp_path / "voicebox.db"):
+        database.init_db()
+    session = database.SessionLocal()
+    session.add(database.VoiceProfile(id="p1", name="Voice", language="en"))
+    session.commit()
+    yield session
+    session.close()
@@ -0,0 +1,56 @@
+"""
+Unit tests for audio utilities.
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import soundfile as sf
+
+# Add parent directory to path to enable imports when running from backend/tests
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+try:
+    from backend.utils.audio import normalize_audio, save_audio
+except ImportError:
+    from utils.audio import normalize_audio, save_audio
+
+
+def _reference_normalize(audio, target_db=-20.0, peak_limit=0.85):
+    audio = audio.astype(np.float32)
+    rms = np.sqrt(np.mean(audio**2))
+    if rms > 0:
+        audio = audio * (10**(target_db / 20) / rms)
+    return np.clip(audio, -peak_limit, peak_limit)
+
+
+def test_normalize_matches_rms_gain_and_peak_limit():
+    audio = np.random.default_rng(0).standard_normal(24000).astype(np.float64)
+
+    result = normalize_audio(audio)
+
+    assert result.dtype == np.float32
+    np.testing.assert_allclose(result, _reference_normalize(audio), rtol=1e-4, atol=1e-6)
+
+
+def test_normalize_copy_false_reuses_float32_buffer():
+    audio = np.random.default_rng(1).standard_normal(1000).astype(np.float32)
+    original = audio.copy()
+
+    assert normalize_audio(original) is not original
+    assert np.array_equal(original, audio)
+    assert normalize_audio(audio, copy=False) is audio
+
+
+def test_normalize_silence_is_unchanged():
+    assert np.array_equal(normalize_audio(np.zeros(10, dtype=np.float32)), np.zeros(10))
+
+
+def test_save_audio_writes_pcm16_atomically(tmp_path):
+    path = tmp_path / "out.wav"
+
+    save_audio(np.zeros(2400, dtype=np.float32), str(path), 24000)
+
+    assert sf.info(str(path)).subtype == "PCM_16"
+    assert list(tmp_path.iterdir()) == [path]
@@ -0,0 +1,37 @@
+"""
+Unit tests for backend instance creation.
+"""
+
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from unittest.mock import patch
+
+# Add parent directory to path to enable imports when running from backend/tests
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+try:
+    from backend import backends
+except ImportError:
+    import backends
+
+
+def test_concurrent_lookups_create_one_backend():
+    created = []
+
+    def create(engine, model_type):
+        time.sleep(0.05)  # widen the race window
+        created.append(object())
+        return created[-1]
+
+    backends.reset_backends()
+    try:
+        with patch.object(backends, "_create_tts_backend", side_effect=create):
+            with ThreadPoolExecutor(max_workers=4) as pool:
+                results = list(pool.map(lambda _: backends.get_tts_backend("qwen"), range(4)))
+    finally:
+        backends.reset_backends()
+
+    assert len(created) == 1
+    assert all(result is created[0] for result in results)
@@ -0,0 +1,12 @@
+"""
+Sanity checks for the PyInstaller build script.
+"""
+
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).parent.parent
+
+
+def test_single_build_script():
+    assert sorted(BACKEND_DIR.glob("build_binary*.py")) == [BACKEND_DIR / "build_binary.py"]
+    assert (BACKEND_DIR / "build_binary.py").read_text().count("def build_server") == 1
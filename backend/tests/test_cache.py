@@ -0,0 +1,91 @@
+"""
+Unit tests for voice prompt caching.
+"""
+
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+from unittest.mock import patch
+
+import pytest
+import torch
+
+# Add parent directory to path to enable imports when running from backend/tests
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+try:
+    from backend.utils import cache
+except ImportError:
+    from utils import cache
+
+
+try:
+    from qwen_tts.inference.qwen3_tts_model import VoiceClonePromptItem
+except ImportError:
+    # Same fields as qwen_tts' prompt item, for environments without qwen_tts
+    @dataclass
+    class VoiceClonePromptItem:
+        ref_code: Optional[torch.Tensor]
+        ref_spk_embedding: torch.Tensor
+        x_vector_only_mode: bool
+        icl_mode: bool
+        ref_text: Optional[str] = None
+
+
+@pytest.fixture
+def cache_dir(tmp_path):
+    cache._memory_cache.clear()
+    with patch.object(cache, "_get_cache_dir", return_value=tmp_path):
+        yield tmp_path
+    cache._memory_cache.clear()
+
+
+def test_tensor_prompt_roundtrips_through_safetensors(cache_dir):
+    pytest.importorskip("safetensors")
+    prompt = {"ref_code": torch.arange(6).reshape(2, 3), "ref_text": "hello", "items": [torch.ones(2), True]}
+
+    cache.cache_voice_prompt("key", prompt)
+    cache._memory_cache.clear()
+    loaded = cache.get_cached_voice_prompt("key")
+
+    assert (cache_dir / "key.safetensors").exists()
+    assert not (cache_dir / "key.prompt").exists()
+    assert torch.equal(loaded["ref_code"], prompt["ref_code"])
+    assert loaded["ref_text"] == "hello"
+    assert torch.equal(loaded["items"][0], torch.ones(2))
+    assert loaded["items"][1] is True
+
+
+def test_unsupported_prompt_falls_back_to_torch_save(cache_dir):
+    prompt = {0: torch.ones(2)}
+
+    cache.cache_voice_prompt("key", prompt)
+    cache._memory_cache.clear()
+
+    assert (cache_dir / "key.prompt").exists()
+    assert not (cache_dir / "key.safetensors").exists()
+    assert torch.equal(cache.get_cached_voice_prompt("key")[0], torch.ones(2))
+
+
+def test_qwen_prompt_items_roundtrip_through_safetensors(cache_dir):
+    pytest.importorskip("safetensors")
+    prompt = [VoiceClonePromptItem(
+        ref_code=torch.arange(8).reshape(4, 2),
+        ref_spk_embedding=torch.ones(16),
+        x_vector_only_mode=False,
+        icl_mode=True,
+        ref_text="hello",
+    )]
+
+    cache.cache_voice_prompt("key", prompt)
+    cache._memory_cache.clear()
+    loaded = cache.get_cached_voice_prompt("key")
+
+    assert (cache_dir / "key.safetensors").exists()
+    assert not (cache_dir / "key.prompt").exists()
+    assert isinstance(loaded, list) and isinstance(loaded[0], VoiceClonePromptItem)
+    assert torch.equal(loaded[0].ref_code, prompt[0].ref_code)
+    assert torch.equal(loaded[0].ref_spk_embedding, prompt[0].ref_spk_embedding)
+    assert loaded[0].icl_mode is True and loaded[0].x_vector_only_mode is False
+    assert loaded[0].ref_text == "hello"
@@ -0,0 +1,32 @@
+"""
+Unit tests for data directory configuration.
+"""
+
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+# Add parent directory to path to enable imports when running from backend/tests
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+try:
+    from backend import config
+except ImportError:
+    import config
+
+
+def test_directories_created_once_per_data_dir(tmp_path):
+    original = config.get_data_dir()
+    try:
+        config.set_data_dir(tmp_path / "a")
+        assert config.get_cache_dir() == tmp_path / "a" / "cache"
+        assert config.get_cache_dir().is_dir()
+
+        with patch.object(Path, "mkdir", side_effect=AssertionError("mkdir again")):
+            config.get_cache_dir()
+
+        config.set_data_dir(tmp_path / "b")
+        assert config.get_cache_dir().is_dir()
+    finally:
+        config.CONFIG.data_dir = original
+        config._ensure_dir.cache_clear()
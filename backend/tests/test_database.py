@@ -0,0 +1,210 @@
+"""
+Unit tests for database initialization and migrations.
+"""
+
+import sys
+import time
+import uuid
+from pathlib import Path
+from unittest.mock import patch
+
+from sqlalchemy import text
+
+# Add parent directory to path to enable imports when running from backend/tests
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+try:
+    from backend import database
+except ImportError:
+    import database
+
+
+def _user_version():
+    with database.engine.connect() as conn:
+        return conn.execute(text("PRAGMA user_version")).scalar()
+
+
+def test_warm_start_skips_migrations_and_ddl(tmp_path):
+    with patch.object(database.config, "get_db_path", return_value=tmp_path / "voicebox.db"):
+        database.init_db()
+        assert _user_version() == database.CURRENT_SCHEMA_VERSION
+
+        with patch("sqlalchemy.inspect", side_effect=AssertionError("inspected")), \
+                patch.object(database.Base.metadata, "create_all", side_effect=AssertionError("created")):
+            database.init_db()
+
+    assert _user_version() == database.CURRENT_SCHEMA_VERSION
+
+
+def test_legacy_database_is_migrated(tmp_path):
+    db_path = tmp_path / "voicebox.db"
+    with patch.object(database.config, "get_db_path", return_value=db_path):
+        database.init_db()
+        with database.engine.connect() as conn:
+            conn.execute(text("PRAGMA user_version = 0"))
+            conn.execute(text("DROP TABLE story_items"))
+            conn.execute(text("ALTER TABLE profiles DROP COLUMN avatar_path"))
+            conn.commit()
+
+        database.init_db()
+
+    with database.engine.connect() as conn:
+        columns = {row[1] for row in conn.execute(text("PRAGMA table_info(profiles)"))}
+    assert "avatar_path" in columns
+    assert _user_version() == database.CURRENT_SCHEMA_VERSION
+
+
+def test_position_migration_computes_start_times(tmp_path):
+    with patch.object(database.config, "get_db_path", return_value=tmp_path / "voicebox.db"):
+        database.init_db()
+        with database.engine.connect() as conn:
+            conn.execute(text("PRAGMA user_version = 0"))
+            conn.execute(text("DROP TABLE story_items"))
+            conn.execute(text("""
+                CREATE TABLE story_items (
+                    id VARCHAR PRIMARY KEY, story_id VARCHAR NOT NULL,
+                    generation_id VARCHAR NOT NULL, position INTEGER NOT NULL, created_at DATETIME
+                )
+            """))
+            for gen_id, duration in [("g1", 1.5), ("g2", 2.0), ("g3", 0.25)]:
+                conn.execute(
+                    text("INSERT INTO generations (id, profile_id, text, audio_path, duration) "
+                         "VALUES (:id, 'p', 't', 'a.wav', :duration)"),
+                    {"id": gen_id, "duration": duration},
+                )
+            for item_id, story_id, gen_id, position in [
+                ("a2", "s1", "g2", 1), ("a1", "s1", "g1", 0), ("a3", "s1", "g3", 2), ("b1", "s2", "g3", 0),
+            ]:
+                conn.execute(
+                    text("INSERT INTO story_items (id, story_id, generation_id, position) "
+                         "VALUES (:id, :story, :gen, :position)"),
+                    {"id": item_id, "story": story_id, "gen": gen_id, "position": position},
+                )
+            conn.commit()
+
+        database.init_db()
+
+    with database.engine.connect() as conn:
+        rows = dict(conn.execute(text("SELECT id, start_time_ms FROM story_items")).fetchall())
+    assert rows == {"a1": 0, "a2": 1700, "a3": 3900, "b1": 0}
+
+
+def test_connections_use_wal(tmp_path):
+    with patch.object(database.config, "get_db_path", return_value=tmp_path / "voicebox.db"):
+        database.init_db()
+
+    with database.engine.connect() as conn:
+        assert conn.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+        assert conn.execute(text("PRAGMA synchronous")).scalar() == 1
+
+
+def test_indexes_added_to_existing_tables(tmp_path):
+    with patch.object(database.config, "get_db_path", return_value=tmp_path / "voicebox.db"):
+        database.init_db()
+        with database.engine.connect() as conn:
+            conn.execute(text("PRAGMA user_version = 1"))
+            conn.execute(text("CREATE INDEX ix_generations_profile_id ON generations (profile_id)"))
+            conn.execute(text("DROP INDEX ix_generations_profile_created_at_id"))
+            conn.execute(text("DROP INDEX ix_story_items_story_track_time"))
+            conn.commit()
+
+        database.init_db()
+
+    with database.engine.connect() as conn:
+        indexes = {row[0] for row in conn.execute(text("SELECT name FROM sqlite_master WHERE type = 'index'"))}
+    assert {"ix_generations_profile_created_at_id", "ix_story_items_story_track_time"} <= indexes
+    assert "ix_generations_profile_id" not in indexes
+
+
+def test_existing_profiles_assigned_to_default_channel(tmp_path):
+    with patch.object(database.config, "get_db_path", return_value=tmp_path / "voicebox.db"):
+        database.init_db()
+        with database.engine.connect() as conn:
+            conn.execute(text("DELETE FROM audio_channels"))
+            conn.execute(text("INSERT INTO profiles (id, name, language) VALUES ('p1', 'One', 'en'), ('p2', 'Two', 'en')"))
+            conn.commit()
+
+        database.init_db()
+
+    with database.engine.connect() as conn:
+        channel_id = conn.execute(text("SELECT id FROM audio_channels WHERE is_default")).scalar()
+        mappings = conn.execute(text("SELECT profile_id, channel_id FROM profile_channel_mappings")).fetchall()
+    assert sorted(mappings) == [("p1", channel_id), ("p2", channel_id)]
+
+
+def test_search_index_backfilled_on_upgrade(tmp_path):
+    with patch.object(database.config, "get_db_path", return_value=tmp_path / "voicebox.db"):
+        database.init_db()
+        with database.engine.connect() as conn:
+            conn.execute(text("PRAGMA user_version = 3"))
+            conn.execute(text("DROP TABLE generations_fts"))
+            for trigger in ("insert", "delete", "update"):
+                conn.execute(text(f"DROP TRIGGER generations_fts_{trigger}"))
+            conn.execute(text("INSERT INTO generations (id, profile_id, text, audio_path, duration) "
+                              "VALUES ('g1', 'p', 'hello world', 'a.wav', 1.0)"))
+            conn.commit()
+
+        database.init_db()
+
+    assert database.generations_fts_enabled
+    with database.engine.connect() as conn:
+        rowids = conn.execute(text("SELECT rowid FROM generations_fts WHERE generations_fts MATCH 'world'")).all()
+    assert len(rowids) == 1
+
+
+def test_uuid7_is_time_ordered():
+    ids = []
+    for _ in range(3):
+        ids.append(database.uuid7())
+        time.sleep(0.002)
+
+    assert all(u.version == 7 and u.variant == uuid.RFC_4122 for u in ids)
+    assert [str(u) for u in ids] == sorted(str(u) for u in ids)
+
+
+def test_generations_rebuilt_with_seq_rowid(tmp_path):
+    with patch.object(database.config, "get_db_path", return_value=tmp_path / "voicebox.db"):
+        database.init_db()
+        with database.engine.connect() as conn:
+            conn.execute(text("PRAGMA user_version = 6"))
+            conn.execute(text("DROP TABLE generations"))
+            conn.execute(text("DROP TABLE generations_fts"))
+            conn.execute(text("""
+                CREATE TABLE generations (
+                    id VARCHAR PRIMARY KEY, profile_id VARCHAR NOT NULL, text TEXT NOT NULL,
+                    language VARCHAR, audio_path VARCHAR NOT NULL, duration FLOAT NOT NULL,
+                    seed INTEGER, instruct TEXT, engine VARCHAR, model_type VARCHAR, created_at DATETIME
+                )
+            """))
+            for i, text_ in enumerate(["alpha one", "beta two", "gamma three"]):
+                conn.execute(text("INSERT INTO generations (id, profile_id, text, audio_path, duration) "
+                                  "VALUES (:id, 'p', :text, 'a.wav', 1.0)"), {"id": f"g{i}", "text": text_})
+            conn.commit()
+
+        database.init_db()
+
+    assert database.generations_fts_enabled
+    with database.engine.connect() as conn:
+        rows = conn.execute(text("SELECT seq, rowid, id FROM generations ORDER BY seq")).all()
+        found = conn.execute(text(
+            "SELECT id FROM generations WHERE seq IN "
+            "(SELECT rowid FROM generations_fts WHERE generations_fts MATCH 'gamma')"
+        )).scalars().all()
+        indexes = {row[0] for row in conn.execute(text(
+            "SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = 'generations'"
+        ))}
+    assert [(seq, id_) for seq, _, id_ in rows] == [(1, "g0"), (2, "g1"), (3, "g2")]
+    assert all(seq == rowid for seq, rowid, _ in rows)
+    assert found == ["g2"]
+    assert {"ix_generations_created_at_id", "ix_generations_profile_created_at_id"} <= indexes
+
+
+def test_search_index_created_after_failed_attempt(tmp_path):
+    with patch.object(database.config, "get_db_path", return_value=tmp_path / "voicebox.db"):
+        with patch.object(database, "_create_generations_fts", return_value=False):
+            database.init_db()
+        assert not database.generations_fts_enabled
+
+        database.init_db()
+
+    assert database.generations_fts_enabled
@@ -0,0 +1,75 @@
+"""
+Unit tests for profile and generation ZIP export.
+"""
+
+import io
+import sys
+import zipfile
+from pathlib import Path
+
+import pytest
+from sqlalchemy import event
+
+# Add parent directory to path to enable imports when running from backend/tests
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+try:
+    from backend import database, export_import
+except ImportError:
+    import database
+    import export_import
+
+
+def test_profile_zip_is_streamed_with_stored_audio(db, tmp_path):
+    sample_path = tmp_path / "s1.wav"
+    sample_path.write_bytes(b"RIFF" + bytes(range(256)) * 8000)
+    db.add(database.ProfileSample(
+        id="s1", profile_id="p1", audio_path=str(sample_path), reference_text="hello",
+    ))
+    db.commit()
+
+    chunks = list(export_import.iter_profile_zip("p1", db))
+
+    assert len(chunks) > 1
+    with zipfile.ZipFile(io.BytesIO(b"".join(chunks))) as zip_file:
+        assert zip_file.testzip() is None
+        assert zip_file.namelist() == ["manifest.json", "samples/s1.wav", "samples.json"]
+        assert zip_file.getinfo("samples/s1.wav").compress_type == zipfile.ZIP_STORED
+        assert zip_file.read("samples/s1.wav").startswith(b"RIFF")
+
+
+def test_profile_zip_validates_before_streaming(db):
+    with pytest.raises(ValueError):
+        export_import.iter_profile_zip("missing", db)
+
+
+@pytest.mark.asyncio
+async def test_import_reads_from_file_object(db, tmp_path):
+    archive = tmp_path / "upload.zip"
+    with zipfile.ZipFile(archive, "w") as zip_file:
+        zip_file.writestr("samples.json", "{}")
+
+    with open(archive, "rb") as upload, pytest.raises(ValueError, match="manifest.json"):
+        await export_import.import_profile_from_zip(upload, db)
+
+
+def test_generation_zip_loads_generation_and_profile_in_one_query(db, tmp_path):
+    audio_path = tmp_path / "g1.wav"
+    audio_path.write_bytes(b"RIFF")
+    db.add(database.Generation(
+        id="g1", profile_id="p1", text="hi", language="en", audio_path=str(audio_path), duration=1.0,
+    ))
+    db.commit()
+    db.expunge_all()
+    statements = []
+    listener = lambda conn, cursor, statement, *args: statements.append(statement)
+    event.listen(database.engine, "before_cursor_execute", listener)
+    try:
+        generation, profile = export_import.get_generation_with_profile("g1", db)
+    finally:
+        event.remove(database.engine, "before_cursor_execute", listener)
+
+    assert len(statements) == 1
+    assert profile.name == "Voice"
+    with zipfile.ZipFile(io.BytesIO(b"".join(export_import.iter_generation_zip(generation, profile)))) as zip_file:
+        assert zip_file.namelist() == ["manifest.json", "audio/g1.wav"]
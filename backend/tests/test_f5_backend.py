@@ -33,10 +33,27 @@ import torch
 try:
     from backend.backends.f5_backend import F5TTSBackend
     from backend.backends import TTSBackend
+    from backend import config
+    from backend.platform_detect import get_torch_device
+    from backend.utils import cache
 except ImportError:
     # Fallback for running from within backend directory
     from backends.f5_backend import F5TTSBackend
     from backends import TTSBackend
+    import config
+    from platform_detect import get_torch_device
+    from utils import cache
+
+
+@pytest.fixture(autouse=True)
+def isolated_data_dir(tmp_path):
+    """Keep voice prompt caches written by these tests out of the source tree."""
+    original = config.get_data_dir()
+    config.set_data_dir(tmp_path)
+    cache._memory_cache.clear()
+    yield tmp_path
+    cache._memory_cache.clear()
+    config.CONFIG.data_dir = original
 
 
 @pytest.fixture
@@ -55,9 +72,10 @@ def mock_f5tts_model():
         t = np.linspace(0, duration, num_samples, dtype=np.float32)
         audio = (0.5 * np.sin(2 * np.pi * 440 * t)).astype(np.float32)
 
-        # Write to the output file
-        import soundfile as sf
-        sf.write(file_wave, audio, sample_rate)
+        # Write to the output file if requested
+        if file_wave is not None:
+            import soundfile as sf
+            sf.write(file_wave, audio, sample_rate)
 
         # Return values matching F5TTS API
         return audio, sample_rate, None
@@ -144,8 +162,8 @@ class TestF5TTSBackendInitialization:
 
     def test_device_detection(self):
         """Test device detection logic."""
-        backend = F5TTSBackend()
-        device = backend._get_device()
+        device = get_torch_device()
+        assert F5TTSBackend().device == device
 
         # Device should be one of the supported types
         assert isinstance(device, (str, object))
@@ -157,6 +175,56 @@ class TestF5TTSBackendInitialization:
             # Should fall back to cpu or other available device
             assert device in ["cpu", "xpu"] or hasattr(device, '__str__')
 
+    def test_precision_selection(self, monkeypatch):
+        """Test DiT precision selection from device and F5_PRECISION."""
+        backend = F5TTSBackend()
+
+        backend.device = "cpu"
+        monkeypatch.setenv("F5_PRECISION", "bf16")
+        assert backend._get_precision() is None
+
+        backend.device = "xpu"
+        assert backend._get_precision() == torch.bfloat16
+        monkeypatch.setenv("F5_PRECISION", "fp16")
+        assert backend._get_precision() == torch.float16
+        monkeypatch.setenv("F5_PRECISION", "fp32")
+        assert backend._get_precision() is None
+
+    def test_compile_falls_back_to_eager(self):
+        """Test that DiT sub-layers are restored if the compile warm-up fails."""
+        backend = F5TTSBackend()
+        block = torch.nn.Module()
+        block.attn = torch.nn.Linear(4, 4)
+        block.ff = torch.nn.Linear(4, 4)
+        attn, ff = block.attn, block.ff
+
+        backend.model = Mock()
+        backend.model.ema_model.transformer.transformer_blocks = [block]
+
+        with patch.object(backend, "_warmup_sync", side_effect=RuntimeError("no triton")):
+            backend._compile_dit()
+
+        assert block.attn is attn
+        assert block.ff is ff
+
+    def test_warmup_runs_dit_and_vocoder(self):
+        """Test that the warm-up pass covers both DiT sampling and the vocoder."""
+        backend = F5TTSBackend()
+        backend.model = Mock()
+        backend.model.target_sample_rate = 24000
+        backend.model.mel_spec_type = "vocos"
+        backend.model.ema_model.mel_spec.hop_length = 256
+        backend.model.ema_model.num_channels = 100
+        backend.model.ema_model.sample = Mock(
+            side_effect=lambda duration, **kwargs: (torch.zeros(1, duration, 100), None)
+        )
+
+        backend._warmup_sync()
+
+        assert backend.model.ema_model.sample.call_args.kwargs["steps"] == 2
+        mel = backend.model.vocoder.decode.call_args.args[0]
+        assert mel.shape == (1, 100, 187)
+
 
 class TestF5TTSBackendModelLoading:
     """Test model loading functionality."""
@@ -366,6 +434,7 @@ class TestF5TTSBackendGeneration:
         # Note: Due to mocking, we can't test exact reproducibility
         # but we can verify the seed was passed correctly
         assert mock_f5tts_model.infer.called
+        assert mock_f5tts_model.infer.call_args.kwargs["seed"] == 42
 
     @pytest.mark.asyncio
     async def test_generate_ignores_instruct(self, temp_audio_file, mock_f5tts_model):
@@ -389,6 +458,167 @@ class TestF5TTSBackendGeneration:
         assert isinstance(audio, np.ndarray)
         assert isinstance(sr, int)
 
+    @pytest.mark.asyncio
+    async def test_generate_uses_cached_reference_mel(self, temp_audio_file, mock_f5tts_model):
+        """Test that a precomputed ref_mel bypasses F5TTS.infer."""
+        backend = F5TTSBackend()
+        backend.device = "cpu"
+        backend.model = mock_f5tts_model
+        backend._current_model_type = "F5TTS_v1_Base"
+
+        mock_f5tts_model.target_sample_rate = 24000
+        mock_f5tts_model.mel_spec_type = "vocos"
+        mock_f5tts_model.ema_model.sample = Mock(return_value=(torch.zeros(1, 150, 100), None))
+        mock_f5tts_model.vocoder.decode = Mock(return_value=torch.zeros(1, 256 * 50))
+
+        voice_prompt = {
+            "audio_path": temp_audio_file,
+            "reference_text": "Reference",
+            "ref_mel": torch.zeros(1, 100, 100),
+            "ref_text": "Reference. ",
+            "ref_rms": 0.1,
+            "max_chars": 200,
+        }
+
+        mock_utils = Mock()
+        mock_utils.convert_char_to_pinyin = Mock(side_effect=lambda texts: texts)
+        with patch.dict(sys.modules, {'f5_tts.model': Mock(), 'f5_tts.model.utils': mock_utils}):
+            audio, sr = await backend.generate(text="Hello", voice_prompt=voice_prompt)
+
+        assert not mock_f5tts_model.infer.called
+        mock_utils.convert_char_to_pinyin.assert_called_once_with(["Reference. Hello"])
+        kwargs = mock_f5tts_model.ema_model.sample.call_args.kwargs
+        assert kwargs["duration"] > 100
+        assert audio.dtype == np.float32
+        assert sr == 24000
+
+    @pytest.mark.asyncio
+    async def test_generate_reuses_cached_reference_tokens(self, temp_audio_file, mock_f5tts_model):
+        """Test that only the generated text is tokenized when ref tokens are cached."""
+        backend = F5TTSBackend()
+        backend.device = "cpu"
+        backend.model = mock_f5tts_model
+        backend._current_model_type = "F5TTS_v1_Base"
+
+        mock_f5tts_model.target_sample_rate = 24000
+        mock_f5tts_model.mel_spec_type = "vocos"
+        mock_f5tts_model.ema_model.sample = Mock(return_value=(torch.zeros(1, 150, 100), None))
+        mock_f5tts_model.vocoder.decode = Mock(return_value=torch.zeros(1, 256 * 50))
+
+        voice_prompt = {
+            "audio_path": temp_audio_file,
+            "reference_text": "Reference",
+            "ref_mel": torch.zeros(1, 100, 100),
+            "ref_text": "Ref. ",
+            "ref_text_tokens": ["R", "e", "f", ".", " "],
+            "ref_rms": 0.1,
+            "max_chars": 200,
+        }
+
+        mock_utils = Mock()
+        mock_utils.convert_char_to_pinyin = Mock(side_effect=lambda texts: [list(t) for t in texts])
+        with patch.dict(sys.modules, {'f5_tts.model': Mock(), 'f5_tts.model.utils': mock_utils}):
+            await backend.generate(text="Hi", voice_prompt=voice_prompt)
+
+        mock_utils.convert_char_to_pinyin.assert_called_once_with(["Hi"])
+        kwargs = mock_f5tts_model.ema_model.sample.call_args.kwargs
+        assert kwargs["text"] == [["R", "e", "f", ".", " ", "H", "i"]]
+
+    @pytest.mark.asyncio
+    async def test_generate_long_text_falls_back_to_infer(self, temp_audio_file, mock_f5tts_model):
+        """Test that texts longer than one batch still go through F5TTS.infer."""
+        backend = F5TTSBackend()
+        backend.model = mock_f5tts_model
+        backend._current_model_type = "F5TTS_v1_Base"
+
+        voice_prompt = {
+            "audio_path": temp_audio_file,
+            "reference_text": "Reference",
+            "ref_mel": torch.zeros(1, 100, 100),
+            "ref_text": "Reference. ",
+            "ref_rms": 0.1,
+            "max_chars": 4,
+        }
+
+        audio, sr = await backend.generate(text="Hello world", voice_prompt=voice_prompt)
+
+        assert mock_f5tts_model.infer.called
+        assert isinstance(audio, np.ndarray)
+
+    @pytest.mark.asyncio
+    async def test_generate_uses_returned_waveform(self, temp_audio_file, mock_f5tts_model):
+        """Test that generation uses infer()'s returned waveform without writing a file."""
+        backend = F5TTSBackend()
+        backend.model = mock_f5tts_model
+        backend._current_model_type = "F5TTS_v1_Base"
+        mock_f5tts_model.infer = Mock(return_value=(torch.ones(4800, dtype=torch.float64), 24000, None))
+
+        voice_prompt = {
+            "audio_path": temp_audio_file,
+            "reference_text": "Reference"
+        }
+
+        audio, sr = await backend.generate(text="Hello world", voice_prompt=voice_prompt)
+
+        assert mock_f5tts_model.infer.call_args.kwargs["file_wave"] is None
+        assert isinstance(audio, np.ndarray)
+        assert audio.dtype == np.float32
+        assert audio.flags["C_CONTIGUOUS"]
+        assert sr == 24000
+
+    @pytest.mark.asyncio
+    async def test_generate_picks_nfe_step_from_text_length(self, temp_audio_file, mock_f5tts_model):
+        """Test that short texts use fewer ODE steps unless nfe_step is given."""
+        backend = F5TTSBackend()
+        backend.model = mock_f5tts_model
+        backend._current_model_type = "F5TTS_v1_Base"
+        voice_prompt = {"audio_path": temp_audio_file, "reference_text": "Reference"}
+
+        await backend.generate(text="Hello world", voice_prompt=voice_prompt)
+        assert mock_f5tts_model.infer.call_args.kwargs["nfe_step"] == 16
+
+        await backend.generate(text=" ".join(["word"] * 10), voice_prompt=voice_prompt)
+        assert mock_f5tts_model.infer.call_args.kwargs["nfe_step"] == 24
+
+        await backend.generate(text=" ".join(["word"] * 40), voice_prompt=voice_prompt)
+        assert mock_f5tts_model.infer.call_args.kwargs["nfe_step"] == 32
+
+        await backend.generate(text="Hello world", voice_prompt=voice_prompt, nfe_step=32)
+        assert mock_f5tts_model.infer.call_args.kwargs["nfe_step"] == 32
+
+    @pytest.mark.asyncio
+    async def test_concurrent_generates_are_serialized(self, temp_audio_file, mock_f5tts_model):
+        """Test that overlapping generate calls never run the model at the same time."""
+        import asyncio
+        import threading
+        import time
+
+        backend = F5TTSBackend()
+        backend.model = mock_f5tts_model
+        backend._current_model_type = "F5TTS_v1_Base"
+
+        active = []
+        overlap = threading.Event()
+        infer = mock_f5tts_model.infer.side_effect
+
+        def slow_infer(*args, **kwargs):
+            active.append(1)
+            if len(active) > 1:
+                overlap.set()
+            time.sleep(0.05)
+            active.pop()
+            return infer(*args, **kwargs)
+
+        mock_f5tts_model.infer = Mock(side_effect=slow_infer)
+        voice_prompt = {"audio_path": temp_audio_file, "reference_text": "Reference"}
+
+        await asyncio.gather(*[
+            backend.generate(text="Hello", voice_prompt=voice_prompt) for _ in range(3)
+        ])
+
+        assert mock_f5tts_model.infer.call_count == 3
+        assert not overlap.is_set()
+
     @pytest.mark.asyncio
     async def test_generate_without_audio_path_raises_error(self, mock_f5tts_model):
         """Test that missing audio_path in voice_prompt raises ValueError."""
@@ -427,6 +657,20 @@ class TestF5TTSBackendCaching:
             result = backend._is_model_cached("F5TTS_v1_Base")
             assert result is False
 
+    @pytest.mark.asyncio
+    async def test_successful_load_marks_model_cached(self, tmp_path, mock_f5tts_model):
+        """Test that the first successful load writes the cache sentinel."""
+        backend = F5TTSBackend()
+
+        with patch('pathlib.Path.home', return_value=tmp_path):
+            assert backend._is_model_cached("E2TTS_Base") is False
+
+            with patch.dict('sys.modules', {'f5_tts.api': Mock(F5TTS=Mock(return_value=mock_f5tts_model))}):
+                await backend.load_model_async("E2TTS_Base")
+
+            assert backend._is_model_cached("E2TTS_Base") is True
+            assert backend._is_model_cached("F5TTS_v1_Base") is False
+
 
 class TestF5TTSBackendEdgeCases:
     """Test edge cases and error handling."""
@@ -0,0 +1,33 @@
+"""
+Unit tests for the snapshot_download progress tqdm class.
+"""
+
+import sys
+from pathlib import Path
+
+# Add parent directory to path to enable imports when running from backend/tests
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+try:
+    from backend.utils.hf_progress import create_hf_tqdm_class
+except ImportError:
+    from utils.hf_progress import create_hf_tqdm_class
+
+
+def test_byte_progress_replaces_file_count_progress():
+    calls = []
+    tqdm_class = create_hf_tqdm_class(lambda *args: calls.append(args))
+
+    files = tqdm_class(total=3, desc="Fetching 3 files", disable=False)
+    files.update(1)
+    transfer = tqdm_class(total=2_000_000, unit="B", desc="Downloading bytes", disable=False)
+    transfer.update(1000)
+    files.update(1)
+    write = tqdm_class(total=2_000_000, unit="B", desc="Reconstructing", disable=False)
+    write.update(500)
+
+    assert calls == [
+        (1, 3, "Fetching 3 files"),
+        (1000, 2_000_000, "Downloading bytes"),
+        (1000, 2_000_000, "Reconstructing"),
+    ]
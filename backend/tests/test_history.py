@@ -0,0 +1,167 @@
+"""
+Unit tests for generation history listing.
+"""
+
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import event
+
+# Add parent directory to path to enable imports when running from backend/tests
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+try:
+    from backend import database, history
+    from backend.models import HistoryQuery
+except ImportError:
+    import database
+    import history
+    from models import HistoryQuery
+
+
+def _add_generations(db):
+    start = datetime(2024, 1, 1)
+    for i in range(5):
+        db.add(database.Generation(
+            id=f"g{i}", profile_id="p1", text=f"text {i}", audio_path=f"g{i}.wav",
+            duration=1.0, created_at=start + timedelta(minutes=i // 2),  # pairs share a timestamp
+        ))
+    db.commit()
+
+
+@pytest.mark.asyncio
+async def test_keyset_pages_match_offset_pages(db):
+    _add_generations(db)
+
+    offset_ids = [
+        item.id
+        for offset in (0, 2, 4)
+        for item in (await history.list_generations(HistoryQuery(limit=2, offset=offset), db)).items
+    ]
+
+    cursor_ids = []
+    query = HistoryQuery(limit=2)
+    while True:
+        page = await history.list_generations(query, db)
+        cursor_ids += [item.id for item in page.items]
+        assert page.total == 5
+        assert all(item.profile_name == "Voice" for item in page.items)
+        if page.next_cursor_id is None:
+            break
+        query = HistoryQuery(limit=2, cursor_created_at=page.next_cursor_created_at, cursor_id=page.next_cursor_id)
+
+    assert cursor_ids == offset_ids == ["g4", "g3", "g2", "g1", "g0"]
+
+
+@pytest.mark.asyncio
+async def test_delete_by_profile_removes_rows_and_files(db, tmp_path):
+    _add_generations(db)
+
+    for generation in db.query(database.Generation):
+        generation.audio_path = str(tmp_path / f"{generation.id}.wav")
+        Path(generation.audio_path).touch()
+    db.commit()
+    (tmp_path / "g0.wav").unlink()  # already missing on disk
+
+    assert await history.delete_generations_by_profile("p1", db) == 5
+
+    assert db.query(database.Generation).count() == 0
+    assert not list(tmp_path.glob("g*.wav"))
+
+
+@pytest.mark.asyncio
+async def test_stats_totals_match_per_profile_counts(db):
+    _add_generations(db)
+
+    db.add(database.Generation(id="x", profile_id="p2", text="t", audio_path="x.wav", duration=0.5))
+    db.commit()
+
+    stats = await history.get_generation_stats(db)
+
+    assert stats == {
+        "total_generations": 6,
+        "total_duration_seconds": 5.5,
+        "generations_by_profile": {"p1": 5, "p2": 1},
+    }
+
+
+@pytest.mark.asyncio
+async def test_total_counts_filtered_rows_on_every_page(db):
+    _add_generations(db)
+
+    query = HistoryQuery(search="text", limit=2, offset=4)
+    assert (await history.list_generations(query, db)).total == 5
+
+    past_end = HistoryQuery(limit=2, offset=10)
+    page = await history.list_generations(past_end, db)
+    assert page.items == [] and page.total == 5
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("search, expected", [("EXT 3", ["g3"]), ("t 1", ["g1"]), ('"quoted"', [])])
+async def test_search_matches_substrings(db, search, expected):
+    assert database.generations_fts_enabled
+    _add_generations(db)
+
+    page = await history.list_generations(HistoryQuery(search=search), db)
+
+    assert [item.id for item in page.items] == expected
+
+
+@pytest.mark.asyncio
+async def test_search_index_follows_updates_and_deletes(db):
+    _add_generations(db)
+
+    db.query(database.Generation).filter_by(id="g2").update({"text": "renamed clip"})
+    db.query(database.Generation).filter_by(id="g4").delete()
+    db.commit()
+
+    assert [i.id for i in (await history.list_generations(HistoryQuery(search="renamed"), db)).items] == ["g2"]
+    assert (await history.list_generations(HistoryQuery(search="text 2"), db)).items == []
+    assert (await history.list_generations(HistoryQuery(search="text 4"), db)).items == []
+
+
+@pytest.mark.asyncio
+async def test_get_generation_by_id(db):
+    _add_generations(db)
+
+    assert (await history.get_generation("g1", db)).text == "text 1"
+    assert await history.get_generation("missing", db) is None
+
+
+@pytest.mark.asyncio
+async def test_create_generation_does_not_reload_row(db):
+    statements = []
+
+    def record(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(database.engine, "before_cursor_execute", record)
+    try:
+        generation = await history.create_generation("p1", "hello", "en", "h.wav", 1.0, None, db)
+    finally:
+        event.remove(database.engine, "before_cursor_execute", record)
+
+    assert generation.text == "hello"
+    assert not [s for s in statements if s.lstrip().upper().startswith("SELECT")]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("returning", [True, False])
+async def test_delete_generation(db, tmp_path, returning):
+    _add_generations(db)
+
+    audio = tmp_path / "g1.wav"
+    audio.touch()
+    db.query(database.Generation).filter_by(id="g1").update({"audio_path": str(audio)})
+    db.commit()
+
+    with patch.object(history, "_HAS_DELETE_RETURNING", returning):
+        assert await history.delete_generation("g1", db) is True
+        assert await history.delete_generation("g1", db) is False
+
+    assert not audio.exists()
+    assert db.get(database.Generation, "g1") is None
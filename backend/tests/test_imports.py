@@ -0,0 +1,25 @@
+"""
+Startup import checks: the server's modules must not pull in heavy ML
+libraries at import time (they are imported where they are used).
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+REPO_DIR = Path(__file__).parent.parent.parent
+
+
+def test_backend_modules_import_without_ml_libraries():
+    code = (
+        "import sys\n"
+        "from backend import database, models, profiles, history, tts, transcribe, "
+        "config, export_import, channels, stories, platform_detect\n"
+        "from backend.backends import get_tts_backend\n"
+        "from backend.utils import audio, cache, progress, tasks\n"
+        "print(sorted(m for m in ('torch', 'transformers', 'librosa') if m in sys.modules))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], cwd=REPO_DIR, capture_output=True, text=True, check=True,
+    )
+    assert result.stdout.strip().splitlines()[-1] == "[]"
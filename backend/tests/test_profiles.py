@@ -0,0 +1,65 @@
+"""
+Unit tests for voice profile prompt building.
+"""
+
+import sys
+from pathlib import Path
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+# Add parent directory to path to enable imports when running from backend/tests
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+try:
+    from backend import database, profiles
+except ImportError:
+    import database
+    import profiles
+
+
+@pytest.fixture(autouse=True)
+def fresh_voice_prompts():
+    profiles.forget_voice_prompts()
+    yield
+    profiles.forget_voice_prompts()
+
+
+@pytest.mark.asyncio
+async def test_voice_prompt_reused_until_samples_change(db):
+    db.add(database.ProfileSample(id="s1", profile_id="p1", audio_path="s1.wav", reference_text="hi"))
+    db.commit()
+
+    tts_model = Mock(_current_model_size="1.7B")
+    tts_model.create_voice_prompt = AsyncMock(side_effect=lambda *args, **kwargs: ({"ref": args[0]}, False))
+
+    with patch.object(profiles, "get_tts_model", return_value=tts_model):
+        first = await profiles.create_voice_prompt_for_profile("p1", db)
+        second = await profiles.create_voice_prompt_for_profile("p1", db)
+        assert first is second
+        assert tts_model.create_voice_prompt.await_count == 1
+
+        db.query(database.ProfileSample).filter_by(id="s1").update({"reference_text": "hello"})
+        db.commit()
+        await profiles.create_voice_prompt_for_profile("p1", db)
+        assert tts_model.create_voice_prompt.await_count == 2
+
+        tts_model._current_model_size = "0.6B"
+        await profiles.create_voice_prompt_for_profile("p1", db)
+        assert tts_model.create_voice_prompt.await_count == 3
+
+
+@pytest.mark.asyncio
+async def test_reuploaded_sample_is_not_reprocessed(db, tmp_path):
+    stored = tmp_path / "s1.wav"
+    stored.touch()
+    db.add(database.ProfileSample(
+        id="s1", profile_id="p1", audio_path=str(stored), reference_text="hi", content_hash="abc",
+    ))
+    db.commit()
+
+    with patch.object(profiles, "validate_reference_audio", side_effect=AssertionError("decoded")):
+        sample = await profiles.add_profile_sample("p1", "upload.wav", "hi", db, content_hash="abc")
+
+    assert sample.id == "s1"
+    assert db.query(database.ProfileSample).count() == 1
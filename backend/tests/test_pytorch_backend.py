@@ -0,0 +1,300 @@
+"""
+Unit tests for the PyTorch (Qwen3-TTS / Whisper) backend.
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import numpy as np
+import pytest
+import torch
+from torch._dynamo.exc import BackendCompilerFailed
+
+# Add parent directory to path to enable imports when running from backend/tests
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+try:
+    from backend.backends import pytorch_backend
+    from backend.backends.pytorch_backend import PyTorchTTSBackend, PyTorchSTTBackend
+    from backend.utils import hf_cache
+except ImportError:
+    from backends import pytorch_backend
+    from backends.pytorch_backend import PyTorchTTSBackend, PyTorchSTTBackend
+    from utils import hf_cache
+
+
+class FakeDecoder(torch.nn.Module):
+    def forward(self, x):
+        return x
+
+
+def _make_tts_backend():
+    backend = PyTorchTTSBackend()
+    backend.model = Mock()
+    backend.model.model.talker = FakeDecoder()
+    backend._current_model_size = backend.model_size
+    return backend
+
+
+class TestTTSGeneration:
+    @pytest.mark.asyncio
+    async def test_generate_returns_first_wav(self):
+        backend = _make_tts_backend()
+        backend.model.generate_voice_clone = Mock(return_value=([np.ones(10, dtype=np.float32)], 24000))
+
+        audio, sr = await backend.generate("Hello", voice_prompt={}, seed=1)
+
+        assert sr == 24000
+        assert len(audio) == 10
+
+    @pytest.mark.asyncio
+    async def test_seed_is_reproducible_without_touching_global_rng(self):
+        backend = _make_tts_backend()
+        backend.model.generate_voice_clone = Mock(side_effect=lambda **kwargs: ([torch.rand(4).numpy()], 24000))
+
+        torch.manual_seed(123)
+        state = torch.get_rng_state()
+        first, _ = await backend.generate("Hello", voice_prompt={}, seed=7)
+        second, _ = await backend.generate("Hello", voice_prompt={}, seed=7)
+
+        assert np.array_equal(first, second)
+        assert torch.equal(torch.get_rng_state(), state)
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_are_batched_per_voice_prompt(self):
+        backend = _make_tts_backend()
+        backend.model.generate_voice_clone = Mock(
+            side_effect=lambda text, **kwargs: ([np.full(3, i, dtype=np.float32) for i in range(len(text))], 24000)
+            if isinstance(text, list) else ([np.full(3, 9, dtype=np.float32)], 24000)
+        )
+        prompt_a, prompt_b = {}, {}
+
+        results = await asyncio.gather(
+            backend.generate("one", voice_prompt=prompt_a),
+            backend.generate("two", voice_prompt=prompt_a),
+            backend.generate("three", voice_prompt=prompt_b),
+        )
+
+        texts = [call.kwargs["text"] for call in backend.model.generate_voice_clone.call_args_list]
+        assert texts == [["one", "two"], "three"]
+        assert [audio[0] for audio, _ in results] == [0, 1, 9]
+
+    @pytest.mark.asyncio
+    async def test_lone_request_skips_batch_window(self):
+        backend = _make_tts_backend()
+        backend._scheduler._window_s = 60
+        backend.model.generate_voice_clone = Mock(return_value=([np.ones(3, dtype=np.float32)], 24000))
+
+        audio, _ = await asyncio.wait_for(backend.generate("one", voice_prompt={}), timeout=5)
+
+        assert len(audio) == 3
+
+    @pytest.mark.asyncio
+    async def test_unload_cancels_batch_worker(self):
+        backend = _make_tts_backend()
+        backend.model.generate_voice_clone = Mock(return_value=([np.ones(3, dtype=np.float32)], 24000))
+        await backend.generate("one", voice_prompt={})
+        worker = backend._scheduler._worker
+
+        backend.unload_model()
+
+        with pytest.raises(asyncio.CancelledError):
+            await worker
+        assert backend._scheduler._worker is None
+
+    @pytest.mark.asyncio
+    async def test_compile_failure_falls_back_to_eager(self):
+        backend = _make_tts_backend()
+        decoder = backend.model.model.talker
+        backend._compile_decoder()
+        assert backend._eager_forward is not None
+
+        backend.model.generate_voice_clone = Mock(side_effect=[
+            BackendCompilerFailed("inductor", RuntimeError("inductor failed"), None),
+            ([np.zeros(5, dtype=np.float32)], 24000),
+        ])
+
+        audio, sr = await backend.generate("Hello", voice_prompt={})
+
+        assert backend.model.generate_voice_clone.call_count == 2
+        assert backend._eager_forward is None
+        assert decoder.forward(1) == 1
+        assert sr == 24000
+
+
+    @pytest.mark.asyncio
+    async def test_non_compile_error_keeps_compiled_decoder(self):
+        backend = _make_tts_backend()
+        backend._compile_decoder()
+        backend.model.generate_voice_clone = Mock(side_effect=torch.cuda.OutOfMemoryError("oom"))
+
+        with pytest.raises(torch.cuda.OutOfMemoryError):
+            await backend.generate("Hello", voice_prompt={})
+
+        assert backend.model.generate_voice_clone.call_count == 1
+        assert backend._eager_forward is not None
+
+
+class TestVoicePromptCache:
+    @pytest.mark.asyncio
+    async def test_cached_prompt_items_are_returned(self, tmp_path):
+        backend = _make_tts_backend()
+        backend.model.create_voice_clone_prompt = Mock(return_value=[Mock()])
+        audio_path = tmp_path / "ref.wav"
+        audio_path.write_bytes(b"audio")
+        cached = [object()]
+
+        with patch.object(pytorch_backend, "get_cached_voice_prompt", return_value=cached):
+            prompt, was_cached = await backend.create_voice_prompt(str(audio_path), "hello")
+
+        assert prompt is cached
+        assert was_cached is True
+        backend.model.create_voice_clone_prompt.assert_not_called()
+
+
+class TestTTSModelSwitch:
+    @pytest.mark.asyncio
+    async def test_size_switch_keeps_allocator_cache(self):
+        backend = _make_tts_backend()
+        backend._current_model_size = "0.6B"
+
+        with patch.object(backend, "_load_model_sync"), \
+                patch.object(torch.cuda, "is_available", return_value=True), \
+                patch.object(torch.cuda, "empty_cache") as empty_cache, \
+                patch.object(torch.cuda, "reset_peak_memory_stats") as reset_peak:
+            await backend.load_model_async("1.7B")
+
+        empty_cache.assert_not_called()
+        reset_peak.assert_called_once()
+        assert backend.model is None
+
+    def test_explicit_unload_releases_cache(self):
+        backend = _make_tts_backend()
+
+        with patch.object(torch.cuda, "is_available", return_value=True), \
+                patch.object(torch.cuda, "empty_cache") as empty_cache:
+            backend.unload_model()
+
+        empty_cache.assert_called_once()
+
+
+class TestCPULoad:
+    def test_streams_weights_when_fully_materialized(self):
+        backend = PyTorchTTSBackend()
+        model = Mock()
+        model.model = torch.nn.Linear(2, 2)
+        model_cls = Mock(from_pretrained=Mock(return_value=model))
+
+        assert backend._load_cpu_model(model_cls, "repo") is model
+        assert model_cls.from_pretrained.call_args.kwargs["low_cpu_mem_usage"] is True
+
+    def test_falls_back_when_meta_tensors_remain(self):
+        backend = PyTorchTTSBackend()
+        meta_model = Mock()
+        meta_model.model = torch.nn.Linear(2, 2, device="meta")
+        model_cls = Mock(from_pretrained=Mock(side_effect=[meta_model, "eager"]))
+
+        assert backend._load_cpu_model(model_cls, "repo") == "eager"
+        assert model_cls.from_pretrained.call_args.kwargs["low_cpu_mem_usage"] is False
+
+
+class TestSTTTranscription:
+    @pytest.mark.asyncio
+    async def test_transcribe_uses_chunked_pipeline(self):
+        backend = PyTorchSTTBackend()
+        backend.model = Mock()
+        backend._pipe = Mock(return_value={"text": " hello world "})
+        audio = np.zeros(16000 * 45, dtype=np.float32)
+
+        with patch.object(pytorch_backend, "load_audio", return_value=(audio, 16000)):
+            text = await backend.transcribe("clip.wav", language="en")
+
+        assert text == "hello world"
+        args, kwargs = backend._pipe.call_args
+        assert args[0]["sampling_rate"] == 16000
+        assert kwargs["chunk_length_s"] == 30
+        assert kwargs["generate_kwargs"] == {"task": "transcribe", "language": "en"}
+
+
+    @pytest.mark.asyncio
+    async def test_short_clip_bypasses_pipeline(self):
+        backend = PyTorchSTTBackend()
+        backend.device = "cpu"
+        backend.model = Mock(dtype=torch.float16)
+        backend.model.generate = Mock(return_value=torch.tensor([[1, 2]]))
+        backend.processor = Mock(return_value={"input_features": torch.zeros(1, 3000, 80).transpose(1, 2)})
+        backend.processor.batch_decode = Mock(return_value=[" hi "])
+        backend._pipe = Mock()
+        audio = np.zeros(16000 * 5, dtype=np.float32)
+
+        with patch.object(pytorch_backend, "load_audio", return_value=(audio, 16000)):
+            text = await backend.transcribe("clip.wav")
+
+        assert text == "hi"
+        backend._pipe.assert_not_called()
+        kwargs = backend.model.generate.call_args.kwargs
+        assert kwargs["input_features"].dtype == torch.float16
+        assert kwargs["input_features"].is_contiguous()
+        assert kwargs["task"] == "transcribe"
+
+    @pytest.mark.asyncio
+    async def test_short_clip_replays_encoder_graph(self):
+        backend = PyTorchSTTBackend()
+        backend.device = "cpu"
+        backend.model = Mock(dtype=torch.float32)
+        backend.model.generate = Mock(return_value=torch.tensor([[1, 2]]))
+        backend.processor = Mock(return_value={"input_features": torch.ones(1, 80, 3000)})
+        backend.processor.batch_decode = Mock(return_value=["hi"])
+        backend._encoder_graph = Mock()
+        backend._encoder_in = torch.zeros(1, 80, 3000)
+        backend._encoder_out = torch.zeros(1, 1500, 8)
+        modeling_outputs = Mock(BaseModelOutput=lambda last_hidden_state: {"last_hidden_state": last_hidden_state})
+        audio = np.zeros(16000 * 5, dtype=np.float32)
+
+        with patch.object(pytorch_backend, "load_audio", return_value=(audio, 16000)), \
+                patch.dict(sys.modules, {"transformers": Mock(), "transformers.modeling_outputs": modeling_outputs}):
+            await backend.transcribe("clip.wav")
+
+        backend._encoder_graph.replay.assert_called_once()
+        assert torch.equal(backend._encoder_in, torch.ones(1, 80, 3000))
+        kwargs = backend.model.generate.call_args.kwargs
+        assert "input_features" not in kwargs
+        assert kwargs["encoder_outputs"]["last_hidden_state"] is backend._encoder_out
+
+class TestModelCacheCheck:
+    def test_cache_status_memoized_until_snapshots_change(self, tmp_path):
+        from huggingface_hub import constants as hf_constants
+
+        backend = PyTorchSTTBackend()
+        repo = tmp_path / "models--openai--whisper-tiny"
+        revision = repo / "snapshots" / "abc"
+        revision.mkdir(parents=True)
+        (repo / "blobs").mkdir()
+        hf_cache._cache_status.clear()
+
+        with patch.object(hf_constants, "HF_HUB_CACHE", str(tmp_path)):
+            assert backend._is_model_cached("tiny") is False
+
+            with patch.object(hf_cache, "_has_weights", side_effect=AssertionError("rescanned")):
+                assert backend._is_model_cached("tiny") is False
+
+            (repo / "snapshots" / "def").mkdir()
+            (repo / "snapshots" / "def" / "model.safetensors").touch()
+            assert backend._is_model_cached("tiny") is True
+
+
+class TestCombineVoicePrompts:
+    @pytest.mark.asyncio
+    async def test_clips_are_concatenated_in_order(self):
+        backend = PyTorchTTSBackend()
+        clips = {"a.wav": np.full(3, 0.1, dtype=np.float32), "b.wav": np.full(2, -0.1, dtype=np.float32)}
+
+        with patch.object(pytorch_backend, "load_audio", side_effect=lambda path: (clips[path], 24000)):
+            mixed, text = await backend.combine_voice_prompts(["a.wav", "b.wav"], ["one", "two"])
+
+        assert mixed.dtype == np.float32
+        assert len(mixed) == 5
+        assert np.all(mixed[:3] > 0) and np.all(mixed[3:] < 0)
+        assert text == "one two"
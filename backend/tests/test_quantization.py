@@ -0,0 +1,64 @@
+"""
+Unit tests for INT8 weight-only quantization.
+"""
+
+import sys
+from pathlib import Path
+
+import torch
+from torch import nn
+
+# Add parent directory to path to enable imports when running from backend/tests
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+try:
+    from backend.utils import quantization
+    from backend.utils.quantization import Int8Linear, quantize_linear_int8
+except ImportError:
+    from utils import quantization
+    from utils.quantization import Int8Linear, quantize_linear_int8
+
+
+class TinyModel(nn.Module):
+    def __init__(self):
+        super().__init__()
+        self.embed = nn.Embedding(10, 16)
+        self.proj = nn.Linear(16, 32)
+        self.norm = nn.LayerNorm(32)
+        self.lm_head = nn.Linear(32, 10, bias=False)
+
+    def forward(self, x):
+        return self.lm_head(self.norm(self.proj(self.embed(x))))
+
+
+def test_int8_linear_matches_float():
+    torch.manual_seed(0)
+    linear = nn.Linear(64, 32)
+    quantized = Int8Linear.from_linear(linear)
+
+    x = torch.randn(4, 64)
+    assert quantized.weight.dtype == torch.int8
+    assert torch.allclose(quantized(x), linear(x), atol=5e-2)
+
+
+def test_quantize_skips_heads_embeddings_and_norms(monkeypatch):
+    # Force the built-in fallback even if torchao is installed
+    monkeypatch.setitem(sys.modules, "torchao.quantization", None)
+    model = TinyModel()
+
+    count = quantize_linear_int8(model)
+
+    assert count == 1
+    assert isinstance(model.proj, Int8Linear)
+    assert isinstance(model.lm_head, nn.Linear)
+    assert isinstance(model.embed, nn.Embedding)
+    assert model(torch.tensor([[1, 2, 3]])).shape == (1, 3, 10)
+
+
+def test_quantize_refuses_without_int8_kernel(monkeypatch):
+    monkeypatch.setitem(sys.modules, "torchao.quantization", None)
+    monkeypatch.setattr(quantization, "_int8_kernel_available", lambda device, dtype: False)
+    model = TinyModel()
+
+    assert quantize_linear_int8(model) == 0
+    assert isinstance(model.proj, nn.Linear)
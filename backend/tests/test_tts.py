@@ -0,0 +1,59 @@
+"""
+Unit tests for sentence-level streaming helpers.
+"""
+
+import io
+import sys
+import wave
+from pathlib import Path
+from unittest.mock import AsyncMock
+
+import numpy as np
+import pytest
+
+# Add parent directory to path to enable imports when running from backend/tests
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+try:
+    from backend import tts
+except ImportError:
+    import tts
+
+
+def test_split_sentences_merges_short_fragments():
+    text = "Hi. This is the first full sentence here! And a second one follows? Ok."
+
+    assert tts.split_sentences(text, min_chars=20) == [
+        "Hi. This is the first full sentence here!",
+        "And a second one follows? Ok.",
+    ]
+
+
+def test_split_sentences_handles_cjk_punctuation():
+    assert tts.split_sentences("你好。今天天气很好！", min_chars=1) == ["你好。", "今天天气很好！"]
+
+
+@pytest.mark.asyncio
+async def test_generate_stream_yields_per_sentence():
+    model = AsyncMock()
+    model.generate.side_effect = lambda text, *args: (np.zeros(len(text), dtype=np.float32), 24000)
+
+    first = "The first sentence is long enough to stand alone."
+    second = "So is the second one, which ends the paragraph."
+
+    chunks = [chunk async for chunk in tts.generate_stream(model, f"{first} {second}", {}, "en", 3)]
+
+    assert [len(audio) for audio, _ in chunks] == [len(first), len(second)]
+    assert [call.args[3] for call in model.generate.call_args_list] == [3, 3]
+
+
+def test_streamed_wav_is_readable():
+    audio = np.array([0.0, 0.5, -2.0], dtype=np.float32)
+    data = tts.wav_stream_header(24000) + tts.audio_to_pcm16_bytes(audio)
+
+    with wave.open(io.BytesIO(data)) as wav:
+        assert wav.getframerate() == 24000
+        assert wav.getnchannels() == 1
+        assert wav.getsampwidth() == 2
+        frames = np.frombuffer(wav.readframes(3), dtype="<i2")
+    assert frames.tolist() == [0, 16383, -32767]
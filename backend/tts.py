@@ -2,9 +2,11 @@
 TTS inference module - delegates to backend abstraction layer.
 """
 
-from typing import Optional
+from typing import AsyncIterator, List, Optional, Tuple
 import numpy as np
 import io
+import re
+import struct
 import soundfile as sf
 
 from .backends import get_tts_backend, TTSBackend
@@ -32,3 +34,87 @@ def audio_to_wav_bytes(audio: np.ndarray, sample_rate: int) -> bytes:
     sf.write(buffer, audio, sample_rate, format="WAV")
     buffer.seek(0)
     return buffer.read()
+
+
+# Sentence boundaries: terminal punctuation followed by whitespace, or
+# full-width CJK punctuation (which isn't followed by a space)
+_SENTENCE_END = re.compile(r"(?<=[.!?;])\s+|(?<=[。！？；])")
+
+# Sentences shorter than this are merged into the next one; very short
+# fragments give the model too little context and add per-call overhead
+MIN_STREAM_CHUNK_CHARS = 40
+
+
+def split_sentences(text: str, min_chars: int = MIN_STREAM_CHUNK_CHARS) -> List[str]:
+    """
+    Split text into sentence-sized chunks for incremental generation.
+
+    Args:
+        text: Text to split
+        min_chars: Minimum chunk length; shorter sentences are merged forward
+
+    Returns:
+        Non-empty chunks that together cover the text
+    """
+    chunks: List[str] = []
+    pending = ""
+    for sentence in _SENTENCE_END.split(text.strip()):
+        sentence = sentence.strip()
+        if not sentence:
+            continue
+        pending = f"{pending} {sentence}" if pending else sentence
+        if len(pending) >= min_chars:
+            chunks.append(pending)
+            pending = ""
+    if pending:
+        if chunks and len(pending) < min_chars:
+            chunks[-1] = f"{chunks[-1]} {pending}"
+        else:
+            chunks.append(pending)
+    return chunks
+
+
+async def generate_stream(
+    tts_model: TTSBackend,
+    text: str,
+    voice_prompt: dict,
+    language: str = "en",
+    seed: Optional[int] = None,
+    instruct: Optional[str] = None,
+) -> AsyncIterator[Tuple[np.ndarray, int]]:
+    """
+    Generate speech sentence by sentence, yielding audio as each is ready.
+
+    Args:
+        tts_model: Loaded TTS backend
+        text: Text to synthesize
+        voice_prompt: Voice prompt for the profile
+        language: Language code
+        seed: Random seed, reused for every sentence
+        instruct: Optional delivery instructions
+
+    Yields:
+        Tuple of (audio_array, sample_rate) per chunk of text
+    """
+    for chunk in split_sentences(text) or [text]:
+        yield await tts_model.generate(chunk, voice_prompt, language, seed, instruct)
+
+
+def wav_stream_header(sample_rate: int, channels: int = 1) -> bytes:
+    """
+    Build a 16-bit PCM WAV header for a stream of unknown length.
+
+    The RIFF and data chunk sizes are set to 0xFFFFFFFF, which players
+    treat as "read until the end of the stream".
+    """
+    block_align = channels * 2
+    return (
+        b"RIFF" + struct.pack("<I", 0xFFFFFFFF) + b"WAVE"
+        + b"fmt " + struct.pack("<IHHIIHH", 16, 1, channels, sample_rate, sample_rate * block_align, block_align, 16)
+        + b"data" + struct.pack("<I", 0xFFFFFFFF)
+    )
+
+
+def audio_to_pcm16_bytes(audio: np.ndarray) -> bytes:
+    """Convert float audio in [-1, 1] to little-endian 16-bit PCM frames."""
+    return (np.clip(audio, -1.0, 1.0) * 32767).astype("<i2").tobytes()
@@ -2,9 +2,10 @@
 Audio processing utilities.
 """
 
+import os
 import numpy as np
 import soundfile as sf
-import librosa
+from pathlib import Path
 from typing import Tuple, Optional
 
 
@@ -12,6 +13,7 @@ def normalize_audio(
     audio: np.ndarray,
     target_db: float = -20.0,
     peak_limit: float = 0.85,
+    copy: bool = True,
 ) -> np.ndarray:
     """
     Normalize audio to target loudness with peak limiting.
@@ -20,15 +22,17 @@ def normalize_audio(
         audio: Input audio array
         target_db: Target RMS level in dB
         peak_limit: Peak limit (0.0-1.0)
+        copy: If False and audio is already float32, normalize it in place
         
     Returns:
         Normalized audio array
     """
-    # Convert to float32
-    audio = audio.astype(np.float32)
+    # Convert to float32 (the only allocation)
+    audio = np.array(audio, dtype=np.float32, copy=copy or None)
     
-    # Calculate current RMS
-    rms = np.sqrt(np.mean(audio**2))
+    # Calculate current RMS in one pass, without materializing audio**2
+    flat = audio.reshape(-1)
+    rms = np.sqrt(np.dot(flat, flat) / flat.size) if flat.size else 0.0
     
     # Calculate target RMS
     target_rms = 10**(target_db / 20)
@@ -36,10 +40,10 @@ def normalize_audio(
     # Apply gain
     if rms > 0:
         gain = target_rms / rms
-        audio = audio * gain
+        np.multiply(audio, gain, out=audio)
     
     # Peak limiting
-    audio = np.clip(audio, -peak_limit, peak_limit)
+    np.clip(audio, -peak_limit, peak_limit, out=audio)
     
     return audio
 
@@ -60,6 +64,21 @@ def load_audio(
     Returns:
         Tuple of (audio_array, sample_rate)
     """
+    # Files already at the target rate (and mono) need no resampling or mixing
+    try:
+        info = sf.info(path)
+        if info.samplerate == sample_rate and (info.channels == 1 or not mono):
+            audio, sr = sf.read(path, dtype="float32", always_2d=False)
+            if audio.ndim > 1:
+                audio = np.ascontiguousarray(audio.T)  # librosa layout: (channels, samples)
+            return audio, sr
+    except RuntimeError:
+        # Format soundfile can't read - let librosa handle it
+        pass
+
+    # Imported here: librosa (numba) adds ~1s to server startup
+    import librosa
+
     audio, sr = librosa.load(path, sr=sample_rate, mono=mono)
     return audio, sr
 
@@ -70,14 +89,24 @@ def save_audio(
     sample_rate: int = 24000,
 ) -> None:
     """
-    Save audio file.
+    Save audio file as 16-bit PCM.
+    
+    The file is written next to its destination and renamed into place, so
+    readers never see a partially written file.
     
     Args:
         audio: Audio array
         path: Output path
         sample_rate: Sample rate
     """
-    sf.write(path, audio, sample_rate)
+    tmp_path = f"{path}.tmp"
+    file_format = Path(path).suffix.lstrip(".").upper() or "WAV"
+    try:
+        sf.write(tmp_path, audio, sample_rate, format=file_format, subtype="PCM_16")
+        os.replace(tmp_path, path)
+    except BaseException:
+        Path(tmp_path).unlink(missing_ok=True)
+        raise
 
 
 def validate_reference_audio(
@@ -1,14 +1,27 @@
 """
 Voice prompt caching utilities.
+
+torch and safetensors are imported inside the functions that use them so
+importing this module (done by the server at startup) stays cheap.
 """
 
+from __future__ import annotations
+
+import dataclasses
 import hashlib
-import torch
+import importlib
+import importlib.util
+import json
 from pathlib import Path
-from typing import Optional, Union, Dict, Any
+from typing import Optional, Union, Dict, Any, Tuple, TYPE_CHECKING
 
 from .. import config
 
+if TYPE_CHECKING:
+    import torch
+
+_HAS_SAFETENSORS = importlib.util.find_spec("safetensors") is not None
+
 
 def _get_cache_dir() -> Path:
     """Get cache directory from config."""
@@ -41,26 +54,127 @@ def get_cache_key(audio_path: str, reference_text: str) -> str:
     return hashlib.md5(combined).hexdigest()
 
 
+def _flatten_prompt(
+    prompt: Any,
+    tensors: Dict[str, torch.Tensor],
+) -> Optional[Dict[str, Any]]:
+    """
+    Split a voice prompt into tensors and a JSON-serializable structure.
+
+    Args:
+        prompt: Tensor, or dict/list/tuple/dataclass of tensors and plain
+            values (e.g. the list of VoiceClonePromptItem dataclasses that
+            qwen_tts' create_voice_clone_prompt returns)
+        tensors: Output mapping of tensor names to tensors
+
+    Returns:
+        Structure describing how to rebuild the prompt, or None if the
+        prompt contains values that cannot be stored in safetensors
+    """
+    import torch
+
+    if isinstance(prompt, torch.Tensor):
+        name = str(len(tensors))
+        tensors[name] = prompt.detach().contiguous()
+        return {"t": name}
+    if prompt is None or isinstance(prompt, (str, int, float, bool)):
+        return {"v": prompt}
+    if isinstance(prompt, dict) and all(isinstance(k, str) for k in prompt):
+        items = {}
+        for key, value in prompt.items():
+            item = _flatten_prompt(value, tensors)
+            if item is None:
+                return None
+            items[key] = item
+        return {"d": items}
+    if isinstance(prompt, (list, tuple)):
+        items = []
+        for value in prompt:
+            item = _flatten_prompt(value, tensors)
+            if item is None:
+                return None
+            items.append(item)
+        return {"l": items}
+    if dataclasses.is_dataclass(prompt) and not isinstance(prompt, type):
+        fields = {}
+        for field in dataclasses.fields(prompt):
+            if not field.init:
+                continue
+            item = _flatten_prompt(getattr(prompt, field.name), tensors)
+            if item is None:
+                return None
+            fields[field.name] = item
+        cls = type(prompt)
+        return {"o": f"{cls.__module__}:{cls.__qualname__}", "f": fields}
+    return None
+
+
+def _unflatten_prompt(structure: Dict[str, Any], tensors: Dict[str, torch.Tensor]) -> Any:
+    """Rebuild a voice prompt flattened by _flatten_prompt."""
+    if "t" in structure:
+        return tensors[structure["t"]]
+    if "v" in structure:
+        return structure["v"]
+    if "d" in structure:
+        return {key: _unflatten_prompt(item, tensors) for key, item in structure["d"].items()}
+    if "o" in structure:
+        module_name, _, qualname = structure["o"].partition(":")
+        cls = importlib.import_module(module_name)
+        for attr in qualname.split("."):
+            cls = getattr(cls, attr)
+        if not dataclasses.is_dataclass(cls):
+            raise TypeError(f"{structure['o']} is not a dataclass")
+        return cls(**{name: _unflatten_prompt(item, tensors) for name, item in structure["f"].items()})
+    return [_unflatten_prompt(item, tensors) for item in structure["l"]]
+
+
+def _get_cache_files(cache_key: str) -> Tuple[Path, Path]:
+    """Get the safetensors and torch.save cache file paths for a key."""
+    cache_dir = _get_cache_dir()
+    return cache_dir / f"{cache_key}.safetensors", cache_dir / f"{cache_key}.prompt"
+
+
 def get_cached_voice_prompt(
     cache_key: str,
+    device: Optional[str] = None,
 ) -> Optional[Union[torch.Tensor, Dict[str, Any]]]:
     """
     Get cached voice prompt if available.
 
     Args:
         cache_key: Cache key
+        device: Device to load safetensors-cached tensors onto (default: CPU)
 
     Returns:
-        Cached voice prompt (dict or tensor) or None
+        Cached voice prompt (prompt item list, dict or tensor) or None
     """
     # Check in-memory cache
     if cache_key in _memory_cache:
         return _memory_cache[cache_key]
 
-    # Check disk cache
-    cache_file = _get_cache_dir() / f"{cache_key}.prompt"
+    safetensors_file, cache_file = _get_cache_files(cache_key)
+
+    # Check safetensors disk cache (mmap'd, loaded straight onto the device)
+    if _HAS_SAFETENSORS and safetensors_file.exists():
+        try:
+            from safetensors import safe_open
+            from safetensors.torch import load_file as load_safetensors
+
+            with safe_open(str(safetensors_file), framework="pt") as f:
+                structure = json.loads(f.metadata()["structure"])
+            tensors = load_safetensors(str(safetensors_file), device=device or "cpu")
+            prompt = _unflatten_prompt(structure, tensors)
+            _memory_cache[cache_key] = prompt
+            return prompt
+        except Exception:
+            # Cache file corrupted, delete it
+            safetensors_file.unlink()
+
+    # Check torch.save disk cache
     if cache_file.exists():
         try:
+            import torch
+
             prompt = torch.load(cache_file)
             _memory_cache[cache_key] = prompt
             return prompt
@@ -80,13 +194,26 @@ def cache_voice_prompt(
 
     Args:
         cache_key: Cache key
-        voice_prompt: Voice prompt (dict or tensor)
+        voice_prompt: Voice prompt (prompt item list, dict or tensor)
     """
     # Store in memory
     _memory_cache[cache_key] = voice_prompt
 
-    # Store on disk (torch.save can handle both dicts and tensors)
-    cache_file = _get_cache_dir() / f"{cache_key}.prompt"
+    safetensors_file, cache_file = _get_cache_files(cache_key)
+
+    # Store on disk as safetensors when the prompt is tensors + plain values
+    if _HAS_SAFETENSORS:
+        from safetensors.torch import save_file as save_safetensors
+
+        tensors: Dict[str, torch.Tensor] = {}
+        structure = _flatten_prompt(voice_prompt, tensors)
+        if structure is not None:
+            save_safetensors(tensors, str(safetensors_file), metadata={"structure": json.dumps(structure)})
+            return
+
+    # Fall back to torch.save (handles arbitrary picklable prompts)
+    import torch
+
     torch.save(voice_prompt, cache_file)
 
 
@@ -106,7 +233,7 @@ def clear_voice_prompt_cache() -> int:
     
     if cache_dir.exists():
         # Delete prompt cache files
-        for cache_file in cache_dir.glob("*.prompt"):
+        for cache_file in [*cache_dir.glob("*.prompt"), *cache_dir.glob("*.safetensors")]:
             try:
                 cache_file.unlink()
                 deleted_count += 1
@@ -0,0 +1,90 @@
+"""
+HuggingFace Hub cache checks shared by the model backends.
+"""
+
+import os
+from pathlib import Path
+from typing import Dict, Tuple
+
+from huggingface_hub import constants as hf_constants
+
+
+# Memoized HF cache checks: repo_id -> ((snapshots mtime, blobs mtime), is_cached)
+_cache_status: Dict[str, Tuple[Tuple[float, float], bool]] = {}
+
+
+def _mtime(path: Path) -> float:
+    """Get a path's mtime, or 0.0 if it doesn't exist."""
+    try:
+        return path.stat().st_mtime
+    except FileNotFoundError:
+        return 0.0
+
+
+def _has_weights(snapshots_dir: Path) -> bool:
+    """
+    Check snapshots/<revision>/ for weight files with os.scandir.
+
+    Looks at each revision directory and, failing that, its immediate
+    subdirectories (e.g. a speech tokenizer folder) - never a full tree walk.
+    """
+    weight_suffixes = (".safetensors", ".bin", ".npz")  # MLX models may use npz
+    with os.scandir(snapshots_dir) as revisions:
+        for revision in revisions:
+            if not revision.is_dir():
+                continue
+            subdirs = []
+            with os.scandir(revision.path) as entries:
+                for entry in entries:
+                    if entry.name.endswith(weight_suffixes):
+                        return True
+                    if entry.is_dir():
+                        subdirs.append(entry.path)
+            for subdir in subdirs:
+                with os.scandir(subdir) as entries:
+                    if any(entry.name.endswith(weight_suffixes) for entry in entries):
+                        return True
+    return False
+
+
+def is_repo_cached(repo_id: str, label: str) -> bool:
+    """
+    Check if a HuggingFace Hub repo is cached locally AND fully downloaded.
+
+    The result is memoized until the repo's snapshots/ or blobs/ directory
+    changes (new snapshot, new or finished .incomplete blob).
+
+    Args:
+        repo_id: HuggingFace Hub repo ID
+        label: Model name used in log messages
+
+    Returns:
+        True if the repo is fully cached, False if missing or incomplete
+    """
+    repo_cache = Path(hf_constants.HF_HUB_CACHE) / ("models--" + repo_id.replace("/", "--"))
+
+    if not repo_cache.exists():
+        return False
+
+    blobs_dir = repo_cache / "blobs"
+    snapshots_dir = repo_cache / "snapshots"
+    key = (_mtime(snapshots_dir), _mtime(blobs_dir))
+
+    cached = _cache_status.get(repo_id)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+
+    is_cached = True
+
+    # Check for .incomplete files - if any exist, download is still in progress
+    if blobs_dir.exists() and any(blobs_dir.glob("*.incomplete")):
+        print(f"[_is_model_cached] Found .incomplete files for {label}, treating as not cached")
+        is_cached = False
+
+    # Check that actual model weight files exist in snapshots
+    elif snapshots_dir.exists() and not _has_weights(snapshots_dir):
+        print(f"[_is_model_cached] No model weights found for {label}, treating as not cached")
+        is_cached = False
+
+    _cache_status[repo_id] = (key, is_cached)
+    return is_cached
@@ -320,6 +320,55 @@ class HFProgressTracker:
                     pass
 
 
+def create_hf_tqdm_class(progress_callback: Callable):
+    """
+    Create a tqdm class for snapshot_download(tqdm_class=...) that reports progress.
+
+    No monkey-patching: huggingface_hub instantiates this class itself. Recent
+    versions aggregate byte progress across all files into bars of this class;
+    older ones only use it for the "Fetching N files" bar, which is reported
+    until a byte-based bar shows up.
+
+    Args:
+        progress_callback: Called as progress_callback(downloaded, total, desc)
+
+    Returns:
+        tqdm subclass
+    """
+    from tqdm.auto import tqdm as base_tqdm
+
+    lock = threading.Lock()
+    state = {"bytes": False, "current": 0, "total": 0}
+
+    class CallbackTqdm(base_tqdm):
+        """tqdm subclass that forwards updates to progress_callback."""
+
+        def update(self, n=1):
+            result = super().update(n)
+
+            total = int(self.total or 0)
+            if total <= 0:
+                return result
+
+            with lock:
+                if self.unit == "B":
+                    state["bytes"] = True
+                elif state["bytes"]:
+                    # Ignore file-count bars once byte progress is available
+                    return result
+
+                # Transfer and write bars share a total; never report backwards
+                current = int(self.n)
+                if total == state["total"]:
+                    current = max(current, state["current"])
+                state["current"], state["total"] = current, total
+
+            progress_callback(current, total, self.desc or "")
+            return result
+
+    return CallbackTqdm
+
+
 def create_hf_progress_callback(model_name: str, progress_manager):
     """Create a progress callback for HuggingFace downloads."""
     def callback(downloaded: int, total: int, filename: str = ""):
@@ -0,0 +1,161 @@
+"""
+Weight-only INT8 quantization utilities.
+"""
+
+from typing import Tuple
+
+import torch
+from torch import nn
+
+
+class Int8Linear(nn.Module):
+    """
+    Linear layer with INT8 weights and per-output-channel absmax scales.
+
+    Computes ``y = (x @ W_int8.T) * scale + bias`` with PyTorch's
+    ``_weight_int8pack_mm`` kernel, which reads the INT8 weights directly
+    instead of converting them to the activation dtype on every call.
+    """
+
+    def __init__(self, weight: torch.Tensor, scale: torch.Tensor, bias: torch.Tensor = None):
+        super().__init__()
+        self.in_features = weight.shape[1]
+        self.out_features = weight.shape[0]
+        self.register_buffer("weight", weight)
+        self.register_buffer("scale", scale)
+        self.register_buffer("bias", bias)
+
+    @classmethod
+    def from_linear(cls, linear: nn.Linear) -> "Int8Linear":
+        """
+        Quantize an nn.Linear layer.
+
+        Args:
+            linear: Layer to quantize
+
+        Returns:
+            Quantized layer
+        """
+        weight = linear.weight.detach()
+        scale = weight.abs().amax(dim=1).float().clamp_min(1e-8) / 127.0
+        weight_int8 = torch.round(weight.float() / scale[:, None]).clamp(-127, 127).to(torch.int8)
+        bias = linear.bias.detach() if linear.bias is not None else None
+        return cls(weight_int8, scale.to(weight.dtype), bias)
+
+    def forward(self, x: torch.Tensor) -> torch.Tensor:
+        y = torch._weight_int8pack_mm(
+            x.reshape(-1, self.in_features), self.weight, self.scale.to(x.dtype)
+        ).reshape(*x.shape[:-1], self.out_features)
+        if self.bias is not None:
+            y = y + self.bias.to(x.dtype)
+        return y
+
+    def extra_repr(self) -> str:
+        return f"in_features={self.in_features}, out_features={self.out_features}, bias={self.bias is not None}"
+
+
+def _int8_kernel_available(device: torch.device, dtype: torch.dtype) -> bool:
+    """Check that _weight_int8pack_mm exists and runs on a device/dtype."""
+    if not hasattr(torch, "_weight_int8pack_mm"):
+        return False
+    try:
+        torch._weight_int8pack_mm(
+            torch.zeros(1, 32, device=device, dtype=dtype),
+            torch.zeros(8, 32, device=device, dtype=torch.int8),
+            torch.ones(8, device=device, dtype=dtype),
+        )
+        return True
+    except (RuntimeError, NotImplementedError):
+        return False
+
+
+def _linear_names(model: nn.Module, skip: Tuple[str, ...]) -> set:
+    """Names of nn.Linear submodules not matching any skip substring."""
+    return {
+        name
+        for name, module in model.named_modules()
+        if isinstance(module, nn.Linear) and not any(s in name for s in skip)
+    }
+
+
+def supports_float8() -> bool:
+    """Check for a GPU with FP8 tensor cores (Ada / Hopper, sm_89+)."""
+    return torch.cuda.is_available() and torch.cuda.get_device_capability() >= (8, 9)
+
+
+def quantize_linear_float8(
+    model: nn.Module,
+    skip: Tuple[str, ...] = ("head", "proj_out"),
+) -> int:
+    """
+    Quantize nn.Linear weights and activations to FP8 (E4M3) in place.
+
+    Requires torchao and an sm_89+ GPU (see supports_float8).
+
+    Args:
+        model: Model to quantize
+        skip: Substrings of module names to leave in full precision
+
+    Returns:
+        Number of layers quantized
+
+    Raises:
+        ImportError: If torchao is not installed
+    """
+    from torchao.quantization import quantize_, float8_dynamic_activation_float8_weight
+
+    names = _linear_names(model, skip)
+    quantize_(
+        model,
+        float8_dynamic_activation_float8_weight(),
+        filter_fn=lambda module, fqn: fqn in names,
+    )
+    return len(names)
+
+
+def quantize_linear_int8(
+    model: nn.Module,
+    skip: Tuple[str, ...] = ("head", "proj_out"),
+) -> int:
+    """
+    Replace nn.Linear layers with INT8 weight-only equivalents in place.
+
+    Uses torchao's int8 weight-only kernels when available, otherwise swaps
+    in Int8Linear if PyTorch's INT8 matmul kernel runs on the model's device.
+    If neither is available the model is left unquantized. Embeddings and
+    norms are left untouched.
+
+    Args:
+        model: Model to quantize
+        skip: Substrings of module names to leave in full precision
+            (output heads are the most sensitive to quantization)
+
+    Returns:
+        Number of layers quantized (0 if no INT8 kernel is available)
+    """
+    names = _linear_names(model, skip)
+
+    try:
+        from torchao.quantization import quantize_, int8_weight_only
+
+        quantize_(model, int8_weight_only(), filter_fn=lambda module, fqn: fqn in names)
+        return len(names)
+    except ImportError:
+        pass
+
+    if not names:
+        return 0
+
+    reference = model.get_submodule(next(iter(names))).weight
+    if not _int8_kernel_available(reference.device, reference.dtype):
+        # Dequantizing per call would be slower than the unquantized model
+        print(f"Warning: No INT8 matmul kernel for {reference.device}/{reference.dtype}; "
+              "install torchao for INT8 quantization. Keeping full precision.")
+        return 0
+
+    for name in names:
+        parent_name, _, child_name = name.rpartition(".")
+        parent = model.get_submodule(parent_name) if parent_name else model
+        setattr(parent, child_name, Int8Linear.from_linear(model.get_submodule(name)))
+
+    return len(names)
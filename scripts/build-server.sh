@@ -17,8 +17,8 @@ if ! python -c "import PyInstaller" 2>/dev/null; then
     pip install pyinstaller
 fi
 
-# Build binary
-python build_binary.py
+# Build binary (single file: the Tauri sidecar ships one executable)
+VOICEBOX_ONEFILE=1 python build_binary.py
 
 # Create binaries directory if it doesn't exist
 mkdir -p ../tauri/src-tauri/binaries